@@ -0,0 +1,18 @@
+"""Python Object JSON Tool benchmarks.
+
+Run the benchmark suite and save the results to a JSON file:
+
+    python -m benchmarks run --output benchmarks/output/results.json
+
+Compare saved results against a baseline and flag regressions:
+
+    python -m benchmarks compare benchmarks/output/baseline.json benchmarks/output/results.json
+
+Attributes:
+    __author__ (str): Python package template author.
+    __email__ (str): Python package template author email.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
@@ -0,0 +1,80 @@
+"""Python Object JSON Tool benchmarks command line interface.
+
+Attributes:
+    __author__ (str): Python package template author.
+    __email__ (str): Python package template author email.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import json
+import sys
+from argparse import ArgumentParser
+from logging import INFO
+from pathlib import Path
+
+from benchmarks.graphs import VALUE_GENERATORS, GraphConfig
+from benchmarks.suite import compare_results, run_benchmarks
+from pyobjson import get_logger
+
+
+def main() -> int:
+    parser = ArgumentParser(prog="python -m benchmarks", description="pyobjson benchmark suite")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run the benchmarks and save the results to a JSON file")
+    run_parser.add_argument("--width", type=int, default=4, help="child nodes per node")
+    run_parser.add_argument("--depth", type=int, default=4, help="levels of nested nodes below the root node")
+    run_parser.add_argument("--collection-size", type=int, default=8, help="elements per collection attribute")
+    run_parser.add_argument(
+        "--type-mix",
+        default=",".join(VALUE_GENERATORS.keys()),
+        help=f"comma-separated attribute value types per node (from: {','.join(VALUE_GENERATORS.keys())})",
+    )
+    run_parser.add_argument("--number", type=int, default=5, help="calls per timing repetition")
+    run_parser.add_argument("--repeat", type=int, default=3, help="timing repetitions (fastest is kept)")
+    run_parser.add_argument("--cases", default=None, help="comma-separated benchmark cases to run (default: all)")
+    run_parser.add_argument(
+        "--output", type=Path, default=Path("benchmarks/output/results.json"), help="results JSON file path"
+    )
+
+    compare_parser = subparsers.add_parser("compare", help="compare results against a baseline and flag regressions")
+    compare_parser.add_argument("baseline", type=Path, help="baseline results JSON file path")
+    compare_parser.add_argument("current", type=Path, help="current results JSON file path")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.1, help="relative increase flagged as a regression (default: 0.1)"
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        get_logger("benchmarks.suite", INFO)
+        results = run_benchmarks(
+            GraphConfig(args.width, args.depth, args.collection_size, [t for t in args.type_mix.split(",") if t]),
+            number=args.number,
+            repeat=args.repeat,
+            case_names=args.cases.split(",") if args.cases else None,
+        )
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Saved benchmark results to {args.output}")
+        return 0
+
+    comparisons = compare_results(
+        json.loads(args.baseline.read_text(encoding="utf-8")),
+        json.loads(args.current.read_text(encoding="utf-8")),
+        args.threshold,
+    )
+    for comparison in comparisons:
+        print(
+            f"{'REGRESSION' if comparison['regression'] else 'ok':<10} {comparison['case']:<20} "
+            f"{comparison['metric']:<18} {comparison['baseline']:>14.6g} -> {comparison['current']:>14.6g} "
+            f"({comparison['change']:+.1%})"
+        )
+    return 1 if any(comparison["regression"] for comparison in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
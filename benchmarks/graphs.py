@@ -0,0 +1,124 @@
+"""Python Object JSON Tool benchmarks.graphs module.
+
+Attributes:
+    __author__ (str): Python package template author.
+    __email__ (str): Python package template author email.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from pyobjson.base import PythonObjectJson
+
+# generators of attribute values for each supported value type in a benchmark graph type mix
+VALUE_GENERATORS: Dict[str, Callable[[int, int], Any]] = {
+    "str": lambda node_id, size: f"benchmark_node_{node_id}_value",
+    "int": lambda node_id, size: node_id,
+    "float": lambda node_id, size: node_id / 7,
+    "bool": lambda node_id, size: node_id % 2 == 0,
+    "datetime": lambda node_id, size: datetime(2024, 1, 1) + timedelta(seconds=node_id),
+    "path": lambda node_id, size: Path("benchmarks") / f"node_{node_id}.json",
+    "bytes": lambda node_id, size: bytes(range(256)) * max(1, size // 256),
+    "list": lambda node_id, size: [node_id + i for i in range(size)],
+    "set": lambda node_id, size: {f"element_{node_id}_{i}" for i in range(size)},
+    "tuple": lambda node_id, size: tuple(node_id / (i + 1) for i in range(size)),
+    "dict": lambda node_id, size: {f"key_{i}": i for i in range(size)},
+}
+
+
+@dataclass
+class GraphConfig(object):
+    """Configuration of a synthetic PythonObjectJson object graph.
+
+    Attributes:
+        width (int): Number of child nodes of every non-leaf node.
+        depth (int): Number of levels of nested nodes below the root node.
+        collection_size (int): Number of elements in every collection attribute value.
+        type_mix (list[str]): Value types of the attributes of every node (keys of VALUE_GENERATORS).
+
+    """
+
+    width: int = 4
+    depth: int = 4
+    collection_size: int = 8
+    type_mix: List[str] = field(default_factory=lambda: list(VALUE_GENERATORS.keys()))
+
+    def __post_init__(self):
+        if invalid_types := set(self.type_mix).difference(VALUE_GENERATORS.keys()):
+            raise ValueError(f"Invalid benchmark graph value types: {sorted(invalid_types)}")
+
+    @property
+    def node_count(self) -> int:
+        """int: Total number of nodes in the graph, including the root node."""
+        return sum(self.width**level for level in range(self.depth + 1))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Create a dictionary of the graph configuration for benchmark result metadata.
+
+        Returns:
+            dict[str, Any]: Dictionary of the graph configuration.
+
+        """
+        return {**asdict(self), "node_count": self.node_count}
+
+
+class BenchmarkNode(PythonObjectJson):
+    """Node of a synthetic PythonObjectJson object graph."""
+
+    def __init__(self, node_id: int):
+        super().__init__()
+        self.node_id: int = node_id
+        self.children: List[BenchmarkNode] = []
+
+
+def populate_node(node: PythonObjectJson, node_id: int, config: GraphConfig) -> None:
+    """Set the type mix attribute values of a benchmark graph node.
+
+    Args:
+        node (PythonObjectJson): The benchmark graph node to populate.
+        node_id (int): The ID of the benchmark graph node used to vary attribute values.
+        config (GraphConfig): The benchmark graph configuration.
+
+    Returns:
+        None
+
+    """
+    for value_type in config.type_mix:
+        setattr(node, f"{value_type}_value", VALUE_GENERATORS[value_type](node_id, config.collection_size))
+
+
+def build_graph(config: GraphConfig, root: Optional[PythonObjectJson] = None) -> PythonObjectJson:
+    """Build a synthetic PythonObjectJson object graph.
+
+    Args:
+        config (GraphConfig): The benchmark graph configuration.
+        root (Optional[PythonObjectJson], optional): Root node onto which to build the graph. Must have a children list
+            attribute. Defaults to None, which will result in a BenchmarkNode root node.
+
+    Returns:
+        PythonObjectJson: Root node of the benchmark graph.
+
+    """
+    root = root or BenchmarkNode(0)
+    populate_node(root, 0, config)
+
+    node_id = 1
+    level = [root]
+    for _ in range(config.depth):
+        next_level = []
+        for parent in level:
+            for _ in range(config.width):
+                child = BenchmarkNode(node_id)
+                populate_node(child, node_id, config)
+                parent.children.append(child)
+                next_level.append(child)
+                node_id += 1
+        level = next_level
+
+    return root
@@ -0,0 +1,64 @@
+"""Python Object JSON Tool benchmarks.mongo_stand_in module.
+
+Attributes:
+    __author__ (str): Python package template author.
+    __email__ (str): Python package template author email.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+from typing import Any, Dict, List, Optional
+
+from bson import decode, encode
+from bson.objectid import ObjectId
+from pymongo.collection import Collection
+
+from benchmarks.graphs import BenchmarkNode
+from pyobjson.dao.mongo.base import PythonObjectJsonToMongo
+
+
+class InMemoryMongoCollection(object):
+    """Local stand-in for a pymongo Collection that keeps BSON-encoded documents in memory, so the MongoDB DAO can be
+    benchmarked (including BSON encoding and decoding) without a running MongoDB server.
+    """
+
+    def __init__(self):
+        self.documents: Dict[ObjectId, bytes] = {}
+
+    def find_one_and_update(self, filter: Dict[str, Any], update: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        document_id = filter["_id"]
+        document = decode(self.documents[document_id]) if document_id in self.documents else {"_id": document_id}
+        document.update(update["$set"])
+        self.documents[document_id] = encode(document)
+        return {"_id": document_id}
+
+    def find_one(self, filter: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        document = self.documents.get(filter["_id"])
+        return decode(document) if document else None
+
+
+# stand-in collection shared by all benchmark MongoDB nodes
+in_memory_mongo_collection = InMemoryMongoCollection()
+
+
+class BenchmarkMongoNode(PythonObjectJsonToMongo):
+    """Root node of a synthetic PythonObjectJson object graph saved to and loaded from a MongoDB stand-in."""
+
+    def __init__(
+        self,
+        node_id: int,
+        mongo_host: str = "localhost",
+        mongo_port: int = 27017,
+        mongo_database: str = "pyobjson",
+        mongo_user: str = "pyobjson",
+        mongo_password: str = "pyobjson",  # nosec B107
+    ):
+        super().__init__(mongo_host, mongo_port, mongo_database, mongo_user, mongo_password)
+        self.node_id: int = node_id
+        self.children: List[BenchmarkNode] = []
+
+    def _validate_or_create_collection(self, mongo_collection: str) -> Collection:
+        # noinspection PyTypeChecker
+        return in_memory_mongo_collection
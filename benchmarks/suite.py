@@ -0,0 +1,163 @@
+"""Python Object JSON Tool benchmarks.suite module.
+
+Attributes:
+    __author__ (str): Python package template author.
+    __email__ (str): Python package template author email.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from datetime import datetime, timezone
+from logging import getLogger
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.graphs import BenchmarkNode, GraphConfig, build_graph
+
+logger = getLogger(__name__)
+
+# metrics of each benchmark case that are compared against a baseline (lower values are better for all metrics)
+COMPARED_METRICS = ("seconds", "peak_memory_bytes")
+
+
+def measure(benchmark_case: Callable[[], Any], number: int, repeat: int) -> Dict[str, float]:
+    """Measure the best time per call and the peak traced memory allocation of a benchmark case.
+
+    Args:
+        benchmark_case (Callable[[], Any]): The benchmark case to measure.
+        number (int): Number of calls per timing repetition.
+        repeat (int): Number of timing repetitions (the fastest repetition is used).
+
+    Returns:
+        dict[str, float]: Dictionary with the best seconds per call and the peak memory allocated during one call.
+
+    """
+    seconds = min(timeit.Timer(benchmark_case).repeat(repeat=repeat, number=number)) / number
+
+    tracemalloc.start()
+    try:
+        benchmark_case()
+        _, peak_memory_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": seconds, "peak_memory_bytes": peak_memory_bytes}
+
+
+def run_benchmarks(
+    config: GraphConfig, number: int = 5, repeat: int = 3, case_names: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Run the benchmark cases against a synthetic PythonObjectJson object graph.
+
+    Args:
+        config (GraphConfig): The benchmark graph configuration.
+        number (int, optional): Number of calls per timing repetition. Defaults to 5.
+        repeat (int, optional): Number of timing repetitions. Defaults to 3.
+        case_names (Optional[list[str]], optional): Names of the benchmark cases to run. Defaults to None, which runs
+            all benchmark cases.
+
+    Returns:
+        dict[str, Any]: Dictionary with benchmark metadata and the measured results of each benchmark case.
+
+    """
+    root = build_graph(config)
+    serialized = root.serialize()
+    json_str = root.to_json_str()
+
+    with TemporaryDirectory() as temp_dir:
+        json_file_path = Path(temp_dir) / "benchmark.json"
+        root.save_to_json_file(json_file_path)
+
+        benchmark_cases: Dict[str, Callable[[], Any]] = {
+            "serialize": root.serialize,
+            "deserialize": lambda: BenchmarkNode(0).deserialize(serialized),
+            "to_json_str": root.to_json_str,
+            "from_json_str": lambda: BenchmarkNode(0).from_json_str(json_str),
+            # always write, since unchanged saves are skipped by default
+            "save_to_json_file": lambda: root.save_to_json_file(json_file_path, skip_unchanged=False),
+            "load_from_json_file": lambda: BenchmarkNode(0).load_from_json_file(json_file_path),
+        }
+
+        try:
+            from benchmarks.mongo_stand_in import BenchmarkMongoNode
+        except ImportError:
+            logger.warning("Skipping MongoDB DAO benchmarks because pymongo is not installed.")
+        else:
+            mongo_root = build_graph(config, BenchmarkMongoNode(0))
+            mongo_document_id = mongo_root.save_to_mongo("benchmarks")
+            benchmark_cases["save_to_mongo"] = lambda: mongo_root.save_to_mongo(
+                "benchmarks", mongo_document_id, skip_unchanged=False
+            )
+            benchmark_cases["load_from_mongo"] = lambda: BenchmarkMongoNode(0).load_from_mongo(
+                "benchmarks", mongo_document_id
+            )
+
+        if case_names:
+            if invalid_case_names := set(case_names).difference(benchmark_cases.keys()):
+                raise ValueError(f"Invalid benchmark cases: {sorted(invalid_case_names)}")
+            benchmark_cases = {name: case for name, case in benchmark_cases.items() if name in case_names}
+
+        results = {}
+        for name, benchmark_case in benchmark_cases.items():
+            result = measure(benchmark_case, number, repeat)
+            result["objects_per_second"] = config.node_count / result["seconds"]
+            results[name] = result
+            logger.info(f"{name}: {result['seconds'] * 1000:.3f} ms ({result['objects_per_second']:,.0f} objects/s)")
+
+    return {
+        "metadata": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python_version": sys.version.split()[0],
+            "python_implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "number": number,
+            "repeat": repeat,
+            "graph": config.to_dict(),
+            "serialized_json_bytes": len(json.dumps(serialized, ensure_ascii=False).encode("utf-8")),
+        },
+        "results": results,
+    }
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.1) -> List[Dict[str, Any]]:
+    """Compare benchmark results against baseline benchmark results.
+
+    Args:
+        baseline (dict[str, Any]): Baseline benchmark results created by run_benchmarks.
+        current (dict[str, Any]): Current benchmark results created by run_benchmarks.
+        threshold (float, optional): Relative increase of a metric over its baseline value above which the metric is
+            flagged as a regression. Defaults to 0.1 (10%).
+
+    Returns:
+        list[dict[str, Any]]: Comparison rows with the case, metric, baseline value, current value, relative change,
+            and regression flag of every metric present in both results.
+
+    """
+    comparisons = []
+    for name, current_result in current["results"].items():
+        if not (baseline_result := baseline["results"].get(name)):
+            continue
+        for metric in COMPARED_METRICS:
+            baseline_value, current_value = baseline_result.get(metric), current_result.get(metric)
+            if not baseline_value or current_value is None:
+                continue
+            change = (current_value - baseline_value) / baseline_value
+            comparisons.append(
+                {
+                    "case": name,
+                    "metric": metric,
+                    "baseline": baseline_value,
+                    "current": current_value,
+                    "change": change,
+                    "regression": change > threshold,
+                }
+            )
+    return comparisons
@@ -9,42 +9,79 @@ Attributes:
 __author__ = "Wren J. Rudolph for Wrencode, LLC"
 __email__ = "dev@wrencode.com"
 
+# public names mapped to the modules that define them, which are only imported on first access (via __getattr__) to
+# keep "import pyobjson" fast for short-lived processes (builtin generics are used for annotations in this module to
+# avoid importing typing)
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "PythonObjectJson": "pyobjson.base",
+    "ReadThroughCache": "pyobjson.cache",
+    "DELIMITER": "pyobjson.constants",
+    "UNSERIALIZABLE": "pyobjson.constants",
+    "derive_fingerprint": "pyobjson.data",
+    "deserialize": "pyobjson.data",
+    "extract_typed_key_value_pairs": "pyobjson.data",
+    "find_shared_references": "pyobjson.data",
+    "serialize": "pyobjson.data",
+    "unpack_custom_class_vars": "pyobjson.data",
+    "add_phase_hook": "pyobjson.instrumentation",
+    "disable_instrumentation": "pyobjson.instrumentation",
+    "enable_instrumentation": "pyobjson.instrumentation",
+    "instrumented": "pyobjson.instrumentation",
+    "log_stats": "pyobjson.instrumentation",
+    "remove_phase_hook": "pyobjson.instrumentation",
+    "reset_stats": "pyobjson.instrumentation",
+    "stats": "pyobjson.instrumentation",
+    "dump_with_offset_index": "pyobjson.offsets",
+    "warmup": "pyobjson.prefork",
+    "compile_projection": "pyobjson.projection",
+    "compile_class_schema": "pyobjson.schema",
+    "discard_shared_memory": "pyobjson.shared_memory",
+    "release_shared_memory": "pyobjson.shared_memory",
+    "load_snapshot": "pyobjson.snapshot",
+    "save_snapshot": "pyobjson.snapshot",
+    "clear_callable_caches": "pyobjson.utils",
+    "derive_custom_callable_value": "pyobjson.utils",
+    "derive_custom_object_key": "pyobjson.utils",
+    "get_logger": "pyobjson.utils",
+    "get_nested_subclasses": "pyobjson.utils",
+    "resolve_custom_callable": "pyobjson.utils",
+    "set_allowed_callable_modules": "pyobjson.utils",
+    # optional data access objects (the MongoDB DAO requires pymongo)
+    "AsyncPythonObjectJsonToMongo": "pyobjson.dao.mongo.asynchronous",
+    "PythonObjectJsonToFileStore": "pyobjson.dao.fs.base",
+    "PythonObjectJsonToJournal": "pyobjson.dao.journal.base",
+    "PythonObjectJsonToMongo": "pyobjson.dao.mongo.base",
+    "PythonObjectJsonToSnapshotStore": "pyobjson.dao.snapshots.base",
+    "PythonObjectJsonToSqlite": "pyobjson.dao.sqlite.base",
+}
 
-from logging import WARNING, Formatter, Logger, StreamHandler, getLogger
+__all__ = list(_LAZY_ATTRIBUTES)
 
-from pyobjson.base import PythonObjectJson  # noqa: F401
-from pyobjson.constants import DELIMITER, UNSERIALIZABLE  # noqa: F401
-from pyobjson.data import deserialize, extract_typed_key_value_pairs, serialize, unpack_custom_class_vars  # noqa: F401
-from pyobjson.utils import derive_custom_callable_value, derive_custom_object_key, get_nested_subclasses  # noqa: F401
 
-
-def get_logger(name: str, level: int = WARNING) -> Logger:
-    """Get customized Logger.
+def __getattr__(name: str) -> object:
+    """Import the module defining a public pyobjson name on first access and cache the name on the package.
 
     Args:
-        name (str): The module name for the logger.
-        level (int): The log level for the logger. Default level set to WARNING.
+        name (str): The name of the attribute being accessed on the pyobjson package.
 
     Returns:
-        Logger: A Python Logger object with custom configuration and formatting.
+        object: The value of the public pyobjson name.
 
     """
-    logger = getLogger(name)
-    if len(logger.handlers) > 0:
-        logger.handlers = []
-    if level:
-        logger.setLevel(level)
+    if (module_name := _LAZY_ATTRIBUTES.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # use the builtin __import__ (which returns the submodule itself when fromlist is given) to avoid importing importlib
+    value = getattr(__import__(module_name, fromlist=[name]), name)
+    globals()[name] = value
+    return value
 
-    sh = StreamHandler()
-    if level:
-        sh.setLevel(level)
 
-    formatter = Formatter(
-        fmt="%(asctime)s.%(msecs)03d - %(levelname)s - %(filename)s - %(name)s:%(lineno)d - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-    sh.setFormatter(formatter)
+def __dir__() -> list[str]:
+    """List the attributes of the pyobjson package including the public names that have not been imported yet.
 
-    logger.addHandler(sh)
+    Returns:
+        list[str]: Sorted list of attribute names.
 
-    return logger
+    """
+    return sorted(set(globals()).union(__all__))
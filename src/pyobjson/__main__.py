@@ -0,0 +1,15 @@
+"""Python Object JSON Tool pyobjson.__main__ module.
+
+Attributes:
+    __author__ (str): Python package template author.
+    __email__ (str): Python package template author email.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+from pyobjson.cli import main
+
+if __name__ == "__main__":
+    raise SystemExit(main())
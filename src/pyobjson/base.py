@@ -9,18 +9,215 @@ Attributes:
 __author__ = "Wren J. Rudolph for Wrencode, LLC"
 __email__ = "dev@wrencode.com"
 
-import json
-from inspect import getfullargspec
-from pathlib import Path
-from re import search
-from typing import Any, Dict, List, Optional, Type
+import threading
+from collections import OrderedDict
+from logging import getLogger
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterable, List, Optional, Tuple, Type, Union
+
+from pyobjson.constants import (
+    BUFFER_SEGMENTS_FILE_SUFFIX,
+    OFFSET_INDEX_FILE_SUFFIX,
+    PYOBJSON_ATTRIBUTES,
+    SAVED_FINGERPRINTS_MAX_SIZE,
+    SNAPSHOT_SHARD_SIZE,
+)
+from pyobjson.data import clone, derive_fingerprint, deserialize, has_out_of_band_buffer_references, serialize
+from pyobjson.instrumentation import is_instrumentation_enabled, phase
+from pyobjson.utils import (
+    compile_regex,
+    derive_custom_object_key,
+    get_instance_attributes,
+    get_nested_subclasses,
+    set_instance_attributes,
+    validate_regex,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pyobjson.cache import ReadThroughCache
+
+logger = getLogger(__name__)
+
+
+class _SavedFingerprints(object):
+    """Thread-safe bounded mapping of the fingerprints (and related state) of saved data by save destination that
+    evicts the least recently used entries beyond SAVED_FINGERPRINTS_MAX_SIZE, so saves skipping unchanged data never
+    grow it without bound.
+    """
+
+    def __init__(self):
+        self.entries: "OrderedDict[Hashable, Tuple[Any, ...]]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Tuple[Any, ...]]:
+        """Retrieve the fingerprint entry of a save destination and mark it as recently used.
+
+        Args:
+            key (Hashable): The save destination (e.g. a resolved file path or a MongoDB document key).
+
+        Returns:
+            Optional[tuple[Any, ...]]: The fingerprint entry, or None if there is none.
+
+        """
+        with self.lock:
+            if (entry := self.entries.get(key)) is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Hashable, entry: Tuple[Any, ...]) -> None:
+        """Record the fingerprint entry of a save destination and evict the least recently used entries over the limit.
+
+        Args:
+            key (Hashable): The save destination (e.g. a resolved file path or a MongoDB document key).
+            entry (tuple[Any, ...]): The fingerprint entry.
+
+        Returns:
+            None
+
+        """
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > SAVED_FINGERPRINTS_MAX_SIZE:
+                self.entries.popitem(last=False)
 
-from pyobjson.data import deserialize, serialize
-from pyobjson.utils import derive_custom_object_key, get_nested_subclasses, validate_regex
+    def pop(self, key: Hashable) -> None:
+        """Forget the fingerprint entry of a save destination.
+
+        Args:
+            key (Hashable): The save destination (e.g. a resolved file path or a MongoDB document key).
+
+        Returns:
+            None
+
+        """
+        with self.lock:
+            self.entries.pop(key, None)
+
+
+# dictionaries with lowercase class keys of all nested subclasses as keys and subclasses as values by base class
+_base_subclasses_by_class: Dict[Type, Dict[str, Type]] = {}
+
+# fingerprints, offset index settings, and file states of the JSON files written by save_to_json_file by resolved path
+_saved_json_files = _SavedFingerprints()
+
+# permissions of new files created by save_to_json_file (derived from the umask on first use)
+_new_file_mode: Optional[int] = None
+
+
+def get_base_subclasses(base_class: Type) -> Dict[str, Type]:
+    """Function to retrieve all nested subclasses of a base class by their class keys, which are only derived once until
+    another subclass is defined.
+
+    Args:
+        base_class (Type): Base class from which to retrieve all nested subclasses.
+
+    Returns:
+        dict[str, Type]: Dictionary with lowercase strings of all nested subclasses of the base class as keys and
+            subclasses as values (shared between calls, so it must not be modified).
+
+    """
+    if (base_subclasses := _base_subclasses_by_class.get(base_class)) is None:
+        base_subclasses = _base_subclasses_by_class[base_class] = {
+            derive_custom_object_key(cls): cls for cls in get_nested_subclasses(base_class)
+        }
+    return base_subclasses
+
+
+def _derive_json_file_state(json_file_path: "Path") -> Tuple[Optional[int], ...]:
+    """Function to derive the modification times and sizes of a JSON file and its side files.
+
+    Args:
+        json_file_path (Path): JSON file path.
+
+    Returns:
+        tuple[Optional[int], ...]: Modification times in nanoseconds and sizes in bytes of the JSON file, its buffer
+            segments side file, and its offset index side file (None for files that do not exist).
+
+    """
+    file_state: Tuple[Optional[int], ...] = ()
+    for file_path in (
+        json_file_path,
+        json_file_path.with_name(json_file_path.name + BUFFER_SEGMENTS_FILE_SUFFIX),
+        json_file_path.with_name(json_file_path.name + OFFSET_INDEX_FILE_SUFFIX),
+    ):
+        if file_path.exists():
+            file_stat = file_path.stat()
+            file_state += (file_stat.st_mtime_ns, file_stat.st_size)
+        else:
+            file_state += (None, None)
+    return file_state
+
+
+def _derive_new_file_mode() -> int:
+    """Function to derive the permissions of new files created with open (0o666 without the bits of the umask).
+
+    Returns:
+        int: File permissions.
+
+    """
+    global _new_file_mode
+    if _new_file_mode is None:
+        import os
+
+        # the umask can only be read by setting it, so it is read once and restored immediately
+        umask = os.umask(0)
+        os.umask(umask)
+        _new_file_mode = 0o666 & ~umask
+    return _new_file_mode
+
+
+def _open_temp_file(file_path: "Path", temp_file_paths: Dict["Path", str], text: bool = False, buffering: int = -1):
+    """Function to open a new temporary file in the directory of a file to be moved into its place with os.replace
+    once it is complete, with the permissions of the file (or of a new file if it does not exist). The file is synced
+    to disk when it is closed.
+
+    Args:
+        file_path (Path): Path of the file to be replaced by the temporary file.
+        temp_file_paths (dict[Path, str]): Dictionary to which the file path and the temporary file path are added.
+        text (bool, optional): Whether to open the temporary file in UTF-8 text mode instead of binary mode. Defaults
+            to False.
+        buffering (int, optional): Buffering policy of the temporary file (as for open). Defaults to -1.
+
+    Returns:
+        Union[BinaryIO, TextIO]: Context manager of the open temporary file.
+
+    """
+    import os
+    from contextlib import contextmanager
+    from tempfile import mkstemp
+
+    temp_file_descriptor, temp_file_path = mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+    temp_file_paths[file_path] = temp_file_path
+    os.chmod(temp_file_path, file_path.stat().st_mode & 0o7777 if file_path.exists() else _derive_new_file_mode())
+
+    @contextmanager
+    def synced_temp_file():
+        with os.fdopen(
+            temp_file_descriptor, "w" if text else "wb", buffering=buffering, encoding="utf-8" if text else None
+        ) as temp_file_out:
+            yield temp_file_out
+            temp_file_out.flush()
+            os.fsync(temp_file_out.fileno())
+
+    return synced_temp_file()
 
 
 class PythonObjectJson(object):
-    """Base Python Object with JSON serialization and deserialization compatibility."""
+    """Base Python Object with JSON serialization and deserialization compatibility.
+
+    The pyobjson attributes are stored in __slots__, so subclasses that also declare __slots__ (for all of their own
+    attributes) are created without a per-instance __dict__. Subclasses without __slots__ work as usual.
+
+    """
+
+    __slots__ = (
+        "excluded_attributes",
+        "class_keys_for_excluded_attributes",
+        "extra_attributes",
+        "class_keys_for_extra_attributes",
+    )
 
     def __init__(
         self,
@@ -51,41 +248,48 @@ class PythonObjectJson(object):
         """
         # always exclude pyobjson attributes during serialization and include them as extra attributes during
         # deserialization
-        pyobjson_attributes = [
-            "excluded_attributes",
-            "class_keys_for_excluded_attributes",
-            "extra_attributes",
-            "class_keys_for_extra_attributes",
-        ]
-        self.excluded_attributes = pyobjson_attributes
+        # use separate copies so the excluded and extra attributes (and the provided argument lists) never share state
+        self.excluded_attributes = list(PYOBJSON_ATTRIBUTES)
         if excluded_attributes:
             # check if all excluded attributes are valid regex
             validate_regex(excluded_attributes)
             self.excluded_attributes.extend(excluded_attributes)
-        self.class_keys_for_excluded_attributes = class_keys_for_excluded_attributes or []
-        self.extra_attributes = pyobjson_attributes
+        self.class_keys_for_excluded_attributes = list(class_keys_for_excluded_attributes or [])
+        self.extra_attributes = list(PYOBJSON_ATTRIBUTES)
         if extra_attributes:
             # check if all extra attributes are valid regex
             validate_regex(extra_attributes)
             self.extra_attributes.extend(extra_attributes)
+            # extra attributes are re-applied from the target instance during deserialization, so keep excluding them
+            # from serialization
+            self.excluded_attributes.extend(extra_attributes)
         else:
-            self.extra_attributes.extend(set(self.excluded_attributes).difference(pyobjson_attributes))
-        self.class_keys_for_extra_attributes = (
+            self.extra_attributes.extend(set(self.excluded_attributes).difference(PYOBJSON_ATTRIBUTES))
+        self.class_keys_for_extra_attributes = list(
             class_keys_for_extra_attributes or self.class_keys_for_excluded_attributes
         )
-        vars(self).update(kwargs)
+        if kwargs:
+            set_instance_attributes(self, kwargs)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # rebuild the cached subclass dictionaries to include the new subclass
+        _base_subclasses_by_class.clear()
 
     def __str__(self):
         return self.to_json_str()
 
     def __repr__(self):
+        from inspect import getfullargspec
+
+        init_args = getfullargspec(self.__init__).args
         return (
             f"{derive_custom_object_key(self.__class__, as_lower=False)}"
-            f"({','.join([f'{k}={v}' for k, v in vars(self).items() if k in getfullargspec(self.__init__).args])})"
+            f"({','.join([f'{k}={v}' for k, v in get_instance_attributes(self).items() if k in init_args])})"
         )
 
     def __eq__(self, other):
-        return type(self) is type(other) and vars(self) == vars(other)
+        return type(self) is type(other) and get_instance_attributes(self) == get_instance_attributes(other)
 
     def _base_subclasses(self) -> Dict[str, Type]:
         """Create a dictionary with lowercase keys derived from custom class names in camelcase mapped to their
@@ -93,15 +297,48 @@ class PythonObjectJson(object):
 
         Returns:
             dict[str, Type]: Dictionary with lowercase strings of all subclasses of PythonObjectJson as keys and
-            subclasses as values.
+            subclasses as values (shared between calls, so it must not be modified).
 
         """
         # retrieve all class subclasses (and their nested subclasses) after base class
-        return {derive_custom_object_key(cls): cls for cls in get_nested_subclasses(self.__class__.__mro__[-2])}
+        return get_base_subclasses(self.__class__.__mro__[-2])
 
-    def serialize(self) -> Dict[str, Any]:
+    def serialize(
+        self,
+        track_references: bool = False,
+        columnar: bool = False,
+        pack_numeric_columns: bool = False,
+        schema: bool = False,
+        out_of_band_buffers: Optional[List[Tuple[int, memoryview]]] = None,
+        only: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        max_depth: Optional[int] = None,
+    ) -> Dict[str, Any]:
         """Create a serializable dictionary from the class instance.
 
+        Args:
+            track_references (bool, optional): Whether to serialize objects referenced more than once (including
+                through cycles) only once and to serialize all other references to them as compact "$ref" IDs.
+                Defaults to False.
+            columnar (bool, optional): Whether to serialize lists of two or more instances of the same custom class
+                as parallel per-attribute columns stored once with their class key. Defaults to False.
+            pack_numeric_columns (bool, optional): Whether to pack columns of all integers or all floats into
+                base64-encoded arrays when columnar is True. Defaults to False.
+            schema (bool, optional): Whether to serialize in schema mode, in which attribute types are derived from
+                the __init__ type annotations of each custom class instead of being included in attribute keys.
+                Defaults to False.
+            out_of_band_buffers (Optional[list[tuple[int, memoryview]]], optional): List to which to append the
+                offsets and raw bytes of buffer-protocol values (memoryview, array.array, or NumPy array) to be
+                written out-of-band instead of base64-encoding them. Defaults to None.
+            only (Optional[Iterable[str]], optional): Dotted attribute paths across nested custom class instances (e.g.
+                "attribute" or "attribute.nested_attribute") of the only attributes to serialize. Attributes that are
+                not selected are never visited. Defaults to None.
+            exclude (Optional[Iterable[str]], optional): Dotted attribute paths across nested custom class instances of
+                attributes to exclude from serialization in addition to the excluded attributes of the class instance.
+                Defaults to None.
+            max_depth (Optional[int], optional): Maximum nesting depth of serialized custom class instances, below
+                which custom class instances are serialized as None. Defaults to None.
+
         Returns:
             dict[str, Any]: Serializable dictionary representing the class instance.
 
@@ -111,47 +348,192 @@ class PythonObjectJson(object):
             list(self._base_subclasses().values()),
             self.excluded_attributes,
             self.class_keys_for_excluded_attributes,
+            track_references=track_references,
+            columnar=columnar,
+            pack_numeric_columns=pack_numeric_columns,
+            schema=schema,
+            out_of_band_buffers=out_of_band_buffers,
+            only=only,
+            exclude=exclude,
+            max_depth=max_depth,
         )
 
-    def deserialize(self, serializable_dict: Dict[str, Any]) -> Any:
-        """Load data to a class instance from a serializable dictionary.
-
-        Args:
-            serializable_dict (dict[str, Any]): Serializable dictionary representing the class instance.
+    def _derive_extra_attributes(self) -> Dict[str, Any]:
+        """Create a dictionary of the attributes defined in the class instance that match the extra attributes to be
+        provided as additional Python class instantiation arguments during deserialization.
 
         Returns:
-            Any: Class instance deserialized from data dictionary.
+            dict[str, Any]: Dictionary with extra attribute names as keys and class instance values as values.
 
         """
         extra_attributes = {}
+        instance_atts = get_instance_attributes(self)
         for att in self.extra_attributes:
-            instance_atts = vars(self)
             # include extra attribute if it is defined in instance onto which data is being deserialized
             if att in instance_atts.keys():
-                extra_attributes[att] = vars(self).get(att)
+                extra_attributes[att] = instance_atts.get(att)
             else:
                 for inst_att in instance_atts.keys():
                     # include all attributes defined in instance onto which data is being deserialized that match the
                     # extra attribute regex
-                    if search(rf"{att}", inst_att):
-                        extra_attributes[inst_att] = vars(self).get(inst_att)
+                    if compile_regex(att).search(inst_att):
+                        extra_attributes[inst_att] = instance_atts.get(inst_att)
+
+        return extra_attributes
+
+    def deserialize(self, serializable_dict: Dict[str, Any], out_of_band_buffer: Optional[memoryview] = None) -> Any:
+        """Load data to a class instance from a serializable dictionary.
 
+        Args:
+            serializable_dict (dict[str, Any]): Serializable dictionary representing the class instance.
+            out_of_band_buffer (Optional[memoryview], optional): Memory (e.g. a memory-mapped file) containing the
+                out-of-band segments of buffer-protocol values. Defaults to None.
+
+        Returns:
+            Any: Class instance deserialized from data dictionary.
+
+        """
         return deserialize(
             serializable_dict,
             self._base_subclasses(),
             base_class_instance=self,
-            extra_attributes=extra_attributes,
+            extra_attributes=self._derive_extra_attributes(),
+            class_keys_for_extra_attributes=self.class_keys_for_extra_attributes,
+            out_of_band_buffer=out_of_band_buffer,
+        )
+
+    def _deserialize_new_instance(self, serializable_dict: Dict[str, Any]) -> Any:
+        """Create a new class instance from a serializable dictionary using the extra attributes of the current class
+        instance.
+
+        Args:
+            serializable_dict (dict[str, Any]): Serializable dictionary representing a class instance.
+
+        Returns:
+            Any: New class instance deserialized from data dictionary.
+
+        """
+        return deserialize(
+            serializable_dict,
+            self._base_subclasses(),
+            extra_attributes=self._derive_extra_attributes(),
             class_keys_for_extra_attributes=self.class_keys_for_extra_attributes,
         )
 
-    def to_json_str(self) -> str:
+    def deserialize_many(
+        self, serializable_dicts: Iterable[Dict[str, Any]], max_workers: Optional[int] = None
+    ) -> List[Any]:
+        """Create new class instances from multiple serializable dictionaries using a thread pool and the extra
+        attributes of the current class instance. Serializable dictionaries are never modified during deserialization,
+        so the same (e.g. cached) parsed dictionaries can be shared by multiple threads.
+
+        Args:
+            serializable_dicts (Iterable[dict[str, Any]]): Serializable dictionaries representing class instances.
+            max_workers (Optional[int], optional): Maximum number of threads used to deserialize the dictionaries.
+                Defaults to None, which uses the ThreadPoolExecutor default.
+
+        Returns:
+            list[Any]: New class instances deserialized from the data dictionaries, in the order of the dictionaries.
+
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        # derive the custom subclasses and extra attributes once for all dictionaries
+        base_subclasses = self._base_subclasses()
+        extra_attributes = self._derive_extra_attributes()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda serializable_dict: deserialize(
+                        serializable_dict,
+                        base_subclasses,
+                        extra_attributes=extra_attributes,
+                        class_keys_for_extra_attributes=self.class_keys_for_extra_attributes,
+                    ),
+                    serializable_dicts,
+                )
+            )
+
+    def clone(self) -> Any:
+        """Create a deep copy of the class instance in a single pass without serializing it, in which attributes
+        excluded from serialization and immutable values are shared with the class instance instead of being copied.
+
+        Returns:
+            Any: Clone of the class instance.
+
+        """
+        return clone(
+            self,
+            list(self._base_subclasses().values()),
+            self.excluded_attributes,
+            self.class_keys_for_excluded_attributes,
+        )
+
+    def fingerprint(self) -> str:
+        """Derive a stable fingerprint of the serialized class instance from its canonical JSON (with sorted keys and
+        sorted set items), which only changes when the serialized data changes.
+
+        Returns:
+            str: Hexadecimal fingerprint of 32 characters.
+
+        """
+        return derive_fingerprint(self.serialize())
+
+    def to_json_str(
+        self,
+        track_references: bool = False,
+        columnar: bool = False,
+        pack_numeric_columns: bool = False,
+        schema: bool = False,
+        only: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        max_depth: Optional[int] = None,
+    ) -> str:
         """Serialize the class instance to a JSON string.
 
+        Args:
+            track_references (bool, optional): Whether to serialize objects referenced more than once (including
+                through cycles) only once and to serialize all other references to them as compact "$ref" IDs.
+                Defaults to False.
+            columnar (bool, optional): Whether to serialize lists of two or more instances of the same custom class
+                as parallel per-attribute columns stored once with their class key. Defaults to False.
+            pack_numeric_columns (bool, optional): Whether to pack columns of all integers or all floats into
+                base64-encoded arrays when columnar is True. Defaults to False.
+            schema (bool, optional): Whether to serialize in schema mode, in which attribute types are derived from
+                the __init__ type annotations of each custom class instead of being included in attribute keys.
+                Defaults to False.
+            only (Optional[Iterable[str]], optional): Dotted attribute paths across nested custom class instances (e.g.
+                "attribute" or "attribute.nested_attribute") of the only attributes to serialize. Attributes that are
+                not selected are never visited. Defaults to None.
+            exclude (Optional[Iterable[str]], optional): Dotted attribute paths across nested custom class instances of
+                attributes to exclude from serialization in addition to the excluded attributes of the class instance.
+                Defaults to None.
+            max_depth (Optional[int], optional): Maximum nesting depth of serialized custom class instances, below
+                which custom class instances are serialized as None. Defaults to None.
+
         Returns:
             str: JSON string derived from the serializable version of the class instance.
 
         """
-        return json.dumps(self.serialize(), ensure_ascii=False, indent=2)
+        import json
+
+        with phase("to_json_str", self) as instrumented_phase:
+            json_str = json.dumps(
+                self.serialize(
+                    track_references=track_references,
+                    columnar=columnar,
+                    pack_numeric_columns=pack_numeric_columns,
+                    schema=schema,
+                    only=only,
+                    exclude=exclude,
+                    max_depth=max_depth,
+                ),
+                ensure_ascii=False,
+                indent=2,
+            )
+            if is_instrumentation_enabled():
+                instrumented_phase.record_bytes("bytes_written", len(json_str.encode("utf-8")))
+            return json_str
 
     def from_json_str(self, json_str: str) -> None:
         """Load a class instance deserialized from a JSON string to the current class instance.
@@ -163,31 +545,153 @@ class PythonObjectJson(object):
             None
 
         """
-        self.deserialize(json.loads(json_str))
+        import json
+
+        with phase("from_json_str", self) as instrumented_phase:
+            if is_instrumentation_enabled():
+                instrumented_phase.record_bytes("bytes_read", len(json_str.encode("utf-8")))
+            self.deserialize(json.loads(json_str))
 
-    def save_to_json_file(self, json_file_path: Path) -> None:
+    def save_to_json_file(
+        self,
+        json_file_path: "Path",
+        track_references: bool = False,
+        columnar: bool = False,
+        pack_numeric_columns: bool = False,
+        schema: bool = False,
+        out_of_band_buffers: bool = False,
+        offset_index: bool = False,
+        skip_unchanged: bool = True,
+    ) -> bool:
         """Save the class instance to a JSON file.
 
         Args:
             json_file_path (Path): Target JSON file path to which the class instance will be saved.
+            track_references (bool, optional): Whether to serialize objects referenced more than once (including
+                through cycles) only once and to serialize all other references to them as compact "$ref" IDs.
+                Defaults to False.
+            columnar (bool, optional): Whether to serialize lists of two or more instances of the same custom class
+                as parallel per-attribute columns stored once with their class key. Defaults to False.
+            pack_numeric_columns (bool, optional): Whether to pack columns of all integers or all floats into
+                base64-encoded arrays when columnar is True. Defaults to False.
+            schema (bool, optional): Whether to serialize in schema mode, in which attribute types are derived from
+                the __init__ type annotations of each custom class instead of being included in attribute keys.
+                Defaults to False.
+            out_of_band_buffers (bool, optional): Whether to write the raw bytes of buffer-protocol values
+                (memoryview, array.array, or NumPy array) to a side file (the JSON file path with the suffix
+                BUFFER_SEGMENTS_FILE_SUFFIX appended) instead of base64-encoding them in the JSON file. Defaults to
+                False.
+            offset_index (bool, optional): Whether to write a side file (the JSON file path with the suffix
+                OFFSET_INDEX_FILE_SUFFIX appended) with the byte offsets of each attribute value and of each item of
+                list and dictionary attribute values in the JSON file for use with load_item. Not supported with
+                track_references or schema. Defaults to False.
+            skip_unchanged (bool, optional): Whether to skip writing the JSON file if the fingerprint of the serialized
+                class instance matches the fingerprint of the data last saved to the same JSON file with the same
+                options and the JSON file and its side files have not changed since. Defaults to True.
 
         Returns:
-            None
+            bool: Whether the JSON file was written.
 
         """
+        if offset_index and (track_references or schema):
+            raise ValueError("Offset indexes are not supported for JSON files saved with track_references or schema.")
+
         if not json_file_path.exists():
             json_file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(json_file_path, "w", encoding="utf-8") as json_file_out:
-            # TODO: fix incorrect file input type warning for json.dump from PyCharm bug https://youtrack.jetbrains.com/issue/PY-73050/openfile.txt-r-return-type-should-be-inferred-as-TextIOWrapper-instead-of-TextIO
-            # noinspection PyTypeChecker
-            json.dump(self.serialize(), json_file_out, ensure_ascii=False, indent=2)
-
-    def load_from_json_file(self, json_file_path: Path) -> None:
-        """Load the class instance from a JSON file.
+        import json
+        import os
+
+        buffer_segments_file_path = json_file_path.with_name(json_file_path.name + BUFFER_SEGMENTS_FILE_SUFFIX)
+        buffer_segments: Optional[List[Tuple[int, memoryview]]] = [] if out_of_band_buffers else None
+        offset_index_file_path = json_file_path.with_name(json_file_path.name + OFFSET_INDEX_FILE_SUFFIX)
+
+        with phase("save_to_json_file", self) as instrumented_phase:
+            serializable_dict = self.serialize(
+                track_references=track_references,
+                columnar=columnar,
+                pack_numeric_columns=pack_numeric_columns,
+                schema=schema,
+                out_of_band_buffers=buffer_segments,
+            )
+
+            saved_json_file_key = fingerprint = None
+            if skip_unchanged:
+                saved_json_file_key = str(json_file_path.resolve())
+                fingerprint = derive_fingerprint(serializable_dict, buffer_segments)
+                if _saved_json_files.get(saved_json_file_key) == (
+                    fingerprint,
+                    offset_index,
+                    _derive_json_file_state(json_file_path),
+                ):
+                    logger.debug(f"Skipped saving unchanged data to JSON file {json_file_path}.")
+                    return False
+
+            # write all files to temporary files moved into place once they are complete, so earlier loaded class
+            # instances that memory-map the replaced side file keep the old file and a failed save changes no files
+            temp_file_paths: Dict["Path", str] = {}
+            try:
+                if buffer_segments:
+                    # write the buffer segments directly from their memory with unbuffered writes to avoid any copies
+                    with _open_temp_file(buffer_segments_file_path, temp_file_paths, buffering=0) as buffer_file_out:
+                        position = 0
+                        for offset, buffer_segment in buffer_segments:
+                            if offset > position:
+                                buffer_file_out.write(bytes(offset - position))
+                            remaining_segment = buffer_segment
+                            while remaining_segment.nbytes:
+                                # unbuffered writes may be partial
+                                remaining_segment = remaining_segment[buffer_file_out.write(remaining_segment) :]
+                            position = offset + buffer_segment.nbytes
+
+                if offset_index:
+                    from pyobjson.offsets import dump_with_offset_index
+
+                    # write the same JSON as json.dump while recording the byte offsets of attribute values and items
+                    with _open_temp_file(json_file_path, temp_file_paths) as json_file_out:
+                        offset_index_dict = dump_with_offset_index(serializable_dict, json_file_out)
+                    with _open_temp_file(offset_index_file_path, temp_file_paths) as offset_index_file_out:
+                        offset_index_file_out.write(json.dumps(offset_index_dict, ensure_ascii=False).encode("utf-8"))
+                else:
+                    with _open_temp_file(json_file_path, temp_file_paths, text=True) as json_file_out:
+                        # TODO: fix incorrect file input type warning for json.dump from PyCharm bug https://youtrack.jetbrains.com/issue/PY-73050/openfile.txt-r-return-type-should-be-inferred-as-TextIOWrapper-instead-of-TextIO
+                        # noinspection PyTypeChecker
+                        json.dump(serializable_dict, json_file_out, ensure_ascii=False, indent=2)
+            except BaseException:
+                for temp_file_path in temp_file_paths.values():
+                    os.unlink(temp_file_path)
+                raise
+
+            # move the side files into place before the JSON file that references them
+            for file_path, temp_file_path in temp_file_paths.items():
+                os.replace(temp_file_path, file_path)
+            for stale_file_path in (buffer_segments_file_path, offset_index_file_path):
+                if stale_file_path not in temp_file_paths and stale_file_path.exists():
+                    # remove the stale side file of a previous save
+                    stale_file_path.unlink()
+
+            if is_instrumentation_enabled():
+                instrumented_phase.record_bytes(
+                    "bytes_written",
+                    json_file_path.stat().st_size
+                    + (buffer_segments_file_path.stat().st_size if buffer_segments else 0),
+                )
+
+        if saved_json_file_key:
+            _saved_json_files.put(
+                saved_json_file_key, (fingerprint, offset_index, _derive_json_file_state(json_file_path))
+            )
+        return True
+
+    def load_from_json_file(self, json_file_path: "Path", cache: Optional["ReadThroughCache"] = None) -> None:
+        """Load the class instance from a JSON file. Buffer-protocol values saved out-of-band are memory-mapped from
+        the side file of the JSON file.
 
         Args:
             json_file_path (Path): Target JSON file path from which the class instance will be loaded.
+            cache (Optional[ReadThroughCache], optional): Read-through cache from which to load the class instance
+                without reading the JSON file if it has not changed (by modification time and size) since it was
+                cached. Defaults to None.
 
         Returns:
             None
@@ -196,8 +700,259 @@ class PythonObjectJson(object):
         if not json_file_path.exists():
             raise FileNotFoundError(f"File {json_file_path} does not exist. Unable to load saved data.")
 
-        with open(json_file_path, "r", encoding="utf-8") as json_file_in:
-            self.deserialize(json.load(json_file_in))
+        if cache is not None:
+            from pyobjson.cache import derive_file_cache_entry
+
+            # derive the validator before reading the files so changes made while reading them invalidate the entry
+            cache_key, cache_validator, cache_size = derive_file_cache_entry(json_file_path)
+            if (cached_instance := cache.get(cache_key, cache_validator)) is not None:
+                cache.load_into(self, cached_instance)
+                return
+
+        import json
+
+        buffer_segments_file_path = json_file_path.with_name(json_file_path.name + BUFFER_SEGMENTS_FILE_SUFFIX)
+        out_of_band_buffer = None
+        if buffer_segments_file_path.exists() and buffer_segments_file_path.stat().st_size:
+            import mmap
+
+            with open(buffer_segments_file_path, "rb") as buffer_segments_file_in:
+                # the memory map stays open (independent of the file) for as long as any loaded buffer references it
+                out_of_band_buffer = memoryview(mmap.mmap(buffer_segments_file_in.fileno(), 0, access=mmap.ACCESS_READ))
+
+        with phase("load_from_json_file", self) as instrumented_phase:
+            if is_instrumentation_enabled():
+                instrumented_phase.record_bytes(
+                    "bytes_read",
+                    json_file_path.stat().st_size + (out_of_band_buffer.nbytes if out_of_band_buffer else 0),
+                )
+            with open(json_file_path, "r", encoding="utf-8") as json_file_in:
+                self.deserialize(json.load(json_file_in), out_of_band_buffer=out_of_band_buffer)
+
+        if cache is not None:
+            cache.put(cache_key, cache_validator, self.clone(), cache_size)
+
+    def load_item(self, json_file_path: "Path", attribute: str, index_or_key: Optional[Union[int, str]] = None) -> Any:
+        """Load a single attribute value, or a single item of a list or dictionary attribute value, from a JSON file
+        saved with an offset index without parsing the rest of the JSON file.
+
+        Args:
+            json_file_path (Path): Target JSON file path (saved with offset_index) from which the item will be loaded.
+            attribute (str): Name of the attribute of the saved class instance from which to load the item.
+            index_or_key (Optional[Union[int, str]], optional): Index of the item of a list (or set or tuple) attribute
+                value, or key of the item of a dictionary attribute value, to load. Defaults to None, which loads the
+                entire attribute value.
+
+        Returns:
+            Any: The attribute value or item deserialized from its JSON fragment.
+
+        """
+        from pyobjson.offsets import read_json_fragment, read_offset_index
+
+        offset_index_file_path = json_file_path.with_name(json_file_path.name + OFFSET_INDEX_FILE_SUFFIX)
+        attribute_index = read_offset_index(offset_index_file_path, json_file_path)["attributes"].get(attribute)
+        if not attribute_index:
+            raise KeyError(f'Attribute "{attribute}" does not exist in JSON file {json_file_path}. Unable to load.')
+
+        with phase("load_item", self):
+            if index_or_key is None:
+                # wrap the attribute value with its pyobjson formatted attribute key to restore its type
+                typed_key, offset, length = attribute_index["key"], attribute_index["offset"], attribute_index["length"]
+            elif isinstance(attribute_index["items"], list) and isinstance(index_or_key, int):
+                typed_key, (offset, length) = None, attribute_index["items"][index_or_key]
+            elif isinstance(attribute_index["items"], dict) and str(index_or_key) in attribute_index["items"]:
+                # wrap the dictionary value with its pyobjson formatted key to restore its type
+                typed_key, offset, length = attribute_index["items"][str(index_or_key)]
+            else:
+                raise KeyError(
+                    f'Item "{index_or_key}" of attribute "{attribute}" is not indexed in JSON file {json_file_path}. '
+                    f"Unable to load."
+                )
+
+            json_fragment = read_json_fragment(json_file_path, offset, length)
+
+            # only map the buffer segments side file when the fragment references out-of-band buffer segments
+            memory_map = None
+            out_of_band_buffer = None
+            if has_out_of_band_buffer_references(json_fragment):
+                import mmap
+
+                buffer_segments_file_path = json_file_path.with_name(json_file_path.name + BUFFER_SEGMENTS_FILE_SUFFIX)
+                with open(buffer_segments_file_path, "rb") as buffer_segments_file_in:
+                    memory_map = mmap.mmap(buffer_segments_file_in.fileno(), 0, access=mmap.ACCESS_READ)
+                out_of_band_buffer = memoryview(memory_map)
+
+            try:
+                item = deserialize(
+                    {typed_key: json_fragment} if typed_key is not None else json_fragment,
+                    self._base_subclasses(),
+                    extra_attributes=self._derive_extra_attributes(),
+                    class_keys_for_extra_attributes=self.class_keys_for_extra_attributes,
+                    out_of_band_buffer=out_of_band_buffer,
+                )
+            finally:
+                if memory_map is not None:
+                    out_of_band_buffer.release()
+                    try:
+                        memory_map.close()
+                    except BufferError:
+                        # loaded buffer-protocol values still reference the memory map, which is closed once they are
+                        # garbage collected
+                        pass
+            return next(iter(item.values())) if typed_key is not None else item
+
+    def save_to_snapshot(
+        self,
+        snapshot_directory: "Path",
+        shard_size: int = SNAPSHOT_SHARD_SIZE,
+        max_workers: Optional[int] = None,
+        track_references: bool = False,
+        columnar: bool = False,
+        pack_numeric_columns: bool = False,
+        schema: bool = False,
+    ) -> None:
+        """Save the class instance to a sharded snapshot directory, in which lists and dictionaries (including custom
+        class instance attributes) larger than the shard size budget are split across multiple shard files written in
+        parallel, and a manifest lists every shard file with its checksum. The manifest is replaced atomically after all
+        shard files are written, so a failed save leaves any previously saved snapshot intact. Serializing and encoding
+        the class instance runs in the calling thread.
+
+        Args:
+            snapshot_directory (Path): Target directory to which the class instance will be saved.
+            shard_size (int, optional): Size budget in characters of the JSON of each shard file. Defaults to
+                SNAPSHOT_SHARD_SIZE.
+            max_workers (Optional[int], optional): Maximum number of threads used to write shard files. Defaults to
+                None, which uses the ThreadPoolExecutor default.
+            track_references (bool, optional): Whether to serialize objects referenced more than once (including
+                through cycles) only once and to serialize all other references to them as compact "$ref" IDs.
+                Defaults to False.
+            columnar (bool, optional): Whether to serialize lists of two or more instances of the same custom class
+                as parallel per-attribute columns stored once with their class key. Defaults to False.
+            pack_numeric_columns (bool, optional): Whether to pack columns of all integers or all floats into
+                base64-encoded arrays when columnar is True. Defaults to False.
+            schema (bool, optional): Whether to serialize in schema mode, in which attribute types are derived from
+                the __init__ type annotations of each custom class instead of being included in attribute keys.
+                Defaults to False.
+
+        Returns:
+            None
+
+        """
+        from pyobjson.snapshot import save_snapshot
+
+        with phase("save_to_snapshot", self) as instrumented_phase:
+            bytes_written = save_snapshot(
+                snapshot_directory,
+                self.serialize(
+                    track_references=track_references,
+                    columnar=columnar,
+                    pack_numeric_columns=pack_numeric_columns,
+                    schema=schema,
+                ),
+                shard_size,
+                max_workers=max_workers,
+            )
+            if is_instrumentation_enabled():
+                instrumented_phase.record_bytes("bytes_written", bytes_written)
+
+    def load_from_snapshot(
+        self, snapshot_directory: "Path", max_workers: Optional[int] = None, use_processes: bool = False
+    ) -> None:
+        """Load the class instance from a sharded snapshot directory, reading shard files and verifying their checksums
+        in parallel before rebuilding the saved data in its original order.
+
+        Args:
+            snapshot_directory (Path): Target directory from which the class instance will be loaded.
+            max_workers (Optional[int], optional): Maximum number of threads (or processes) used to read shard files.
+                Defaults to None, which uses the ThreadPoolExecutor (or ProcessPoolExecutor) default.
+            use_processes (bool, optional): Whether to read and decode shard files in multiple processes instead of
+                threads, which only overlap reading shard files since decoding JSON holds the GIL. Defaults to False.
+
+        Returns:
+            None
+
+        """
+        from pyobjson.snapshot import load_snapshot
+
+        with phase("load_from_snapshot", self) as instrumented_phase:
+            serializable_data, bytes_read = load_snapshot(
+                snapshot_directory, max_workers=max_workers, use_processes=use_processes
+            )
+            if is_instrumentation_enabled():
+                instrumented_phase.record_bytes("bytes_read", bytes_read)
+            self.deserialize(serializable_data)
+
+    def to_shared_memory(
+        self,
+        track_references: bool = False,
+        columnar: bool = False,
+        pack_numeric_columns: bool = False,
+        schema: bool = False,
+    ) -> str:
+        """Save the class instance to a new shared memory segment as compact JSON followed by the raw bytes of its
+        buffer-protocol values (memoryview, array.array, or NumPy array), so it can be passed to another process by
+        the name of the segment alone.
+
+        Args:
+            track_references (bool, optional): Whether to serialize objects referenced more than once (including
+                through cycles) only once and to serialize all other references to them as compact "$ref" IDs.
+                Defaults to False.
+            columnar (bool, optional): Whether to serialize lists of two or more instances of the same custom class
+                as parallel per-attribute columns stored once with their class key. Defaults to False.
+            pack_numeric_columns (bool, optional): Whether to pack columns of all integers or all floats into
+                base64-encoded arrays when columnar is True. Defaults to False.
+            schema (bool, optional): Whether to serialize in schema mode, in which attribute types are derived from
+                the __init__ type annotations of each custom class instead of being included in attribute keys.
+                Defaults to False.
+
+        Returns:
+            str: Name of the shared memory segment, which exists until it is loaded with load_from_shared_memory (or
+                freed with pyobjson.discard_shared_memory). On Windows, the segment only exists until it is released in
+                this process with pyobjson.release_shared_memory.
+
+        """
+        from pyobjson.shared_memory import write_shared_memory
+
+        with phase("to_shared_memory", self) as instrumented_phase:
+            buffer_segments: List[Tuple[int, memoryview]] = []
+            serializable_dict = self.serialize(
+                track_references=track_references,
+                columnar=columnar,
+                pack_numeric_columns=pack_numeric_columns,
+                schema=schema,
+                out_of_band_buffers=buffer_segments,
+            )
+            segment_name, segment_size = write_shared_memory(serializable_dict, buffer_segments)
+            if is_instrumentation_enabled():
+                instrumented_phase.record_bytes("bytes_written", segment_size)
+        return segment_name
+
+    def load_from_shared_memory(self, segment_name: str, unlink: bool = True) -> None:
+        """Load the class instance from a shared memory segment saved with to_shared_memory. Buffer-protocol values
+        are loaded as read-only views of the shared memory without copying them (except array.array values).
+
+        Args:
+            segment_name (str): Name of the shared memory segment.
+            unlink (bool, optional): Whether to free the segment once it is loaded, so it cannot be loaded again.
+                If loaded memoryviews or NumPy arrays still reference the shared memory, it stays mapped in this
+                process until the last of them is released or garbage collected. Defaults to True.
+
+        Returns:
+            None
+
+        """
+        from pyobjson.shared_memory import read_shared_memory
+
+        with phase("load_from_shared_memory", self) as instrumented_phase:
+            serializable_data, out_of_band_buffer, segment_size = read_shared_memory(segment_name, unlink=unlink)
+            if is_instrumentation_enabled():
+                instrumented_phase.record_bytes("bytes_read", segment_size)
+            try:
+                self.deserialize(serializable_data, out_of_band_buffer=out_of_band_buffer)
+            finally:
+                # unmap the segment unless loaded buffer-protocol values still reference its memory
+                if out_of_band_buffer is not None:
+                    out_of_band_buffer.release()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,208 @@
+"""Python Object JSON Tool pyobjson.cache module.
+
+Attributes:
+    __author__ (str): Python package template author.
+    __email__ (str): Python package template author email.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+from collections import OrderedDict
+from logging import getLogger
+from pathlib import Path
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from pyobjson.constants import BUFFER_SEGMENTS_FILE_SUFFIX, READ_CACHE_MAX_BYTES, READ_CACHE_MAX_ENTRIES
+from pyobjson.data import filter_custom_class_attributes
+from pyobjson.utils import set_instance_attributes
+
+logger = getLogger(__name__)
+
+
+class ReadThroughCache(object):
+    """Thread-safe in-memory cache of loaded class instances with LRU, TTL, and memory bound eviction, passed as the
+    cache argument of load methods (e.g. PythonObjectJson.load_from_json_file or
+    PythonObjectJsonToMongo.load_from_mongo) to skip reading, parsing, and deserializing data that has not changed.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = READ_CACHE_MAX_ENTRIES,
+        max_bytes: Optional[int] = READ_CACHE_MAX_BYTES,
+        ttl: Optional[float] = None,
+        read_only: bool = False,
+    ):
+        """Instantiate the ReadThroughCache class.
+
+        Args:
+            max_entries (int, optional): Maximum number of cached class instances. Defaults to READ_CACHE_MAX_ENTRIES.
+            max_bytes (Optional[int], optional): Maximum total size in bytes of the cached class instances (estimated
+                from the size of the data from which they were loaded), or None for no memory bound. Defaults to
+                READ_CACHE_MAX_BYTES.
+            ttl (Optional[float], optional): Number of seconds after which cached class instances expire, or None to
+                keep them until they are invalidated or evicted. Defaults to None.
+            read_only (bool, optional): Whether cache hits share the attribute values of the cached class instance
+                with the loaded class instance instead of cloning them, in which case loaded class instances must be
+                treated as read-only views. Defaults to False.
+
+        """
+        self.max_entries: int = max_entries
+        self.max_bytes: Optional[int] = max_bytes
+        self.ttl: Optional[float] = ttl
+        self.read_only: bool = read_only
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        # cache keys mapped to (validator, cached class instance, size in bytes, expiration time) in LRU order
+        self._entries: "OrderedDict[Hashable, Tuple[Hashable, Any, int, Optional[float]]]" = OrderedDict()
+        self._size: int = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, validator: Hashable) -> Optional[Any]:
+        """Retrieve a cached class instance if it was cached with the same validator and has not expired.
+
+        Args:
+            key (Hashable): Cache key identifying the source of the data (e.g. a file path or a document ID).
+            validator (Hashable): Value identifying the current version of the data (e.g. a file modification time
+                and size), which must match the validator with which the class instance was cached.
+
+        Returns:
+            Optional[Any]: The cached class instance (which must not be modified), or None if there is no valid cached
+                class instance.
+
+        """
+        with self._lock:
+            if (entry := self._entries.get(key)) is not None:
+                cached_validator, cached_instance, _, expiration_time = entry
+                if cached_validator == validator and (expiration_time is None or monotonic() < expiration_time):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return cached_instance
+                # remove the stale or expired cached class instance
+                self._remove(key)
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, validator: Hashable, instance: Any, size: int) -> None:
+        """Cache a class instance, evicting the least recently used class instances beyond the entry and memory bounds.
+
+        Args:
+            key (Hashable): Cache key identifying the source of the data (e.g. a file path or a document ID).
+            validator (Hashable): Value identifying the version of the data from which the class instance was loaded.
+            instance (Any): Class instance to cache, which must not be modified afterward (e.g. a clone of the loaded
+                class instance).
+            size (int): Size in bytes of the data from which the class instance was loaded.
+
+        Returns:
+            None
+
+        """
+        if self.max_entries <= 0 or (self.max_bytes is not None and size > self.max_bytes):
+            logger.debug(f"Class instance of {size} bytes exceeds the read-through cache bounds and is not cached.")
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (validator, instance, size, None if self.ttl is None else monotonic() + self.ttl)
+            self._size += size
+            while len(self._entries) > self.max_entries or (self.max_bytes is not None and self._size > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Remove a cached class instance, or all cached class instances.
+
+        Args:
+            key (Optional[Hashable], optional): Cache key of the class instance to remove, or None to remove all cached
+                class instances. Defaults to None.
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._size = 0
+            elif key in self._entries:
+                self._remove(key)
+
+    def stats(self) -> Dict[str, int]:
+        """Retrieve the hit, miss, and eviction counts and the current number and size of cached class instances.
+
+        Returns:
+            dict[str, int]: Dictionary of cache statistics.
+
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._size,
+            }
+
+    def load_into(self, instance: Any, cached_instance: Any) -> None:
+        """Load the serialized attributes of a cached class instance to a class instance (as deserialize would), either
+        cloned or shared with the cached class instance if the cache is read-only.
+
+        Args:
+            instance (Any): Class instance (a PythonObjectJson subclass instance) to which to load the attributes.
+            cached_instance (Any): Cached class instance returned by get.
+
+        Returns:
+            None
+
+        """
+        source_instance = cached_instance if self.read_only else cached_instance.clone()
+        set_instance_attributes(
+            instance,
+            filter_custom_class_attributes(
+                source_instance, instance.excluded_attributes, instance.class_keys_for_excluded_attributes
+            ),
+        )
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove a cached class instance while holding the lock.
+
+        Args:
+            key (Hashable): Cache key of the class instance to remove.
+
+        Returns:
+            None
+
+        """
+        self._size -= self._entries.pop(key)[2]
+
+
+def derive_file_cache_entry(json_file_path: Path) -> Tuple[Hashable, Hashable, int]:
+    """Function to derive the cache key, validator, and size of a JSON file and its buffer segments side file.
+
+    Args:
+        json_file_path (Path): JSON file path.
+
+    Returns:
+        tuple[Hashable, Hashable, int]: The cache key (the resolved JSON file path), the validator (the modification
+            times and sizes of the JSON file and its side file), and the total size in bytes of both files.
+
+    """
+    json_file_stat = json_file_path.stat()
+    validator: Tuple[Any, ...] = (json_file_stat.st_mtime_ns, json_file_stat.st_size)
+    size = json_file_stat.st_size
+
+    buffer_segments_file_path = json_file_path.with_name(json_file_path.name + BUFFER_SEGMENTS_FILE_SUFFIX)
+    if buffer_segments_file_path.exists():
+        buffer_segments_file_stat = buffer_segments_file_path.stat()
+        validator += (buffer_segments_file_stat.st_mtime_ns, buffer_segments_file_stat.st_size)
+        size += buffer_segments_file_stat.st_size
+
+    return ("file", str(json_file_path.resolve())), validator, size
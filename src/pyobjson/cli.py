@@ -0,0 +1,591 @@
+"""Python Object JSON Tool pyobjson.cli module.
+
+Attributes:
+    __author__ (str): Python package template author.
+    __email__ (str): Python package template author email.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import io
+import json
+import os
+import re
+import sys
+from argparse import ArgumentParser, Namespace
+from importlib import import_module
+from itertools import chain, islice
+from logging import getLogger
+from pathlib import Path
+from time import perf_counter
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from pyobjson.constants import DELIMITER as DLIM
+
+logger = getLogger(__name__)
+
+# size in characters (or bytes for line batches) of each chunk read from input files
+CLI_CHUNK_SIZE = 1024 * 1024
+
+# size in bytes of JSONL input files above which batches of lines are processed by multiple processes by default
+CLI_PARALLEL_SIZE = 64 * 1024 * 1024
+
+# modules used to compress and decompress data files by file suffix
+_COMPRESSION_MODULES = {".gz": "gzip", ".bz2": "bz2", ".xz": "lzma", ".lzma": "lzma"}
+
+# class keys written by data.serialize (fully qualified custom class names in lowercase)
+_CLASS_KEY_PATTERN = re.compile(r"[a-z_][\w]*(\.[\w<>]+)+")
+
+# per-class statistics bucket of JSON data that is not part of any custom class instance
+_UNATTRIBUTED = "(unattributed)"
+
+# JSON whitespace and the separators between the items of a top-level JSON array
+_WHITESPACE = " \t\r\n"
+_ARRAY_SEPARATORS = _WHITESPACE + ","
+
+
+def open_data_file(data_file_path: Path, mode: str) -> BinaryIO:
+    """Function to open a data file in binary mode, compressing or decompressing it by its file suffix (.gz, .bz2,
+    .xz, or .lzma).
+
+    Args:
+        data_file_path (Path): Path of the data file.
+        mode (str): "rb" to read or "wb" to write.
+
+    Returns:
+        BinaryIO: The opened (compressed) binary file.
+
+    """
+    if (compression_module := _COMPRESSION_MODULES.get(data_file_path.suffix.lower())) is not None:
+        return import_module(compression_module).open(data_file_path, mode)
+    return open(data_file_path, mode)
+
+
+def is_jsonl_path(data_file_path: Path) -> bool:
+    """Function to check if a data file contains JSON Lines by its file suffix (ignoring any compression suffix).
+
+    Args:
+        data_file_path (Path): Path of the data file.
+
+    Returns:
+        bool: Whether the data file path ends with .jsonl (optionally followed by a compression suffix).
+
+    """
+    suffixes = [suffix.lower() for suffix in data_file_path.suffixes]
+    if suffixes and suffixes[-1] in _COMPRESSION_MODULES:
+        suffixes.pop()
+    return bool(suffixes) and suffixes[-1] == ".jsonl"
+
+
+def stream_json_values(text_file: TextIO, chunk_size: int = CLI_CHUNK_SIZE) -> Tuple[bool, Iterator[Any]]:
+    """Function to decode the JSON values of a text file one at a time while reading it in chunks, so only one value
+    is held in memory at a time.
+
+    Args:
+        text_file (TextIO): Text file containing a top-level JSON array, JSON Lines, or whitespace-separated JSON
+            values (such as a single JSON object, which is decoded whole).
+        chunk_size (int, optional): Size in characters of each chunk read from the text file. Defaults to
+            CLI_CHUNK_SIZE.
+
+    Returns:
+        tuple[bool, Iterator[Any]]: Whether the text file contains a top-level JSON array, and an iterator over the
+            items of the array or over the top-level JSON values.
+
+    """
+    buffer = text_file.read(chunk_size)
+    stripped_buffer = buffer.lstrip(_WHITESPACE)
+    is_array = stripped_buffer.startswith("[")
+    separators = _ARRAY_SEPARATORS if is_array else _WHITESPACE
+
+    def iter_values() -> Iterator[Any]:
+        nonlocal buffer
+        decoder = json.JSONDecoder()
+        position = len(buffer) - len(stripped_buffer) + 1 if is_array else 0
+        eof = not buffer
+        while True:
+            # skip whitespace (and array separators), reading more chunks until the next value starts
+            while True:
+                while position < len(buffer) and buffer[position] in separators:
+                    position += 1
+                if position < len(buffer) or eof:
+                    break
+                buffer, position = text_file.read(chunk_size), 0
+                eof = not buffer
+            if position >= len(buffer) or (is_array and buffer[position] == "]"):
+                return
+
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+                # a value ending at the end of the buffer (such as a number) may continue in the next chunk
+                complete = end < len(buffer) or eof
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                complete = False
+            if not complete:
+                # read at least as much again as the incomplete value, so every value is decoded in linear time
+                more = text_file.read(max(chunk_size, len(buffer) - position))
+                eof = not more
+                buffer, position = buffer[position:] + more, 0
+                continue
+
+            yield value
+            position = end
+
+    return is_array, iter_values()
+
+
+def iter_line_batches(binary_file: BinaryIO, batch_size: int = CLI_CHUNK_SIZE) -> Iterator[bytes]:
+    """Function to read a JSON Lines file in batches of complete lines.
+
+    Args:
+        binary_file (BinaryIO): Binary file containing JSON Lines.
+        batch_size (int, optional): Approximate size in bytes of each batch. Defaults to CLI_CHUNK_SIZE.
+
+    Returns:
+        Iterator[bytes]: Iterator over batches of complete lines.
+
+    """
+    remainder = b""
+    while chunk := binary_file.read(batch_size):
+        batch, newline, remainder = (remainder + chunk).rpartition(b"\n")
+        if newline:
+            yield batch + newline
+    if remainder.strip():
+        yield remainder
+
+
+def encode_json_value(value: Any, indent: Optional[int] = None) -> str:
+    """Function to encode a JSON value either compactly or indented.
+
+    Args:
+        value (Any): JSON value.
+        indent (Optional[int], optional): Number of spaces of indentation, or None for compact JSON. Defaults to None.
+
+    Returns:
+        str: The encoded JSON.
+
+    """
+    if indent is None:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return json.dumps(value, ensure_ascii=False, indent=indent)
+
+
+def _encode_line_batch(batch: bytes) -> bytes:
+    """Function to re-encode a batch of JSON Lines as compact JSON Lines (run in worker processes).
+
+    Args:
+        batch (bytes): Batch of complete JSON Lines.
+
+    Returns:
+        bytes: The re-encoded batch.
+
+    """
+    return "".join(f"{encode_json_value(json.loads(line))}\n" for line in batch.splitlines() if line.strip()).encode(
+        "utf-8"
+    )
+
+
+def _encoded_size(value: Any) -> int:
+    """Function to derive the size in bytes of the compact UTF-8 JSON encoding of a scalar JSON value.
+
+    Args:
+        value (Any): Scalar JSON value.
+
+    Returns:
+        int: Size in bytes of the encoded value.
+
+    """
+    if value is None or value is True:
+        return 4
+    if value is False:
+        return 5
+    if type(value) is int:
+        return len(str(value))
+    return len(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+
+
+def measure_class_sizes(value: Any, class_stats: Dict[str, List[int]]) -> int:
+    """Function to count the custom class instances in serialized data (identified by the class keys written by
+    data.serialize) and attribute the size of every part of the compact JSON encoding of the data to the innermost
+    custom class instance containing it.
+
+    Args:
+        value (Any): Serialized data decoded from JSON.
+        class_stats (dict[str, list[int]]): Dictionary with class keys as keys and lists of the number of instances
+            and the size in bytes of their own JSON (excluding nested custom class instances) as values, to which to
+            add the statistics of the data.
+
+    Returns:
+        int: Size in bytes of the compact JSON encoding of the data.
+
+    """
+    total_size = 0
+    # the stack holds each value, the class key of the custom class instance owning it, and whether it is an escaped
+    # dictionary of user data (serialized as {"$escape": <dictionary>}) whose keys are never markers
+    stack: List[Tuple[Any, str, bool]] = [(value, _UNATTRIBUTED, False)]
+    while stack:
+        value, owner, escaped = stack.pop()
+        value_type = type(value)
+        if value_type is dict:
+            escapes = False
+            if escaped:
+                pass
+            elif len(value) == 1:
+                ((key, nested_value),) = value.items()
+                if type(nested_value) is dict and key == "$escape":
+                    escapes = True
+                elif type(nested_value) is dict and DLIM not in key and _CLASS_KEY_PATTERN.fullmatch(key):
+                    owner = key
+                    class_stats.setdefault(owner, [0, 0])[0] += 1
+            elif type(value.get("$columns")) is str and "$data" in value:
+                # lists of custom class instances serialized as attribute columns
+                owner = value["$columns"]
+                class_stats.setdefault(owner, [0, 0])[0] += value.get("$length", 0)
+            size = 1 + len(value) + sum(_encoded_size(key) + 1 for key in value) if value else 2
+            stack.extend((nested_value, owner, escapes) for nested_value in value.values())
+        elif value_type is list:
+            size = 1 + len(value) if value else 2
+            stack.extend((item, owner, False) for item in value)
+        else:
+            size = _encoded_size(value)
+        class_stats.setdefault(owner, [0, 0])[1] += size
+        total_size += size
+    return total_size
+
+
+def _measure_line_batch(batch: bytes) -> Tuple[Dict[str, List[int]], int, int]:
+    """Function to measure the custom class instances in a batch of JSON Lines (run in worker processes).
+
+    Args:
+        batch (bytes): Batch of complete JSON Lines.
+
+    Returns:
+        tuple[dict[str, list[int]], int, int]: The per-class statistics, the number of JSON values, and the total size
+            in bytes of their compact JSON encoding.
+
+    """
+    class_stats: Dict[str, List[int]] = {}
+    value_count, total_size = 0, 0
+    for line in batch.splitlines():
+        if line.strip():
+            total_size += measure_class_sizes(json.loads(line), class_stats)
+            value_count += 1
+    return class_stats, value_count, total_size
+
+
+def _map_line_batches(
+    input_path: Path, processes: Optional[int], function: Callable[[bytes], Any]
+) -> Optional[Iterator[Any]]:
+    """Function to apply a function to batches of lines of a JSON Lines input file using multiple processes.
+
+    Args:
+        input_path (Path): Path of the input file.
+        processes (Optional[int]): Number of processes, or None to use all CPUs for JSONL input files larger than
+            CLI_PARALLEL_SIZE.
+        function (Callable[[bytes], Any]): Module-level function to apply to each batch.
+
+    Returns:
+        Optional[Iterator[Any]]: Iterator over the results in input order, or None if the input file is not processed
+            by multiple processes.
+
+    """
+    if not is_jsonl_path(input_path):
+        return None
+    if processes is None:
+        processes = (os.cpu_count() or 1) if input_path.stat().st_size > CLI_PARALLEL_SIZE else 1
+    if processes <= 1:
+        return None
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    def iter_results() -> Iterator[Any]:
+        with open_data_file(input_path, "rb") as input_file:
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                # keep a bounded number of batches in flight so the input is streamed
+                pending = []
+                for batch in iter_line_batches(input_file):
+                    pending.append(executor.submit(function, batch))
+                    if len(pending) >= 2 * processes:
+                        yield pending.pop(0).result()
+                for future in pending:
+                    yield future.result()
+
+    return iter_results()
+
+
+def convert(
+    input_path: Path,
+    output_path: Path,
+    output_format: Optional[str] = None,
+    indent: Optional[int] = None,
+    processes: Optional[int] = None,
+) -> int:
+    """Function to convert a JSON or JSON Lines data file to JSON or JSON Lines, re-indenting and (de)compressing it
+    by the file suffixes while streaming the items of top-level arrays and JSON Lines.
+
+    Args:
+        input_path (Path): Path of the input file.
+        output_path (Path): Path of the output file.
+        output_format (Optional[str], optional): "json" or "jsonl", or None to derive the format from the output file
+            suffix. Defaults to None.
+        indent (Optional[int], optional): Number of spaces of indentation of JSON output, or None for compact JSON.
+            Defaults to None.
+        processes (Optional[int], optional): Number of processes re-encoding batches of lines of JSONL input files
+            converted to JSONL, or None to use all CPUs for JSONL input files larger than CLI_PARALLEL_SIZE. Defaults
+            to None.
+
+    Returns:
+        int: Number of converted JSON values.
+
+    """
+    output_format = output_format or ("jsonl" if is_jsonl_path(output_path) else "json")
+    value_count = 0
+    with open_data_file(output_path, "wb") as output_binary_file:
+        if output_format == "jsonl" and (batches := _map_line_batches(input_path, processes, _encode_line_batch)):
+            for encoded_batch in batches:
+                output_binary_file.write(encoded_batch)
+                value_count += encoded_batch.count(b"\n")
+            return value_count
+
+        with open_data_file(input_path, "rb") as input_binary_file:
+            is_array, values = stream_json_values(io.TextIOWrapper(input_binary_file, encoding="utf-8"))
+            output_file = io.TextIOWrapper(output_binary_file, encoding="utf-8")
+
+            if output_format == "jsonl":
+                for value in values:
+                    output_file.write(f"{encode_json_value(value)}\n")
+                    value_count += 1
+            else:
+                first_values = list(islice(values, 2))
+                if len(first_values) == 1 and not (is_array or is_jsonl_path(input_path)):
+                    # write a single top-level JSON value as is
+                    output_file.write(f"{encode_json_value(first_values[0], indent)}\n")
+                    value_count = 1
+                else:
+                    # write multiple JSON values as the items of a top-level JSON array
+                    item_indent = "\n" + " " * (indent or 0)
+                    output_file.write("[")
+                    for value in chain(first_values, values):
+                        encoded_value = encode_json_value(value, indent)
+                        if indent is not None:
+                            encoded_value = item_indent + encoded_value.replace("\n", item_indent)
+                        output_file.write(f"{',' if value_count else ''}{encoded_value}")
+                        value_count += 1
+                    output_file.write("\n]\n" if indent is not None and value_count else "]\n")
+            # flush the text wrapper without closing the output file it wraps
+            output_file.detach()
+
+    return value_count
+
+
+def stats(input_path: Path, processes: Optional[int] = None) -> Dict[str, Any]:
+    """Function to derive the number of instances and the size in bytes of the (compact JSON) serialized data of each
+    custom class in a JSON or JSON Lines data file.
+
+    Args:
+        input_path (Path): Path of the input file.
+        processes (Optional[int], optional): Number of processes measuring batches of lines of JSONL input files, or
+            None to use all CPUs for JSONL input files larger than CLI_PARALLEL_SIZE. Defaults to None.
+
+    Returns:
+        dict[str, Any]: Dictionary with the number of JSON values, their total size in bytes, and a dictionary with
+            class keys as keys and dictionaries with the number of instances and the size in bytes of their own JSON
+            (excluding nested custom class instances) as values, in descending order of size.
+
+    """
+    class_stats: Dict[str, List[int]] = {}
+    value_count, total_size = 0, 0
+    if batches := _map_line_batches(input_path, processes, _measure_line_batch):
+        for batch_class_stats, batch_value_count, batch_total_size in batches:
+            for class_key, (objects, size) in batch_class_stats.items():
+                class_totals = class_stats.setdefault(class_key, [0, 0])
+                class_totals[0] += objects
+                class_totals[1] += size
+            value_count += batch_value_count
+            total_size += batch_total_size
+    else:
+        with open_data_file(input_path, "rb") as input_binary_file:
+            _, values = stream_json_values(io.TextIOWrapper(input_binary_file, encoding="utf-8"))
+            for value in values:
+                total_size += measure_class_sizes(value, class_stats)
+                value_count += 1
+
+    return {
+        "values": value_count,
+        "bytes": total_size,
+        "classes": {
+            class_key: {"objects": objects, "bytes": size}
+            for class_key, (objects, size) in sorted(class_stats.items(), key=lambda item: (-item[1][1], item[0]))
+        },
+    }
+
+
+def bench(input_path: Path, modules: Optional[List[str]] = None, repeat: int = 3) -> Dict[str, Dict[str, float]]:
+    """Function to benchmark parsing and encoding the JSON values of a JSON or JSON Lines data file and, for values
+    serialized from custom classes defined in the imported modules, deserializing and serializing them with pyobjson.
+
+    Args:
+        input_path (Path): Path of the input file.
+        modules (Optional[list[str]], optional): Names of the modules defining the custom subclasses of
+            PythonObjectJson serialized in the data file. Defaults to None.
+        repeat (int, optional): Number of times each phase is timed (the fastest time is reported). Defaults to 3.
+
+    Returns:
+        dict[str, dict[str, float]]: Dictionary with phases as keys and dictionaries with the fastest time in seconds
+            and the throughput in megabytes per second of the data file as values.
+
+    """
+    from pyobjson.base import PythonObjectJson, get_base_subclasses
+    from pyobjson.data import deserialize
+
+    for module in modules or []:
+        import_module(module)
+
+    with open_data_file(input_path, "rb") as input_binary_file:
+        data = input_binary_file.read()
+
+    results: Dict[str, Dict[str, float]] = {}
+    phase_results: List[Any] = []
+
+    def time_phase(phase_name: str, function: Callable[[], List[Any]]) -> None:
+        fastest_seconds = float("inf")
+        for _ in range(max(repeat, 1)):
+            start = perf_counter()
+            phase_results[:] = function()
+            fastest_seconds = min(fastest_seconds, perf_counter() - start)
+        results[phase_name] = {
+            "seconds": fastest_seconds,
+            "megabytes_per_second": len(data) / 1e6 / fastest_seconds if fastest_seconds else float("inf"),
+        }
+
+    time_phase("parse", lambda: list(stream_json_values(io.StringIO(data.decode("utf-8")))[1]))
+    values = list(phase_results)
+    time_phase("encode", lambda: [encode_json_value(value) for value in values])
+
+    base_subclasses = get_base_subclasses(PythonObjectJson)
+    class_values = [
+        value for value in values if type(value) is dict and len(value) == 1 and next(iter(value)) in base_subclasses
+    ]
+    if class_values:
+        time_phase("deserialize", lambda: [deserialize(value, base_subclasses) for value in class_values])
+        instances = list(phase_results)
+        time_phase("serialize", lambda: [instance.serialize() for instance in instances])
+
+    return results
+
+
+def _format_stats(data_stats: Dict[str, Any]) -> str:
+    """Function to format per-class statistics as a table.
+
+    Args:
+        data_stats (dict[str, Any]): Statistics returned by stats.
+
+    Returns:
+        str: Table of the number of instances, size in bytes, and share of the total size of each custom class.
+
+    """
+    width = max([len("class")] + [len(class_key) for class_key in data_stats["classes"]])
+    lines = [f"{'class':<{width}}  {'objects':>12}  {'bytes':>15}  {'share':>7}"]
+    for class_key, class_stats in data_stats["classes"].items():
+        share = class_stats["bytes"] / data_stats["bytes"] if data_stats["bytes"] else 0.0
+        lines.append(f"{class_key:<{width}}  {class_stats['objects']:>12,}  {class_stats['bytes']:>15,}  {share:>7.1%}")
+    lines.append(f"{'total':<{width}}  {data_stats['values']:>12,}  {data_stats['bytes']:>15,}  {1.0:>7.1%}")
+    return "\n".join(lines)
+
+
+def _format_bench(bench_results: Dict[str, Dict[str, float]]) -> str:
+    """Function to format benchmark results as a table.
+
+    Args:
+        bench_results (dict[str, dict[str, float]]): Benchmark results returned by bench.
+
+    Returns:
+        str: Table of the fastest time and throughput of each phase.
+
+    """
+    lines = [f"{'phase':<12}  {'seconds':>10}  {'MB/s':>10}"]
+    for phase_name, phase_results in bench_results.items():
+        lines.append(
+            f"{phase_name:<12}  {phase_results['seconds']:>10.4f}  {phase_results['megabytes_per_second']:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def _build_argument_parser() -> ArgumentParser:
+    """Function to build the command-line argument parser of the convert, stats, and bench commands.
+
+    Returns:
+        ArgumentParser: Command-line argument parser.
+
+    """
+    parser = ArgumentParser(
+        prog="python -m pyobjson",
+        description="Convert and profile pyobjson data files.",
+        epilog=(
+            "Only the items of top-level JSON arrays and of JSON Lines files are streamed one at a time. Any other "
+            "JSON value (such as the single object written by save_to_json_file) is decoded whole and must fit in "
+            "memory, and only JSON Lines input files are processed by multiple processes."
+        ),
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    input_help = "input file (.json or .jsonl, optionally .gz/.bz2/.xz; only top-level arrays and JSONL are streamed)"
+    processes_help = "number of processes for JSONL input files (default: all CPUs for files larger than 64 MiB)"
+
+    convert_parser = subparsers.add_parser("convert", help="convert between JSON and JSONL (optionally compressed)")
+    convert_parser.add_argument("input", type=Path, help=input_help)
+    convert_parser.add_argument("output", type=Path, help="output file (.json or .jsonl, optionally .gz/.bz2/.xz)")
+    convert_parser.add_argument("--format", choices=["json", "jsonl"], help="output format (default: by suffix)")
+    convert_parser.add_argument("--indent", type=int, help="indentation of JSON output (default: compact)")
+    convert_parser.add_argument("--processes", type=int, help=processes_help)
+
+    stats_parser = subparsers.add_parser("stats", help="show object counts and byte sizes per class")
+    stats_parser.add_argument("input", type=Path, help=input_help)
+    stats_parser.add_argument("--json", action="store_true", help="output the statistics as JSON")
+    stats_parser.add_argument("--processes", type=int, help=processes_help)
+
+    bench_parser = subparsers.add_parser("bench", help="time parsing, encoding, deserialization, and serialization")
+    bench_parser.add_argument("input", type=Path, help=input_help)
+    bench_parser.add_argument(
+        "--import",
+        dest="modules",
+        action="append",
+        metavar="MODULE",
+        help="module defining the serialized custom classes (repeatable)",
+    )
+    bench_parser.add_argument("--repeat", type=int, default=3, help="number of timed runs per phase (default: 3)")
+    bench_parser.add_argument("--json", action="store_true", help="output the results as JSON")
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Function to run the convert, stats, and bench commands from the command line (python -m pyobjson).
+
+    Args:
+        argv (Optional[list[str]], optional): Command-line arguments, or None to use sys.argv. Defaults to None.
+
+    Returns:
+        int: Exit status.
+
+    """
+    args: Namespace = _build_argument_parser().parse_args(argv)
+
+    if not args.input.exists():
+        print(f"Input file {args.input} does not exist.", file=sys.stderr)
+        return 1
+
+    if args.command == "convert":
+        value_count = convert(args.input, args.output, args.format, args.indent, args.processes)
+        logger.debug(f"Converted {value_count} JSON values from {args.input} to {args.output}.")
+    elif args.command == "stats":
+        data_stats = stats(args.input, args.processes)
+        print(json.dumps(data_stats, indent=2) if args.json else _format_stats(data_stats))
+    else:
+        bench_results = bench(args.input, args.modules, args.repeat)
+        print(json.dumps(bench_results, indent=2) if args.json else _format_bench(bench_results))
+
+    return 0
@@ -12,5 +12,59 @@ __email__ = "dev@wrencode.com"
 # unique delimiter string to use in pyobjson keys and values for object type categories and object types
 DELIMITER = "::::"
 
+# names of the pyobjson attributes of every custom class instance, which are always excluded during serialization and
+# included as extra attributes during deserialization
+PYOBJSON_ATTRIBUTES = (
+    "excluded_attributes",
+    "class_keys_for_excluded_attributes",
+    "extra_attributes",
+    "class_keys_for_extra_attributes",
+)
+
 # type string for unserializable objects not supported by pyobjson
 UNSERIALIZABLE = "UNSERIALIZABLE"
+
+# maximum number of entries in each of the caches for resolving and encoding function-typed attributes
+CALLABLE_CACHE_MAX_SIZE = 1024
+
+# maximum number of entries in each of the caches for compiling projections and selecting projected attributes
+PROJECTION_CACHE_MAX_SIZE = 1024
+
+# maximum number of entries in the cache of the cloned attribute names of each custom class and set of attributes
+CLONE_CACHE_MAX_SIZE = 1024
+
+# maximum number of fingerprints of saved data (by JSON file path or MongoDB document) kept to skip unchanged saves
+SAVED_FINGERPRINTS_MAX_SIZE = 4096
+
+# suffix appended to JSON file paths for the side files containing the out-of-band segments of buffer-protocol values
+BUFFER_SEGMENTS_FILE_SUFFIX = ".buffers"
+
+# version of the payload format written in schema mode, in which attribute types are derived from class annotations
+SCHEMA_FORMAT_VERSION = 1
+
+# name of the manifest file listing the shard files (and their checksums) in the directory of each sharded snapshot
+SNAPSHOT_MANIFEST_FILE_NAME = "manifest.json"
+
+# name of the directory containing the shard files in the directory of each sharded snapshot
+SNAPSHOT_SHARDS_DIRECTORY_NAME = "shards"
+
+# default size budget in characters of the JSON of each shard of a sharded snapshot
+SNAPSHOT_SHARD_SIZE = 64 * 1024 * 1024
+
+# version of the manifest format of sharded snapshots
+SNAPSHOT_FORMAT_VERSION = 1
+
+# suffix appended to JSON file paths for the side files containing the byte offsets of attribute values and their items
+OFFSET_INDEX_FILE_SUFFIX = ".index"
+
+# version of the format of offset index side files
+OFFSET_INDEX_FORMAT_VERSION = 1
+
+# version of the layout of shared memory segments written by PythonObjectJson.to_shared_memory
+SHARED_MEMORY_FORMAT_VERSION = 1
+
+# default maximum number of class instances held by each read-through cache
+READ_CACHE_MAX_ENTRIES = 128
+
+# default memory bound in bytes (estimated from the size of the loaded data) of each read-through cache
+READ_CACHE_MAX_BYTES = 256 * 1024 * 1024
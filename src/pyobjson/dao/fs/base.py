@@ -0,0 +1,350 @@
+"""Python Object JSON Tool pyobjson.dao.fs module.
+
+Attributes:
+    __author__ (str): Python package template author.
+    __email__ (str): Python package template author email.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
+from logging import getLogger
+from pathlib import Path
+from tempfile import mkstemp
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from uuid import uuid4
+
+from pyobjson.base import PythonObjectJson
+
+logger = getLogger(__name__)
+
+# name of the append-only index file kept in the root directory of each file store
+FS_STORE_INDEX_FILE_NAME = "index.jsonl"
+
+# name of the directory containing the sharded object files in the root directory of each file store
+FS_STORE_OBJECTS_DIRECTORY_NAME = "objects"
+
+
+def _fsync_directory(directory_path: Path) -> None:
+    """Sync a directory to disk so the files created in it or renamed into it survive a crash.
+
+    Args:
+        directory_path (Path): The directory to sync.
+
+    Returns:
+        None
+
+    """
+    # directories cannot be opened (and do not need to be synced) on Windows
+    if os.name == "nt":
+        return
+
+    directory_descriptor = os.open(directory_path, os.O_RDONLY)
+    try:
+        os.fsync(directory_descriptor)
+    finally:
+        os.close(directory_descriptor)
+
+
+class _FileStoreIndex(object):
+    """In-memory view of the append-only index file of a file store mapping object keys to object file paths, sizes,
+    and modification times.
+    """
+
+    def __init__(self, index_file_path: Path):
+        self.index_file_path: Path = index_file_path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.offset: int = 0
+        self.lock = threading.Lock()
+
+    def refresh(self) -> None:
+        """Read any index records appended to the index file (by this or another process) since the last refresh.
+
+        Returns:
+            None
+
+        """
+        with self.lock:
+            if not self.index_file_path.exists() or self.index_file_path.stat().st_size == self.offset:
+                return
+
+            with open(self.index_file_path, "rb") as index_file_in:
+                index_file_in.seek(self.offset)
+                for line in index_file_in:
+                    # stop at a partially written trailing record and pick it up on the next refresh
+                    if not line.endswith(b"\n"):
+                        break
+                    self.offset += len(line)
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # skip the remains of a record left partially written by an interrupted append
+                        logger.warning(f"Skipping invalid record in file store index {self.index_file_path}.")
+                        continue
+                    self.entries[record.pop("key")] = record
+
+    def append(self, records: List[Dict[str, Any]], fsync: bool = False) -> None:
+        """Append index records to the index file with a single write and apply them to the in-memory index. Records
+        are started on a new line when the index file ends with a partially written record of an interrupted append.
+
+        Args:
+            records (list[dict[str, Any]]): Index records with key, path, size, and mtime values.
+            fsync (bool, optional): Whether to sync the index file (and the file store directory when the index file
+                is created) to disk before applying the records. Defaults to False.
+
+        Returns:
+            None
+
+        """
+        self.refresh()
+        index_bytes = "".join(f"{json.dumps(record, ensure_ascii=False)}\n" for record in records).encode("utf-8")
+        with self.lock:
+            index_file_exists = self.index_file_path.exists()
+            with open(self.index_file_path, "a+b") as index_file_out:
+                if index_file_out.seek(0, os.SEEK_END) > 0:
+                    index_file_out.seek(-1, os.SEEK_END)
+                    if index_file_out.read(1) != b"\n":
+                        index_bytes = b"\n" + index_bytes
+                index_file_out.write(index_bytes)
+                index_file_out.flush()
+                if fsync:
+                    os.fsync(index_file_out.fileno())
+                # skip the records written here on the next refresh unless other processes appended before them
+                if index_file_out.tell() - len(index_bytes) == self.offset:
+                    self.offset = index_file_out.tell()
+            if fsync and not index_file_exists:
+                _fsync_directory(self.index_file_path.parent)
+            for record in records:
+                self.entries[record["key"]] = {k: v for k, v in record.items() if k != "key"}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up the index entry for an object key, refreshing the index from disk if the key is not yet known.
+
+        Args:
+            key (str): The object key to look up.
+
+        Returns:
+            Optional[dict[str, Any]]: Index entry with path, size, and mtime values, or None if the key does not exist.
+
+        """
+        if key not in self.entries:
+            self.refresh()
+        return self.entries.get(key)
+
+
+# index instances shared by all file store objects in the process keyed by resolved file store directory
+_fs_store_indexes: Dict[str, _FileStoreIndex] = {}
+_fs_store_indexes_lock = threading.Lock()
+
+
+class PythonObjectJsonToFileStore(PythonObjectJson):
+    """PythonObjectJson subclass with built-in save/load functionality to/from a sharded file system object store."""
+
+    def __init__(self, fs_store_directory: Union[Path, str], fs_store_fsync: bool = True):
+        super().__init__(excluded_attributes=["(^fs_store_[A-Za-z_]*)"])
+        self.fs_store_directory: Path = Path(fs_store_directory)
+        self.fs_store_fsync: bool = fs_store_fsync
+
+    def _get_fs_store_index(self) -> _FileStoreIndex:
+        """Retrieve the shared index of the file store, and create the file store directory and load its index from
+        disk if it has not already been loaded in this process.
+
+        Returns:
+            _FileStoreIndex: The index of the file store.
+
+        """
+        fs_store_directory = str(self.fs_store_directory.resolve())
+        with _fs_store_indexes_lock:
+            fs_store_index = _fs_store_indexes.get(fs_store_directory)
+            if not fs_store_index:
+                self.fs_store_directory.mkdir(parents=True, exist_ok=True)
+                fs_store_index = _FileStoreIndex(self.fs_store_directory / FS_STORE_INDEX_FILE_NAME)
+                fs_store_index.refresh()
+                _fs_store_indexes[fs_store_directory] = fs_store_index
+
+        return fs_store_index
+
+    @staticmethod
+    def _derive_object_file_path(fs_key: str) -> str:
+        """Derive the sharded object file path relative to the file store directory for a given object key.
+
+        Args:
+            fs_key (str): The object key for which to derive a file path.
+
+        Returns:
+            str: Relative object file path in the format objects/ab/cd/abcd....json.
+
+        """
+        key_hash = sha256(fs_key.encode("utf-8")).hexdigest()
+        return f"{FS_STORE_OBJECTS_DIRECTORY_NAME}/{key_hash[:2]}/{key_hash[2:4]}/{key_hash}.json"
+
+    def _write_object_file(self, fs_key: str, custom_object: PythonObjectJson) -> Dict[str, Any]:
+        """Atomically write a custom Python object to its sharded object file using a temporary file and a rename,
+        and sync the object file and the directories it was renamed or created into to disk when fs_store_fsync is set.
+
+        Args:
+            fs_key (str): The key under which to save the custom Python object.
+            custom_object (PythonObjectJson): The custom Python object to save.
+
+        Returns:
+            dict[str, Any]: Index record with key, path, size, and mtime values for the written object file.
+
+        """
+        relative_path = self._derive_object_file_path(fs_key)
+        object_file_path = self.fs_store_directory / relative_path
+        # the shard directories created here, which are only synced once their own entries are synced
+        created_directory_paths = [
+            directory_path for directory_path in object_file_path.parents[:3] if not directory_path.exists()
+        ]
+        object_file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        temp_file_descriptor, temp_file_path = mkstemp(dir=object_file_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(temp_file_descriptor, "wb") as temp_file_out:
+                temp_file_out.write(json.dumps(custom_object.serialize(), ensure_ascii=False).encode("utf-8"))
+                if self.fs_store_fsync:
+                    temp_file_out.flush()
+                    os.fsync(temp_file_out.fileno())
+            os.replace(temp_file_path, object_file_path)
+        except BaseException:
+            Path(temp_file_path).unlink(missing_ok=True)
+            raise
+
+        if self.fs_store_fsync:
+            _fsync_directory(object_file_path.parent)
+            for directory_path in created_directory_paths:
+                _fsync_directory(directory_path.parent)
+
+        object_file_stat = object_file_path.stat()
+        return {
+            "key": fs_key,
+            "path": relative_path,
+            "size": object_file_stat.st_size,
+            "mtime": object_file_stat.st_mtime,
+        }
+
+    def save_to_fs_store(self, fs_key: Optional[str] = None) -> str:
+        """Save the custom Python object to the file store.
+
+        Args:
+            fs_key (Optional[str], optional): Key under which to save the custom Python object. Defaults to None,
+                which will result in a unique key being generated.
+
+        Returns:
+            str: The key under which the custom Python object was saved.
+
+        """
+        return self.save_many_to_fs_store({fs_key or uuid4().hex: self})[0]
+
+    def save_many_to_fs_store(
+        self, custom_objects: Dict[str, PythonObjectJson], max_workers: Optional[int] = None
+    ) -> List[str]:
+        """Save multiple custom Python objects to the file store using a thread pool and a single index update.
+
+        Args:
+            custom_objects (dict[str, PythonObjectJson]): Dictionary with keys under which to save the custom Python
+                objects as keys and custom Python objects as values.
+            max_workers (Optional[int], optional): Maximum number of threads used to write object files. Defaults to
+                None, which uses the ThreadPoolExecutor default.
+
+        Returns:
+            list[str]: The keys under which the custom Python objects were saved.
+
+        """
+        fs_store_index = self._get_fs_store_index()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            index_records = list(executor.map(self._write_object_file, custom_objects.keys(), custom_objects.values()))
+        fs_store_index.append(index_records, fsync=self.fs_store_fsync)
+        return list(custom_objects.keys())
+
+    def _read_object_file(self, fs_key: str) -> Dict[str, Any]:
+        """Read the serializable dictionary saved under a given key from its sharded object file, falling back to the
+        object file path derived from the key when the index has no entry for it (e.g. when a crash interrupted the
+        index update after the object file was written).
+
+        Args:
+            fs_key (str): The key under which the custom Python object was saved.
+
+        Returns:
+            dict[str, Any]: Serializable dictionary representing the saved custom Python object.
+
+        """
+        index_entry = self._get_fs_store_index().get(fs_key)
+        object_file_path = self.fs_store_directory / (
+            index_entry["path"] if index_entry else self._derive_object_file_path(fs_key)
+        )
+        if not index_entry and not object_file_path.exists():
+            raise KeyError(f'Key "{fs_key}" does not exist in file store "{self.fs_store_directory}". Unable to load.')
+
+        with open(object_file_path, "rb") as object_file_in:
+            return json.loads(object_file_in.read())
+
+    def load_from_fs_store(self, fs_key: str) -> None:
+        """Load the JSON values saved under a specified key in the file store to the custom Python object.
+
+        Args:
+            fs_key (str): The key under which the custom Python object JSON was saved.
+
+        Returns:
+            None
+
+        """
+        self.deserialize(self._read_object_file(fs_key))
+
+    def load_many_from_fs_store(self, fs_keys: List[str], max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """Load multiple custom Python objects saved under specified keys in the file store using a thread pool.
+
+        Args:
+            fs_keys (list[str]): The keys under which the custom Python objects were saved.
+            max_workers (Optional[int], optional): Maximum number of threads used to read object files. Defaults to
+                None, which uses the ThreadPoolExecutor default.
+
+        Returns:
+            dict[str, Any]: Dictionary with the requested keys as keys and the custom Python objects deserialized from
+                their saved JSON as values, in the order of the requested keys.
+
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            custom_objects = executor.map(
+                lambda fs_key: self._deserialize_new_instance(self._read_object_file(fs_key)), fs_keys
+            )
+            return dict(zip(fs_keys, custom_objects))
+
+    def list_fs_store_keys(self) -> List[str]:
+        """List the keys of all custom Python objects saved in the file store in the order they were first saved.
+
+        Returns:
+            list[str]: The keys of all saved custom Python objects.
+
+        """
+        fs_store_index = self._get_fs_store_index()
+        fs_store_index.refresh()
+        return list(fs_store_index.entries.keys())
+
+    def get_fs_store_entry(self, fs_key: str) -> Optional[Dict[str, Any]]:
+        """Retrieve the index entry for a custom Python object saved in the file store without reading its file.
+
+        Args:
+            fs_key (str): The key under which the custom Python object was saved.
+
+        Returns:
+            Optional[dict[str, Any]]: Index entry with path, size, and mtime values, or None if the key does not exist.
+
+        """
+        return self._get_fs_store_index().get(fs_key)
+
+    def iter_from_fs_store(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate over all custom Python objects saved in the file store in the order they were first saved.
+
+        Returns:
+            Iterator[tuple[str, Any]]: Iterator of keys and custom Python objects deserialized from their saved JSON.
+
+        """
+        for fs_key in self.list_fs_store_keys():
+            yield fs_key, self._deserialize_new_instance(self._read_object_file(fs_key))
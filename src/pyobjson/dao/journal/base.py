@@ -0,0 +1,426 @@
+"""Python Object JSON Tool pyobjson.dao.journal module.
+
+Attributes:
+    __author__ (str): Python package template author.
+    __email__ (str): Python package template author email.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import json
+import os
+import threading
+from logging import getLogger
+from pathlib import Path
+from tempfile import mkstemp
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
+
+from pyobjson.base import PythonObjectJson
+from pyobjson.instrumentation import is_instrumentation_enabled, phase
+
+logger = getLogger(__name__)
+
+# name of the file containing the latest full snapshot in the directory of each journal
+JOURNAL_SNAPSHOT_FILE_NAME = "snapshot.json"
+
+# name of the append-only change log file in the directory of each journal
+JOURNAL_LOG_FILE_NAME = "journal.jsonl"
+
+# default size in bytes of the change log file above which it is compacted into a new snapshot in the background
+JOURNAL_COMPACTION_SIZE = 64 * 1024 * 1024
+
+# version of the format of journal snapshot files
+JOURNAL_FORMAT_VERSION = 1
+
+
+# serializable container types that are compared item by item
+_CONTAINER_TYPES = {dict, list}
+
+# placeholder for dictionary keys missing from the previous serializable data
+_MISSING = object()
+
+
+def _json_keyed(serializable_dict: Dict[Any, Any]) -> Dict[str, Any]:
+    """Function to key a serializable dictionary by its JSON object keys (matching the key conversion of json.dumps), so
+    dictionaries with non-string keys compare equal to their decoded JSON.
+
+    Args:
+        serializable_dict (dict[Any, Any]): Serializable dictionary.
+
+    Returns:
+        dict[str, Any]: The same dictionary if all of its keys are strings, otherwise a new dictionary with JSON keys.
+
+    """
+    if all(type(key) is str for key in serializable_dict):
+        return serializable_dict
+    return {key if type(key) is str else json.dumps(key): val for key, val in serializable_dict.items()}
+
+
+def diff_serializable_data(old_data: Any, new_data: Any) -> List[List[Any]]:
+    """Function to derive the changes between two versions of serializable data as a list of operations, each of which
+    is either [<path>, <value>] to set (or append to a list) a value or [<path>] to delete a value, where a path is a
+    list of the dictionary keys and list indices leading to the value.
+
+    Args:
+        old_data (Any): Previous serializable data (as returned by PythonObjectJson.serialize).
+        new_data (Any): New serializable data.
+
+    Returns:
+        list[list[Any]]: Operations to apply in order to the previous data with apply_changes to derive the new data.
+
+    """
+    changes = []
+    # use an explicit stack of (old value, new value, path) instead of recursion to support arbitrarily deep data
+    stack: List[Tuple[Any, Any, List[Any]]] = [(old_data, new_data, [])]
+    while stack:
+        old_value, new_value, path = stack.pop()
+
+        if type(old_value) is dict and type(new_value) is dict:
+            old_items = _json_keyed(old_value)
+            new_items = _json_keyed(new_value)
+            item_pairs = [(key, old_items.get(key, _MISSING), new_item) for key, new_item in new_items.items()]
+            changes.extend([[*path, key]] for key in old_items if key not in new_items)
+        elif type(old_value) is list and type(new_value) is list:
+            common_length = min(len(old_value), len(new_value))
+            item_pairs = [(i, old_value[i], new_value[i]) for i in range(common_length)]
+            # delete removed items from the end and append added items in order, so no other indices shift
+            changes.extend([[*path, i]] for i in range(len(old_value) - 1, common_length - 1, -1))
+            changes.extend([[*path, i], new_value[i]] for i in range(common_length, len(new_value)))
+        else:
+            changes.append([path, new_value])
+            continue
+
+        for key, old_item, new_item in item_pairs:
+            if old_item is new_item:
+                continue
+            if type(old_item) is type(new_item):
+                if type(new_item) in _CONTAINER_TYPES:
+                    stack.append((old_item, new_item, [*path, key]))
+                    continue
+                if old_item == new_item:
+                    continue
+            changes.append([[*path, key], new_item])
+
+    return changes
+
+
+def apply_changes(data: Any, changes: List[List[Any]]) -> Any:
+    """Function to apply the operations derived with diff_serializable_data to serializable data in place.
+
+    Args:
+        data (Any): Serializable data (as decoded from JSON) to which to apply the changes.
+        changes (list[list[Any]]): Operations to apply in order.
+
+    Returns:
+        Any: The changed data (which is a new value if the root value was replaced).
+
+    """
+    for change in changes:
+        path = change[0]
+        if not path:
+            data = change[1]
+            continue
+
+        container = data
+        for key in path[:-1]:
+            container = container[key]
+
+        key = path[-1]
+        if len(change) == 1:
+            del container[key]
+        elif type(container) is list and key == len(container):
+            container.append(change[1])
+        else:
+            container[key] = change[1]
+    return data
+
+
+def _read_journal(snapshot_file_path: Path, log_file_path: Path) -> Tuple[Optional[Any], int, int, int]:
+    """Function to read the latest snapshot of a journal and apply all change log records saved after it.
+
+    Args:
+        snapshot_file_path (Path): Path of the snapshot file of the journal.
+        log_file_path (Path): Path of the change log file of the journal.
+
+    Returns:
+        tuple[Optional[Any], int, int, int]: The saved serializable data decoded from JSON (or None if nothing was
+            saved), the sequence number of the last applied record, the size in bytes of the complete records of the
+            change log, and the size in bytes of the change log.
+
+    """
+    data, sequence = None, 0
+    if snapshot_file_path.exists():
+        with open(snapshot_file_path, "rb") as snapshot_file_in:
+            snapshot = json.loads(snapshot_file_in.read())
+        if (format_version := snapshot.get("format_version")) != JOURNAL_FORMAT_VERSION:
+            raise ValueError(f"Journal snapshot format version ({format_version}) is not compatible with pyobjson.")
+        data, sequence = snapshot["data"], snapshot["sequence"]
+
+    if not log_file_path.exists():
+        return data, sequence, 0, 0
+
+    with open(log_file_path, "rb") as log_file_in:
+        log_bytes = log_file_in.read()
+
+    # ignore a partially written trailing record of an interrupted save
+    complete_size = log_bytes.rfind(b"\n") + 1
+    for line in log_bytes[:complete_size].splitlines():
+        record = json.loads(line)
+        # skip records already folded into the snapshot by a compaction interrupted before replacing the log
+        if record["sequence"] > sequence:
+            data = apply_changes(data, record["changes"])
+            sequence = record["sequence"]
+    return data, sequence, complete_size, len(log_bytes)
+
+
+def _write_temp_file(directory: Path, content: bytes) -> str:
+    """Function to write and sync a temporary file to be moved into place with os.replace.
+
+    Args:
+        directory (Path): Directory in which to create the temporary file.
+        content (bytes): Content of the temporary file.
+
+    Returns:
+        str: Path of the temporary file.
+
+    """
+    temp_file_descriptor, temp_file_path = mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(temp_file_descriptor, "wb") as temp_file_out:
+            temp_file_out.write(content)
+            temp_file_out.flush()
+            os.fsync(temp_file_out.fileno())
+    except BaseException:
+        Path(temp_file_path).unlink(missing_ok=True)
+        raise
+    return temp_file_path
+
+
+class _Journal(object):
+    """In-memory state of a journal shared by all journal objects of the same journal directory in the process, with
+    the last saved serializable data, its sequence number, and the open change log file.
+    """
+
+    def __init__(self, journal_directory: Path):
+        self.snapshot_file_path: Path = journal_directory / JOURNAL_SNAPSHOT_FILE_NAME
+        self.log_file_path: Path = journal_directory / JOURNAL_LOG_FILE_NAME
+        # the last saved data to compare with on the next save is replaced (and never modified) on every save, so it can
+        # be written to a snapshot without holding the lock
+        self.data: Optional[Any] = None
+        self.sequence: int = 0
+        self.unsynced_records: int = 0
+        self.lock = threading.Lock()
+        self.compaction_lock = threading.Lock()
+        self.compaction_thread: Optional[threading.Thread] = None
+
+        journal_directory.mkdir(parents=True, exist_ok=True)
+        self.data, self.sequence, complete_size, log_size = _read_journal(self.snapshot_file_path, self.log_file_path)
+        if complete_size < log_size:
+            logger.warning(f"Discarding partially written record at the end of change log {self.log_file_path}.")
+            with open(self.log_file_path, "r+b") as log_file_out:
+                log_file_out.truncate(complete_size)
+        self.log_file: BinaryIO = open(self.log_file_path, "ab")
+
+    def load(self) -> Optional[Any]:
+        """Read the latest snapshot and the change log records saved after it from disk.
+
+        Returns:
+            Optional[Any]: The saved serializable data decoded from JSON, or None if nothing was saved.
+
+        """
+        with self.lock:
+            return _read_journal(self.snapshot_file_path, self.log_file_path)[0]
+
+    def append(self, data: Any, fsync_interval: int) -> int:
+        """Append a record of the changes since the last saved data to the change log.
+
+        Args:
+            data (Any): New serializable data, which must never be modified afterward.
+            fsync_interval (int): Number of appended records after which the change log is synced to disk, or 0 to
+                leave syncing to the operating system.
+
+        Returns:
+            int: Size in bytes of the appended record, or 0 if the data did not change.
+
+        """
+        with self.lock:
+            changes = diff_serializable_data(self.data, data) if self.data is not None else [[[], data]]
+            if not changes:
+                return 0
+
+            record = json.dumps(
+                {"sequence": self.sequence + 1, "changes": changes}, ensure_ascii=False, separators=(",", ":")
+            ).encode("utf-8")
+            self.log_file.write(record + b"\n")
+            self.log_file.flush()
+            self.unsynced_records += 1
+            if fsync_interval and self.unsynced_records >= fsync_interval:
+                os.fsync(self.log_file.fileno())
+                self.unsynced_records = 0
+
+            self.data = data
+            self.sequence += 1
+            return len(record) + 1
+
+    def sync(self) -> None:
+        """Sync all appended change log records to disk.
+
+        Returns:
+            None
+
+        """
+        with self.lock:
+            if self.unsynced_records:
+                os.fsync(self.log_file.fileno())
+                self.unsynced_records = 0
+
+    def compact(self) -> None:
+        """Fold the change log into a new snapshot and remove the folded records from the change log, keeping any
+        records appended while the snapshot was written.
+
+        Returns:
+            None
+
+        """
+        with self.compaction_lock:
+            with self.lock:
+                data, sequence, folded_size = self.data, self.sequence, self.log_file.tell()
+            if not folded_size:
+                return
+
+            snapshot_temp_file_path = _write_temp_file(
+                self.snapshot_file_path.parent,
+                json.dumps(
+                    {"format_version": JOURNAL_FORMAT_VERSION, "sequence": sequence, "data": data},
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                ).encode("utf-8"),
+            )
+            try:
+                with self.lock:
+                    # copy the records appended while the snapshot was written into a new change log
+                    self.log_file.close()
+                    try:
+                        with open(self.log_file_path, "rb") as log_file_in:
+                            log_file_in.seek(folded_size)
+                            log_temp_file_path = _write_temp_file(self.log_file_path.parent, log_file_in.read())
+                        # replace the snapshot first, since records folded into it are skipped when replaying the log
+                        os.replace(snapshot_temp_file_path, self.snapshot_file_path)
+                        os.replace(log_temp_file_path, self.log_file_path)
+                    finally:
+                        self.log_file = open(self.log_file_path, "ab")
+                    self.unsynced_records = 0
+            finally:
+                Path(snapshot_temp_file_path).unlink(missing_ok=True)
+
+        logger.debug(f"Compacted change log {self.log_file_path} into snapshot at sequence {sequence}.")
+
+    def compact_in_background(self) -> None:
+        """Start compacting the change log in a background thread unless a compaction is already running.
+
+        Returns:
+            None
+
+        """
+        with self.lock:
+            if self.compaction_thread is not None and self.compaction_thread.is_alive():
+                return
+            self.compaction_thread = threading.Thread(target=self.compact, name="pyobjson-journal-compaction")
+            self.compaction_thread.start()
+
+
+# journal instances shared by all journal objects in the process keyed by resolved journal directory
+_journals: Dict[str, _Journal] = {}
+_journals_lock = threading.Lock()
+
+
+class PythonObjectJsonToJournal(PythonObjectJson):
+    """PythonObjectJson subclass with built-in save/load functionality to/from a journal directory, in which each save
+    appends only the changes since the previous save to a change log that is periodically compacted into a full
+    snapshot.
+    """
+
+    def __init__(
+        self,
+        journal_directory: Union[Path, str],
+        journal_fsync_interval: int = 1,
+        journal_compaction_size: Optional[int] = JOURNAL_COMPACTION_SIZE,
+    ):
+        super().__init__(excluded_attributes=["(^journal_[A-Za-z_]*)"])
+        self.journal_directory: Path = Path(journal_directory)
+        self.journal_fsync_interval: int = journal_fsync_interval
+        self.journal_compaction_size: Optional[int] = journal_compaction_size
+
+    def _get_journal(self) -> _Journal:
+        """Retrieve the shared state of the journal, and create the journal directory and replay its snapshot and
+        change log from disk if it has not already been loaded in this process.
+
+        Returns:
+            _Journal: The shared state of the journal.
+
+        """
+        journal_directory = str(self.journal_directory.resolve())
+        with _journals_lock:
+            journal = _journals.get(journal_directory)
+            if not journal:
+                journal = _journals[journal_directory] = _Journal(self.journal_directory)
+
+        return journal
+
+    def save_to_journal(self) -> int:
+        """Save the custom Python object to the journal by appending a record of the changed attribute values (and
+        items of changed lists and dictionaries) since the previous save to the change log, and start compacting the
+        change log in the background once it exceeds the compaction size.
+
+        Returns:
+            int: Size in bytes of the appended change log record, or 0 if nothing changed since the previous save.
+
+        """
+        journal = self._get_journal()
+        with phase("save_to_journal", self) as instrumented_phase:
+            record_size = journal.append(self.serialize(), self.journal_fsync_interval)
+            if is_instrumentation_enabled():
+                instrumented_phase.record_bytes("bytes_written", record_size)
+
+        if (
+            self.journal_compaction_size is not None
+            and journal.log_file_path.stat().st_size > self.journal_compaction_size
+        ):
+            journal.compact_in_background()
+        return record_size
+
+    def load_from_journal(self) -> None:
+        """Load the custom Python object from the latest snapshot of the journal and the change log records saved
+        after it.
+
+        Returns:
+            None
+
+        """
+        journal = self._get_journal()
+        with phase("load_from_journal", self):
+            if (data := journal.load()) is None:
+                raise FileNotFoundError(f"Journal {self.journal_directory} does not contain any saved data.")
+            self.deserialize(data)
+
+    def sync_journal(self) -> None:
+        """Sync all change log records appended since the last sync to disk (when journal_fsync_interval batches
+        syncs across multiple saves).
+
+        Returns:
+            None
+
+        """
+        self._get_journal().sync()
+
+    def compact_journal(self) -> None:
+        """Fold the change log into a new snapshot of the journal (waiting for any compaction running in the background
+        to finish first).
+
+        Returns:
+            None
+
+        """
+        self._get_journal().compact()
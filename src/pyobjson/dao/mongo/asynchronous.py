@@ -0,0 +1,360 @@
+"""Python Object JSON Tool pyobjson.dao.mongo.asynchronous module.
+
+Attributes:
+    __author__ (str): Python package template author.
+    __email__ (str): Python package template author email.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import asyncio
+from logging import getLogger
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Hashable, List, Optional, Tuple, Union
+from urllib.parse import quote_plus
+from weakref import WeakKeyDictionary
+
+from bson import encode
+from bson.objectid import ObjectId
+from pymongo import AsyncMongoClient, ReturnDocument, UpdateOne
+from pymongo.asynchronous.collection import AsyncCollection
+
+from pyobjson.base import PythonObjectJson
+from pyobjson.dao.mongo.base import _saved_document_fingerprints
+from pyobjson.data import derive_fingerprint
+
+if TYPE_CHECKING:
+    from pyobjson.cache import ReadThroughCache
+
+logger = getLogger(__name__)
+
+# pooled asynchronous MongoDB clients by connection URI, per event loop (asynchronous clients are bound to the event
+# loop on which they are first used)
+_async_mongo_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, AsyncMongoClient]]" = WeakKeyDictionary()
+
+
+async def close_async_mongo_clients() -> None:
+    """Close all pooled asynchronous MongoDB clients opened on the running event loop.
+
+    Returns:
+        None
+
+    """
+    for client in _async_mongo_clients.pop(asyncio.get_running_loop(), {}).values():
+        await client.close()
+
+
+class AsyncPythonObjectJsonToMongo(PythonObjectJson):
+    """PythonObjectJson subclass with built-in asynchronous save/load functionality to/from MongoDB using pooled
+    pymongo AsyncMongoClient instances shared by all class instances with the same connection settings."""
+
+    def __init__(
+        self,
+        mongo_host: str,
+        mongo_port: int,
+        mongo_database: str,
+        mongo_user: str,
+        mongo_password: str,
+        mongo_version_field: Optional[str] = None,
+    ):
+        """Instantiate the AsyncPythonObjectJsonToMongo class.
+
+        Args:
+            mongo_host (str): MongoDB host.
+            mongo_port (int): MongoDB port.
+            mongo_database (str): MongoDB database name.
+            mongo_user (str): MongoDB user.
+            mongo_password (str): MongoDB password.
+            mongo_version_field (Optional[str], optional): Name of a document field incremented on every save and
+                used to validate class instances cached by load_from_mongo. Defaults to None.
+
+        """
+        super().__init__(excluded_attributes=["(^mongo_[A-Za-z]*)"])
+        self.mongo_host: str = mongo_host
+        self.mongo_port: int = mongo_port
+        self.mongo_database: str = mongo_database
+        self.mongo_user: str = mongo_user
+        self.mongo_password: str = mongo_password
+        self.mongo_version_field: Optional[str] = mongo_version_field
+
+    def _get_mongo_client(self) -> AsyncMongoClient:
+        """Retrieve the pooled asynchronous MongoDB client for the connection settings on the running event loop, or
+        create it if it does not exist.
+
+        Returns:
+            AsyncMongoClient: A pymongo AsyncMongoClient instance.
+
+        """
+        mongo_uri = (
+            f"mongodb://{quote_plus(self.mongo_user)}:{quote_plus(self.mongo_password)}"
+            f"@{self.mongo_host}:{self.mongo_port}/{self.mongo_database}"
+            f"?authSource=admin"
+        )
+        clients = _async_mongo_clients.setdefault(asyncio.get_running_loop(), {})
+        if (client := clients.get(mongo_uri)) is None:
+            client = clients[mongo_uri] = AsyncMongoClient(mongo_uri, serverSelectionTimeoutMS=5000)
+        return client
+
+    def _get_collection(self, mongo_collection: str) -> AsyncCollection:
+        """Retrieve a MongoDB collection (which MongoDB creates on the first write to it).
+
+        Args:
+            mongo_collection (str): The name of the MongoDB collection.
+
+        Returns:
+            AsyncCollection: A pymongo AsyncCollection instance.
+
+        """
+        return self._get_mongo_client()[self.mongo_database].get_collection(mongo_collection)
+
+    def _derive_document_key(self, mongo_collection: str, mongo_document_id: ObjectId) -> Hashable:
+        """Derive the key identifying a MongoDB document in read-through caches and saved fingerprints (matching the
+        keys derived by PythonObjectJsonToMongo).
+
+        Args:
+            mongo_collection (str): The name of the MongoDB collection containing the document.
+            mongo_document_id (ObjectId): The MongoDB document ID.
+
+        Returns:
+            Hashable: The key of the document.
+
+        """
+        return "mongo", self.mongo_host, self.mongo_port, self.mongo_database, mongo_collection, str(mongo_document_id)
+
+    @staticmethod
+    def _validate_document_id(mongo_document_id: Union[ObjectId, bytes, str]) -> ObjectId:
+        """Validate a MongoDB document ID.
+
+        Args:
+            mongo_document_id (Union[ObjectId, bytes, str]): The MongoDB document ID to validate.
+
+        Returns:
+            ObjectId: The validated MongoDB document ID.
+
+        """
+        if not ObjectId.is_valid(mongo_document_id):
+            raise ValueError(
+                f'Invalid MongoDb document ID "{mongo_document_id}". MongoDB requires document ObjectId values to '
+                f"be either 12 bytes long or a 24-character hexadecimal string."
+            )
+        return ObjectId(mongo_document_id)
+
+    async def _fetch_document_version(self, mongo_collection: str, mongo_document_id: ObjectId) -> Any:
+        """Fetch only the version field (mongo_version_field) of a MongoDB document.
+
+        Args:
+            mongo_collection (str): The name of the MongoDB collection containing the document.
+            mongo_document_id (ObjectId): The MongoDB document ID.
+
+        Returns:
+            Any: The version of the document, or None if the document or its version field does not exist.
+
+        """
+        version_document = await self._get_collection(mongo_collection).find_one(
+            {"_id": mongo_document_id}, projection={self.mongo_version_field: True}
+        )
+        return version_document.get(self.mongo_version_field) if version_document else None
+
+    async def save_to_mongo(
+        self,
+        mongo_collection: str,
+        mongo_document_id: Optional[Union[ObjectId, bytes, str]] = None,
+        cache: Optional["ReadThroughCache"] = None,
+        skip_unchanged: bool = True,
+    ) -> ObjectId:
+        """Save the custom Python object to a specified MongoDB collection.
+
+        Args:
+            mongo_collection (str): The name of the MongoDB collection into which to save the custom Python object.
+            mongo_document_id (Optional[ObjectId, bytes, str], optional): MongoDB document ID. Defaults to None, which
+                will result in a unique document ID being generated.
+            cache (Optional[ReadThroughCache], optional): Read-through cache from which to remove any cached class
+                instance of the document. Defaults to None.
+            skip_unchanged (bool, optional): Whether to skip writing the document if the fingerprint of the serialized
+                custom Python object matches the fingerprint of the data last saved to the same document by this
+                process (and, if mongo_version_field is set, the document version has not changed since). Defaults to
+                True.
+
+        Returns:
+            ObjectId: The MongoDB document ID to which the custom Python object JSON was saved.
+
+        """
+        document_id = self._validate_document_id(mongo_document_id) if mongo_document_id else ObjectId()
+
+        serializable_dict = self.serialize()
+        fingerprint = derive_fingerprint(serializable_dict) if skip_unchanged else None
+        document_key = self._derive_document_key(mongo_collection, document_id)
+        if fingerprint and mongo_document_id:
+            saved_fingerprint = _saved_document_fingerprints.get(document_key)
+            if saved_fingerprint and saved_fingerprint[0] == fingerprint:
+                if not self.mongo_version_field or saved_fingerprint[1] == await self._fetch_document_version(
+                    mongo_collection, document_id
+                ):
+                    logger.debug(f'Skipped saving unchanged data to MongoDB document "{document_id}".')
+                    return document_id
+
+        update: Dict[str, Any] = {"$set": {"custom_class": serializable_dict}}
+        if self.mongo_version_field:
+            # increment the document version so class instances cached from previous versions are invalidated
+            update["$inc"] = {self.mongo_version_field: 1}
+
+        document: Dict[str, Any] = await self._get_collection(mongo_collection).find_one_and_update(
+            {"_id": document_id},
+            update,
+            # filter out all fields besides the document ID (and the document version)
+            projection={"_id": True, **({self.mongo_version_field: True} if self.mongo_version_field else {})},
+            upsert=True,  # create a new document if it does not exist, otherwise update the existing document
+            return_document=ReturnDocument.AFTER,  # return the updated or created document after the update/creation
+        )
+        if fingerprint:
+            _saved_document_fingerprints.put(
+                document_key,
+                (fingerprint, document.get(self.mongo_version_field) if self.mongo_version_field else None),
+            )
+        if cache is not None:
+            cache.invalidate(document_key)
+        return document["_id"]
+
+    async def save_many_to_mongo(
+        self,
+        mongo_collection: str,
+        custom_objects: Dict[Union[ObjectId, bytes, str], PythonObjectJson],
+        cache: Optional["ReadThroughCache"] = None,
+    ) -> List[ObjectId]:
+        """Save multiple custom Python objects to a specified MongoDB collection in a single unordered bulk write.
+
+        Args:
+            mongo_collection (str): The name of the MongoDB collection into which to save the custom Python objects.
+            custom_objects (dict[Union[ObjectId, bytes, str], PythonObjectJson]): Dictionary with MongoDB document IDs
+                under which to save the custom Python objects as keys and custom Python objects as values.
+            cache (Optional[ReadThroughCache], optional): Read-through cache from which to remove any cached class
+                instances of the documents. Defaults to None.
+
+        Returns:
+            list[ObjectId]: The MongoDB document IDs to which the custom Python objects were saved.
+
+        """
+        document_ids = []
+        operations = []
+        for mongo_document_id, custom_object in custom_objects.items():
+            document_id = self._validate_document_id(mongo_document_id)
+            update: Dict[str, Any] = {"$set": {"custom_class": custom_object.serialize()}}
+            if self.mongo_version_field:
+                update["$inc"] = {self.mongo_version_field: 1}
+            document_ids.append(document_id)
+            operations.append(UpdateOne({"_id": document_id}, update, upsert=True))
+
+        if operations:
+            await self._get_collection(mongo_collection).bulk_write(operations, ordered=False)
+
+        for document_id in document_ids:
+            document_key = self._derive_document_key(mongo_collection, document_id)
+            # forget the fingerprints of previous saves, which no longer describe the saved documents
+            _saved_document_fingerprints.pop(document_key)
+            if cache is not None:
+                cache.invalidate(document_key)
+        return document_ids
+
+    async def load_from_mongo(
+        self,
+        mongo_collection: str,
+        mongo_document_id: Union[ObjectId, bytes, str],
+        cache: Optional["ReadThroughCache"] = None,
+    ) -> None:
+        """Load the JSON values from a specified MongoDB document ID to the custom Python object from a specified
+        MongoDB collection.
+
+        Args:
+            mongo_collection (str): The name of the MongoDB collection from which to load the custom Python object data.
+            mongo_document_id (Union[ObjectId, bytes, str]): The MongoDB document ID from which the custom Python object
+                JSON was loaded.
+            cache (Optional[ReadThroughCache], optional): Read-through cache from which to load the class instance
+                without fetching the document. If mongo_version_field is set, only the version field of the document
+                is fetched to validate the cached class instance, otherwise cached class instances are valid until
+                they expire or are invalidated (e.g. by save_to_mongo with the same cache). Defaults to None.
+
+        Returns:
+            None
+
+        """
+        document_id = self._validate_document_id(mongo_document_id)
+
+        if cache is not None:
+            cache_key = self._derive_document_key(mongo_collection, document_id)
+            cache_validator = (
+                await self._fetch_document_version(mongo_collection, document_id) if self.mongo_version_field else None
+            )
+            if (cached_instance := cache.get(cache_key, cache_validator)) is not None:
+                cache.load_into(self, cached_instance)
+                return
+
+        document = await self._get_collection(mongo_collection).find_one({"_id": document_id})
+        if not document:
+            raise KeyError(
+                f'MongoDB document "{document_id}" does not exist in collection "{mongo_collection}". Unable to load '
+                f"data."
+            )
+        self.deserialize(document.get("custom_class"))
+
+        if cache is not None:
+            cache.put(
+                cache_key,
+                document.get(self.mongo_version_field) if self.mongo_version_field else None,
+                self.clone(),
+                len(encode(document)),
+            )
+
+    async def load_many_from_mongo(
+        self, mongo_collection: str, mongo_document_ids: List[Union[ObjectId, bytes, str]]
+    ) -> Dict[ObjectId, Any]:
+        """Load multiple custom Python objects saved under specified MongoDB document IDs in a single query.
+
+        Args:
+            mongo_collection (str): The name of the MongoDB collection from which to load the custom Python objects.
+            mongo_document_ids (list[Union[ObjectId, bytes, str]]): The MongoDB document IDs under which the custom
+                Python objects were saved.
+
+        Returns:
+            dict[ObjectId, Any]: Dictionary with the requested document IDs found in the MongoDB collection as keys and
+                the custom Python objects deserialized from their saved JSON as values, in the order of the requested
+                document IDs.
+
+        """
+        document_ids = [self._validate_document_id(mongo_document_id) for mongo_document_id in mongo_document_ids]
+
+        serializable_dicts = {}
+        async for document in self._get_collection(mongo_collection).find(
+            {"_id": {"$in": document_ids}}, projection={"custom_class": True}
+        ):
+            serializable_dicts[document["_id"]] = document.get("custom_class")
+
+        return {
+            document_id: self._deserialize_new_instance(serializable_dicts[document_id])
+            for document_id in document_ids
+            if document_id in serializable_dicts
+        }
+
+    async def iter_from_mongo(
+        self, mongo_collection: str, mongo_filter: Optional[Dict[str, Any]] = None, batch_size: int = 0
+    ) -> AsyncIterator[Tuple[ObjectId, Any]]:
+        """Iterate over the custom Python objects saved in a specified MongoDB collection in document ID order using a
+        cursor, so only one batch of documents is held in memory at a time.
+
+        Args:
+            mongo_collection (str): The name of the MongoDB collection from which to load the custom Python objects.
+            mongo_filter (Optional[dict[str, Any]], optional): MongoDB query filter selecting the documents. Defaults to
+                None, which selects all documents.
+            batch_size (int, optional): Number of documents fetched per cursor batch, or 0 for the server default.
+                Defaults to 0.
+
+        Returns:
+            AsyncIterator[tuple[ObjectId, Any]]: Asynchronous iterator of MongoDB document IDs and custom Python objects
+                deserialized from their saved JSON.
+
+        """
+        cursor = self._get_collection(mongo_collection).find(
+            mongo_filter or {}, projection={"custom_class": True}, sort=[("_id", 1)], batch_size=batch_size
+        )
+        async for document in cursor:
+            yield document["_id"], self._deserialize_new_instance(document.get("custom_class"))
@@ -12,29 +12,58 @@ __email__ = "dev@wrencode.com"
 import os
 import sys
 from logging import getLogger
-from typing import Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Optional, Union
 from urllib.parse import quote_plus
 
+from bson import encode
 from bson.objectid import ObjectId
 from pymongo import MongoClient
 from pymongo.collection import Collection, ReturnDocument
 from pymongo.errors import OperationFailure, ServerSelectionTimeoutError
 
-from pyobjson.base import PythonObjectJson
+from pyobjson.base import PythonObjectJson, _SavedFingerprints
+from pyobjson.data import derive_fingerprint
+
+if TYPE_CHECKING:
+    from pyobjson.cache import ReadThroughCache
 
 logger = getLogger(__name__)
 
+# fingerprints and versions of the serialized data last saved by save_to_mongo by document key
+_saved_document_fingerprints = _SavedFingerprints()
+
 
 class PythonObjectJsonToMongo(PythonObjectJson):
     """PythonObjectJson subclass with built-in save/load functionality to/from MongoDB."""
 
-    def __init__(self, mongo_host: str, mongo_port: int, mongo_database: str, mongo_user: str, mongo_password: str):
+    def __init__(
+        self,
+        mongo_host: str,
+        mongo_port: int,
+        mongo_database: str,
+        mongo_user: str,
+        mongo_password: str,
+        mongo_version_field: Optional[str] = None,
+    ):
+        """Instantiate the PythonObjectJsonToMongo class.
+
+        Args:
+            mongo_host (str): MongoDB host.
+            mongo_port (int): MongoDB port.
+            mongo_database (str): MongoDB database name.
+            mongo_user (str): MongoDB user.
+            mongo_password (str): MongoDB password.
+            mongo_version_field (Optional[str], optional): Name of a document field incremented on every save and
+                used to validate class instances cached by load_from_mongo. Defaults to None.
+
+        """
         super().__init__(excluded_attributes=["(^mongo_[A-Za-z]*)"])
         self.mongo_host: str = mongo_host
         self.mongo_port: int = mongo_port
         self.mongo_database: str = mongo_database
         self.mongo_user: str = mongo_user
         self.mongo_password: str = mongo_password
+        self.mongo_version_field: Optional[str] = mongo_version_field
 
     def _get_mongo_client(self):
         """Create a MongoDB connection.
@@ -73,6 +102,37 @@ class PythonObjectJsonToMongo(PythonObjectJson):
 
         return db.get_collection(mongo_collection)
 
+    def _derive_document_key(self, mongo_collection: str, mongo_document_id: ObjectId) -> Hashable:
+        """Derive the key identifying a MongoDB document in read-through caches and saved fingerprints.
+
+        Args:
+            mongo_collection (str): The name of the MongoDB collection containing the document.
+            mongo_document_id (ObjectId): The MongoDB document ID.
+
+        Returns:
+            Hashable: The key of the document.
+
+        """
+        return "mongo", self.mongo_host, self.mongo_port, self.mongo_database, mongo_collection, str(mongo_document_id)
+
+    def _fetch_document_version(self, mongo_collection: str, mongo_document_id: ObjectId) -> Any:
+        """Fetch only the version field (mongo_version_field) of a MongoDB document.
+
+        Args:
+            mongo_collection (str): The name of the MongoDB collection containing the document.
+            mongo_document_id (ObjectId): The MongoDB document ID.
+
+        Returns:
+            Any: The version of the document, or None if the document or its version field does not exist.
+
+        """
+        version_document = (
+            self._get_mongo_client()[self.mongo_database]
+            .get_collection(mongo_collection)
+            .find_one({"_id": mongo_document_id}, projection={self.mongo_version_field: True})
+        )
+        return version_document.get(self.mongo_version_field) if version_document else None
+
     @staticmethod
     def _validate_document_id(mongo_document_id: Union[ObjectId, bytes, str]) -> None:
         """This method checks to see if a given MongoDB document ID is valid.
@@ -92,7 +152,11 @@ class PythonObjectJsonToMongo(PythonObjectJson):
             sys.exit(1)
 
     def save_to_mongo(
-        self, mongo_collection: str, mongo_document_id: Optional[Union[ObjectId, bytes, str]] = None
+        self,
+        mongo_collection: str,
+        mongo_document_id: Optional[Union[ObjectId, bytes, str]] = None,
+        cache: Optional["ReadThroughCache"] = None,
+        skip_unchanged: bool = True,
     ) -> ObjectId:
         """Save the custom Python object to a specified MongoDB collection.
 
@@ -100,6 +164,12 @@ class PythonObjectJsonToMongo(PythonObjectJson):
             mongo_collection (str): The name of the MongoDB collection into which to save the custom Python object.
             mongo_document_id (Optional[ObjectId, bytes, str], optional): MongoDB document ID. Defaults to None, which
                 will result in MongoDB automatically generating a unique document ID.
+            cache (Optional[ReadThroughCache], optional): Read-through cache from which to remove any cached class
+                instance of the document. Defaults to None.
+            skip_unchanged (bool, optional): Whether to skip writing the document if the fingerprint of the serialized
+                custom Python object matches the fingerprint of the data last saved to the same document by this
+                process (and, if mongo_version_field is set, the document version has not changed since). Defaults to
+                True.
 
         Returns:
             ObjectId: The MongoDB document ID to which the custom Python object JSON was saved.
@@ -109,17 +179,50 @@ class PythonObjectJsonToMongo(PythonObjectJson):
         if mongo_document_id:
             self._validate_document_id(mongo_document_id)
 
+        serializable_dict = self.serialize()
+        fingerprint = derive_fingerprint(serializable_dict) if skip_unchanged else None
+        if fingerprint and mongo_document_id:
+            document_id = ObjectId(mongo_document_id)
+            saved_fingerprint = _saved_document_fingerprints.get(
+                self._derive_document_key(mongo_collection, document_id)
+            )
+            if saved_fingerprint and saved_fingerprint[0] == fingerprint:
+                if not self.mongo_version_field or saved_fingerprint[1] == self._fetch_document_version(
+                    mongo_collection, document_id
+                ):
+                    logger.debug(f'Skipped saving unchanged data to MongoDB document "{document_id}".')
+                    return document_id
+
+        update: Dict[str, Any] = {"$set": {"custom_class": serializable_dict}}
+        if self.mongo_version_field:
+            # increment the document version so class instances cached from previous versions are invalidated
+            update["$inc"] = {self.mongo_version_field: 1}
+
         collection = self._validate_or_create_collection(mongo_collection)
         document: Dict[str, Any] = collection.find_one_and_update(
             {"_id": ObjectId(mongo_document_id) if mongo_document_id else ObjectId()},
-            {"$set": {"custom_class": self.serialize()}},
-            projection={"_id": True},  # filter out all fields besides the document ID
+            update,
+            # filter out all fields besides the document ID (and the document version)
+            projection={"_id": True, **({self.mongo_version_field: True} if self.mongo_version_field else {})},
             upsert=True,  # create a new document if it does not exist, otherwise update the existing document
             return_document=ReturnDocument.AFTER,  # return the updated or created document after the update/creation
         )
+        document_key = self._derive_document_key(mongo_collection, document["_id"])
+        if fingerprint:
+            _saved_document_fingerprints.put(
+                document_key,
+                (fingerprint, document.get(self.mongo_version_field) if self.mongo_version_field else None),
+            )
+        if cache is not None:
+            cache.invalidate(document_key)
         return document["_id"]
 
-    def load_from_mongo(self, mongo_collection: str, mongo_document_id: Union[ObjectId, bytes, str]) -> None:
+    def load_from_mongo(
+        self,
+        mongo_collection: str,
+        mongo_document_id: Union[ObjectId, bytes, str],
+        cache: Optional["ReadThroughCache"] = None,
+    ) -> None:
         """Load the JSON values from a specified MongoDB document ID to the custom Python object from a specified
         MongoDB collection.
 
@@ -127,17 +230,40 @@ class PythonObjectJsonToMongo(PythonObjectJson):
             mongo_collection (str): The name of the MongoDB collection from which to load the custom Python object data.
             mongo_document_id (Union[ObjectId, bytes, str]): The MongoDB document ID from which the custom Python object
                 JSON was loaded.
+            cache (Optional[ReadThroughCache], optional): Read-through cache from which to load the class instance
+                without fetching the document. If mongo_version_field is set, only the version field of the document
+                is fetched to validate the cached class instance, otherwise cached class instances are valid until
+                they expire or are invalidated (e.g. by save_to_mongo with the same cache). Defaults to None.
 
         Returns:
             None
 
         """
         self._validate_document_id(mongo_document_id)
+        document_id = ObjectId(mongo_document_id)
+
+        if cache is not None:
+            cache_key = self._derive_document_key(mongo_collection, document_id)
+            cache_validator = (
+                self._fetch_document_version(mongo_collection, document_id) if self.mongo_version_field else None
+            )
+            if (cached_instance := cache.get(cache_key, cache_validator)) is not None:
+                cache.load_into(self, cached_instance)
+                return
 
         # get MongoDb collection
         collection = self._validate_or_create_collection(mongo_collection)
 
-        self.deserialize(collection.find_one({"_id": ObjectId(mongo_document_id)}).get("custom_class"))
+        document = collection.find_one({"_id": document_id})
+        self.deserialize(document.get("custom_class"))
+
+        if cache is not None:
+            cache.put(
+                cache_key,
+                document.get(self.mongo_version_field) if self.mongo_version_field else None,
+                self.clone(),
+                len(encode(document)),
+            )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,435 @@
+"""Python Object JSON Tool pyobjson.dao.snapshots module.
+
+Attributes:
+    __author__ (str): Python package template author.
+    __email__ (str): Python package template author email.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
+from logging import getLogger
+from pathlib import Path
+from tempfile import mkstemp
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from uuid import uuid4
+
+from pyobjson.base import PythonObjectJson
+
+logger = getLogger(__name__)
+
+# name of the directory containing the content-addressed blob files in the root directory of each snapshot store
+SNAPSHOT_STORE_BLOBS_DIRECTORY_NAME = "blobs"
+
+# name of the directory containing the snapshot files in the root directory of each snapshot store
+SNAPSHOT_STORE_SNAPSHOTS_DIRECTORY_NAME = "snapshots"
+
+# maximum number of reassembled blobs (and of checksums of blobs known to exist) kept in the in-memory cache shared by
+# all objects of each snapshot store
+SNAPSHOT_STORE_CACHE_MAX_SIZE = 65536
+
+# keys of the marker dictionaries of blob references, where serialized dictionaries with one of them as their only key
+# are stored as {"$escape": <dictionary>} so they are never loaded as blob references
+_MARKER_KEYS = frozenset(("$blob", "$escape"))
+
+# snapshot store stack operations
+_VISIT = "visit"  # find the custom class instances in serialized data
+_STORE = "store"  # store a serialized custom class instance as a blob after its nested instances are stored
+
+
+class _SnapshotStoreCache(object):
+    """In-memory cache shared by all objects of a snapshot store with the checksums of recently used blobs known to
+    exist and the serializable data reassembled from recently loaded blobs.
+    """
+
+    def __init__(self):
+        self.known_blobs: "OrderedDict[str, None]" = OrderedDict()
+        self.reassembled_blobs: "OrderedDict[str, Any]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def _remember_blobs(self, blob_checksums: Iterable[str]) -> None:
+        """Record the checksums of blobs known to exist and evict the least recently used checksums over the limit. The
+        lock must be held by the caller.
+
+        Args:
+            blob_checksums (Iterable[str]): The checksums of the blobs.
+
+        Returns:
+            None
+
+        """
+        for blob_checksum in blob_checksums:
+            self.known_blobs[blob_checksum] = None
+            self.known_blobs.move_to_end(blob_checksum)
+        while len(self.known_blobs) > SNAPSHOT_STORE_CACHE_MAX_SIZE:
+            self.known_blobs.popitem(last=False)
+
+    def is_known(self, blob_checksum: str) -> bool:
+        """Check if a blob is known to exist in the snapshot store without checking the file system.
+
+        Args:
+            blob_checksum (str): The checksum of the blob.
+
+        Returns:
+            bool: Whether the blob is known to exist.
+
+        """
+        with self.lock:
+            if blob_checksum not in self.known_blobs:
+                return False
+            self.known_blobs.move_to_end(blob_checksum)
+            return True
+
+    def add_known(self, blob_checksums: Iterable[str]) -> None:
+        """Record the checksums of blobs known to exist in the snapshot store.
+
+        Args:
+            blob_checksums (Iterable[str]): The checksums of the blobs.
+
+        Returns:
+            None
+
+        """
+        with self.lock:
+            self._remember_blobs(blob_checksums)
+
+    def get(self, blob_checksum: str) -> Optional[Any]:
+        """Retrieve the serializable data reassembled from a blob if it is cached.
+
+        Args:
+            blob_checksum (str): The checksum of the blob.
+
+        Returns:
+            Optional[Any]: The serializable data reassembled from the blob, or None if it is not cached.
+
+        """
+        with self.lock:
+            reassembled_blob = self.reassembled_blobs.get(blob_checksum)
+            if reassembled_blob is not None:
+                self.reassembled_blobs.move_to_end(blob_checksum)
+            return reassembled_blob
+
+    def put(self, blob_checksum: str, reassembled_blob: Any) -> None:
+        """Cache the serializable data reassembled from a blob and evict the least recently used blobs over the limit.
+
+        Args:
+            blob_checksum (str): The checksum of the blob.
+            reassembled_blob (Any): The serializable data reassembled from the blob, which must never be modified.
+
+        Returns:
+            None
+
+        """
+        with self.lock:
+            self._remember_blobs((blob_checksum,))
+            self.reassembled_blobs[blob_checksum] = reassembled_blob
+            self.reassembled_blobs.move_to_end(blob_checksum)
+            while len(self.reassembled_blobs) > SNAPSHOT_STORE_CACHE_MAX_SIZE:
+                self.reassembled_blobs.popitem(last=False)
+
+
+# cache instances shared by all snapshot store objects in the process keyed by resolved snapshot store directory
+_snapshot_store_caches: Dict[str, _SnapshotStoreCache] = {}
+_snapshot_store_caches_lock = threading.Lock()
+
+
+def _find_blob_references(blob: Any) -> List[Tuple[Any, Any, str]]:
+    """Find the references to nested blobs ({"$blob": <checksum>} values) in the serializable data of a blob, and
+    restore the escaped dictionaries ({"$escape": <dictionary>} values) of the blob in place.
+
+    Args:
+        blob (Any): Serializable data of a blob.
+
+    Returns:
+        list[tuple[Any, Any, str]]: List of the containers, keys or indices in those containers, and checksums of all
+            references to nested blobs.
+
+    """
+    blob_references = []
+    stack = [blob]
+    while stack:
+        value = stack.pop()
+        for key, item in value.items() if type(value) is dict else enumerate(value):
+            if type(item) is dict:
+                if len(item) == 1 and type(blob_checksum := item.get("$blob")) is str:
+                    blob_references.append((value, key, blob_checksum))
+                elif len(item) == 1 and type(escaped_item := item.get("$escape")) is dict:
+                    # restore escaped dictionaries without interpreting their own keys as markers
+                    value[key] = escaped_item
+                    stack.append(escaped_item)
+                else:
+                    stack.append(item)
+            elif type(item) is list:
+                stack.append(item)
+    return blob_references
+
+
+class PythonObjectJsonToSnapshotStore(PythonObjectJson):
+    """PythonObjectJson subclass with built-in save/load functionality to/from a content-addressed snapshot store, in
+    which every serialized custom class instance is saved once as a blob named after its checksum, and every snapshot
+    only references the blob of its root custom class instance.
+    """
+
+    def __init__(self, snapshot_store_directory: Union[Path, str], snapshot_store_max_workers: Optional[int] = None):
+        super().__init__(excluded_attributes=["(^snapshot_store_[A-Za-z_]*)"])
+        self.snapshot_store_directory: Path = Path(snapshot_store_directory)
+        self.snapshot_store_max_workers: Optional[int] = snapshot_store_max_workers
+
+    def _get_snapshot_store_cache(self) -> _SnapshotStoreCache:
+        """Retrieve the shared in-memory cache of the snapshot store, and create the snapshot store directories if the
+        cache has not already been created in this process.
+
+        Returns:
+            _SnapshotStoreCache: The in-memory cache of the snapshot store.
+
+        """
+        snapshot_store_directory = str(self.snapshot_store_directory.resolve())
+        with _snapshot_store_caches_lock:
+            snapshot_store_cache = _snapshot_store_caches.get(snapshot_store_directory)
+            if not snapshot_store_cache:
+                (self.snapshot_store_directory / SNAPSHOT_STORE_BLOBS_DIRECTORY_NAME).mkdir(parents=True, exist_ok=True)
+                (self.snapshot_store_directory / SNAPSHOT_STORE_SNAPSHOTS_DIRECTORY_NAME).mkdir(
+                    parents=True, exist_ok=True
+                )
+                snapshot_store_cache = _snapshot_store_caches[snapshot_store_directory] = _SnapshotStoreCache()
+
+        return snapshot_store_cache
+
+    def _derive_blob_file_path(self, blob_checksum: str) -> Path:
+        """Derive the sharded blob file path for a given blob checksum.
+
+        Args:
+            blob_checksum (str): The checksum of the blob for which to derive a file path.
+
+        Returns:
+            Path: Blob file path in the format blobs/ab/abcd....json.
+
+        """
+        return (
+            self.snapshot_store_directory
+            / SNAPSHOT_STORE_BLOBS_DIRECTORY_NAME
+            / blob_checksum[:2]
+            / f"{blob_checksum}.json"
+        )
+
+    @staticmethod
+    def _write_file(file_path: Path, file_bytes: bytes) -> None:
+        """Atomically write a file using a temporary file and a rename.
+
+        Args:
+            file_path (Path): The path of the file to write.
+            file_bytes (bytes): The contents of the file.
+
+        Returns:
+            None
+
+        """
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file_descriptor, temp_file_path = mkstemp(dir=file_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(temp_file_descriptor, "wb") as temp_file_out:
+                temp_file_out.write(file_bytes)
+            os.replace(temp_file_path, file_path)
+        except BaseException:
+            Path(temp_file_path).unlink(missing_ok=True)
+            raise
+
+    def _store_blobs(
+        self, serializable_data: Dict[str, Any], snapshot_store_cache: _SnapshotStoreCache
+    ) -> Tuple[str, Dict[str, bytes]]:
+        """Replace every serialized custom class instance (starting with the most deeply nested instances) with a
+        reference to the blob named after the checksum of its JSON, and collect the blobs that do not exist yet.
+        Dictionaries whose only key is "$blob" or "$escape" are escaped as {"$escape": <dictionary>}.
+
+        Args:
+            serializable_data (dict[str, Any]): Serializable dictionary of a custom class instance (as returned by
+                serialize) to modify in place.
+            snapshot_store_cache (_SnapshotStoreCache): The in-memory cache of the snapshot store.
+
+        Returns:
+            tuple[str, dict[str, bytes]]: The checksum of the root blob, and a dictionary with the checksums of new
+                blobs as keys and their JSON as values.
+
+        """
+        class_keys = set(self._base_subclasses())
+        new_blobs = {}
+
+        root = [serializable_data]
+        # use an explicit stack of pending operations instead of recursion to support arbitrarily deep serialized data,
+        # where each custom class instance is stored only after all of its nested custom class instances are stored
+        stack: List[Tuple[str, Any, Any]] = [(_VISIT, root, 0)]
+        while stack:
+            operation, container, key = stack.pop()
+            value = container[key]
+
+            if operation == _STORE:
+                blob_bytes = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+                blob_checksum = sha256(blob_bytes).hexdigest()
+                if blob_checksum not in new_blobs and not snapshot_store_cache.is_known(blob_checksum):
+                    if self._derive_blob_file_path(blob_checksum).exists():
+                        snapshot_store_cache.add_known((blob_checksum,))
+                    else:
+                        new_blobs[blob_checksum] = blob_bytes
+                container[key] = {"$blob": blob_checksum}
+                continue
+
+            if type(value) is dict:
+                if len(value) == 1 and next(iter(value)) in class_keys:
+                    stack.append((_STORE, container, key))
+                elif len(value) == 1 and not _MARKER_KEYS.isdisjoint(value):
+                    # escape dictionaries that would otherwise be loaded as blob references
+                    container[key] = {"$escape": value}
+                stack.extend((_VISIT, value, k) for k, v in value.items() if type(v) in (dict, list))
+            elif type(value) is list:
+                stack.extend((_VISIT, value, i) for i, v in enumerate(value) if type(v) in (dict, list))
+
+        return root[0]["$blob"], new_blobs
+
+    def save_to_snapshot_store(self, snapshot_name: Optional[str] = None) -> str:
+        """Save the custom Python object as a snapshot to the snapshot store, writing only the blobs of serialized
+        custom class instances that do not already exist in the snapshot store.
+
+        Args:
+            snapshot_name (Optional[str], optional): Name under which to save the snapshot. Defaults to None, which will
+                result in a unique name being generated.
+
+        Returns:
+            str: The name under which the snapshot was saved.
+
+        """
+        snapshot_name = snapshot_name or uuid4().hex
+        snapshot_store_cache = self._get_snapshot_store_cache()
+
+        root_blob_checksum, new_blobs = self._store_blobs(self.serialize(), snapshot_store_cache)
+        with ThreadPoolExecutor(max_workers=self.snapshot_store_max_workers) as executor:
+            list(
+                executor.map(
+                    lambda blob_item: self._write_file(self._derive_blob_file_path(blob_item[0]), blob_item[1]),
+                    new_blobs.items(),
+                )
+            )
+        snapshot_store_cache.add_known(new_blobs)
+
+        # write the snapshot file referencing the root blob only after all blobs are written
+        self._write_file(
+            self.snapshot_store_directory / SNAPSHOT_STORE_SNAPSHOTS_DIRECTORY_NAME / f"{snapshot_name}.json",
+            json.dumps({"root": root_blob_checksum, "blobs_written": len(new_blobs)}).encode("utf-8"),
+        )
+        logger.debug(f'Saved snapshot "{snapshot_name}" with {len(new_blobs)} new blobs.')
+        return snapshot_name
+
+    def _read_blob(self, blob_checksum: str) -> Any:
+        """Read the serializable data of a blob file and verify its checksum.
+
+        Args:
+            blob_checksum (str): The checksum of the blob.
+
+        Returns:
+            Any: The serializable data of the blob.
+
+        """
+        with open(self._derive_blob_file_path(blob_checksum), "rb") as blob_file_in:
+            blob_bytes = blob_file_in.read()
+
+        if sha256(blob_bytes).hexdigest() != blob_checksum:
+            raise ValueError(f'Snapshot store blob "{blob_checksum}" does not match its checksum.')
+        return json.loads(blob_bytes)
+
+    def _reassemble_blob(self, root_blob_checksum: str, snapshot_store_cache: _SnapshotStoreCache) -> Any:
+        """Reassemble the serializable data of a blob and all of its nested blobs, reading the blobs that are not in
+        the shared in-memory cache in parallel.
+
+        Args:
+            root_blob_checksum (str): The checksum of the blob to reassemble.
+            snapshot_store_cache (_SnapshotStoreCache): The in-memory cache of the snapshot store.
+
+        Returns:
+            Any: The serializable data reassembled from the blob, which is shared with the cache and must never be
+                modified.
+
+        """
+        reassembled_blobs: Dict[str, Any] = {}
+        blobs: Dict[str, Any] = {}
+        blob_references: Dict[str, List[Tuple[Any, Any, str]]] = {}
+
+        # read all uncached blobs breadth-first, one level of nesting at a time
+        level = [root_blob_checksum]
+        with ThreadPoolExecutor(max_workers=self.snapshot_store_max_workers) as executor:
+            while level:
+                uncached_level = []
+                for blob_checksum in level:
+                    if (reassembled_blob := snapshot_store_cache.get(blob_checksum)) is not None:
+                        reassembled_blobs[blob_checksum] = reassembled_blob
+                    else:
+                        uncached_level.append(blob_checksum)
+
+                next_level = {}
+                for blob_checksum, blob in zip(uncached_level, executor.map(self._read_blob, uncached_level)):
+                    blobs[blob_checksum] = blob
+                    blob_references[blob_checksum] = _find_blob_references(blob)
+                    for _, _, nested_blob_checksum in blob_references[blob_checksum]:
+                        if nested_blob_checksum not in blobs and nested_blob_checksum not in reassembled_blobs:
+                            next_level[nested_blob_checksum] = None
+                level = list(next_level)
+
+        # reassemble the blobs depth-first, each only after all of its nested blobs have been reassembled
+        stack = [(root_blob_checksum, False)]
+        while stack:
+            blob_checksum, nested_blobs_reassembled = stack.pop()
+            if blob_checksum in reassembled_blobs:
+                continue
+            if nested_blobs_reassembled:
+                for container, key, nested_blob_checksum in blob_references[blob_checksum]:
+                    container[key] = reassembled_blobs[nested_blob_checksum]
+                reassembled_blobs[blob_checksum] = blobs[blob_checksum]
+                snapshot_store_cache.put(blob_checksum, blobs[blob_checksum])
+                continue
+            stack.append((blob_checksum, True))
+            stack.extend((nested_blob_checksum, False) for _, _, nested_blob_checksum in blob_references[blob_checksum])
+
+        return reassembled_blobs[root_blob_checksum]
+
+    def load_from_snapshot_store(self, snapshot_name: str) -> None:
+        """Load a snapshot saved under a specified name in the snapshot store to the custom Python object.
+
+        Args:
+            snapshot_name (str): The name under which the snapshot was saved.
+
+        Returns:
+            None
+
+        """
+        snapshot_file_path = (
+            self.snapshot_store_directory / SNAPSHOT_STORE_SNAPSHOTS_DIRECTORY_NAME / f"{snapshot_name}.json"
+        )
+        if not snapshot_file_path.exists():
+            raise KeyError(
+                f'Snapshot "{snapshot_name}" does not exist in snapshot store "{self.snapshot_store_directory}". '
+                f"Unable to load."
+            )
+
+        with open(snapshot_file_path, "rb") as snapshot_file_in:
+            snapshot = json.loads(snapshot_file_in.read())
+        self.deserialize(self._reassemble_blob(snapshot["root"], self._get_snapshot_store_cache()))
+
+    def list_snapshot_store_snapshots(self) -> List[str]:
+        """List the names of all snapshots saved in the snapshot store ordered by the time they were saved.
+
+        Returns:
+            list[str]: The names of all saved snapshots.
+
+        """
+        snapshots_directory = self.snapshot_store_directory / SNAPSHOT_STORE_SNAPSHOTS_DIRECTORY_NAME
+        return [
+            snapshot_file_path.stem
+            for snapshot_file_path in sorted(
+                snapshots_directory.glob("*.json"), key=lambda snapshot_file_path: snapshot_file_path.stat().st_mtime
+            )
+        ]
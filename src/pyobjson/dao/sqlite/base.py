@@ -0,0 +1,257 @@
+"""Python Object JSON Tool pyobjson.dao.sqlite module.
+
+Attributes:
+    __author__ (str): Python package template author.
+    __email__ (str): Python package template author email.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import json
+import sqlite3
+import threading
+import zlib
+from logging import getLogger
+from pathlib import Path
+from re import fullmatch
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from uuid import uuid4
+
+from pyobjson.base import PythonObjectJson
+
+logger = getLogger(__name__)
+
+# supported SQLite payload storage formats (JSON text, UTF-8 encoded JSON bytes, and zlib-compressed JSON bytes)
+SQLITE_PAYLOAD_FORMATS = ("json", "binary", "zlib")
+
+# maximum number of bound parameters used in a single SQLite query (SQLite versions before 3.32.0 allow at most 999)
+SQLITE_MAX_QUERY_PARAMETERS = 900
+
+# per-thread storage of persistent SQLite connections (SQLite connections cannot be shared across threads by default)
+_thread_local = threading.local()
+
+
+def close_sqlite_connections() -> None:
+    """Close all persistent SQLite connections opened by the current thread.
+
+    Returns:
+        None
+
+    """
+    for connection in getattr(_thread_local, "connections", {}).values():
+        connection.close()
+    _thread_local.connections = {}
+    _thread_local.tables = set()
+
+
+class PythonObjectJsonToSqlite(PythonObjectJson):
+    """PythonObjectJson subclass with built-in save/load functionality to/from SQLite."""
+
+    def __init__(self, sqlite_database_path: Union[Path, str], sqlite_payload_format: str = "json"):
+        super().__init__(excluded_attributes=["(^sqlite_[A-Za-z_]*)"])
+        if sqlite_payload_format not in SQLITE_PAYLOAD_FORMATS:
+            raise ValueError(
+                f'Invalid SQLite payload format "{sqlite_payload_format}". Supported formats: {SQLITE_PAYLOAD_FORMATS}.'
+            )
+        self.sqlite_database_path: Path = Path(sqlite_database_path)
+        self.sqlite_payload_format: str = sqlite_payload_format
+
+    def _get_sqlite_connection(self) -> sqlite3.Connection:
+        """Retrieve the persistent SQLite connection for the current thread, and create it (with write-ahead logging
+        enabled) if it does not exist.
+
+        Returns:
+            sqlite3.Connection: A sqlite3 Connection instance.
+
+        """
+        if not hasattr(_thread_local, "connections"):
+            _thread_local.connections = {}
+            _thread_local.tables = set()
+
+        database_path = str(self.sqlite_database_path.resolve())
+        connection = _thread_local.connections.get(database_path)
+        if not connection:
+            if not self.sqlite_database_path.exists():
+                self.sqlite_database_path.parent.mkdir(parents=True, exist_ok=True)
+
+            connection = sqlite3.connect(database_path)
+            # write-ahead logging allows concurrent readers during writes and avoids rewriting pages on every commit
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            _thread_local.connections[database_path] = connection
+
+        return connection
+
+    def _validate_or_create_table(self, sqlite_table: str) -> sqlite3.Connection:
+        """Check if a given SQLite table name is valid and create the table if it does not exist.
+
+        Args:
+            sqlite_table (str): The name of the SQLite table for which to check existence or create.
+
+        Returns:
+            sqlite3.Connection: A sqlite3 Connection instance for the database containing the table.
+
+        """
+        # table names cannot be bound as query parameters, so only allow plain identifiers
+        if not fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", sqlite_table):
+            raise ValueError(
+                f'Invalid SQLite table name "{sqlite_table}". Table names may only contain letters, digits, and '
+                f"underscores, and may not start with a digit."
+            )
+
+        connection = self._get_sqlite_connection()
+        table_key = (str(self.sqlite_database_path.resolve()), sqlite_table)
+        if table_key not in _thread_local.tables:
+            with connection:
+                connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {sqlite_table} "
+                    f"(key TEXT PRIMARY KEY, payload_format TEXT NOT NULL, payload BLOB NOT NULL)"
+                )
+            _thread_local.tables.add(table_key)
+
+        return connection
+
+    def _encode_payload(self, serializable_dict: Dict[str, Any]) -> Union[str, bytes]:
+        """Encode a serializable dictionary into the configured SQLite payload format.
+
+        Args:
+            serializable_dict (dict[str, Any]): Serializable dictionary representing a class instance.
+
+        Returns:
+            Union[str, bytes]: JSON string or (optionally compressed) JSON bytes.
+
+        """
+        if self.sqlite_payload_format == "json":
+            return json.dumps(serializable_dict, ensure_ascii=False)
+
+        json_bytes = json.dumps(serializable_dict, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        if self.sqlite_payload_format == "zlib":
+            return zlib.compress(json_bytes)
+        return json_bytes
+
+    @staticmethod
+    def _decode_payload(payload_format: str, payload: Union[str, bytes]) -> Dict[str, Any]:
+        """Decode a stored SQLite payload into a serializable dictionary.
+
+        Args:
+            payload_format (str): The format in which the payload was stored.
+            payload (Union[str, bytes]): The stored payload.
+
+        Returns:
+            dict[str, Any]: Serializable dictionary representing a class instance.
+
+        """
+        if payload_format == "zlib":
+            payload = zlib.decompress(payload)
+        return json.loads(payload)
+
+    def save_to_sqlite(self, sqlite_table: str, sqlite_key: Optional[str] = None) -> str:
+        """Save the custom Python object to a specified SQLite table.
+
+        Args:
+            sqlite_table (str): The name of the SQLite table into which to save the custom Python object.
+            sqlite_key (Optional[str], optional): Key under which to save the custom Python object. Defaults to None,
+                which will result in a unique key being generated.
+
+        Returns:
+            str: The key under which the custom Python object was saved.
+
+        """
+        return self.save_many_to_sqlite(sqlite_table, {sqlite_key or uuid4().hex: self})[0]
+
+    def save_many_to_sqlite(self, sqlite_table: str, custom_objects: Dict[str, PythonObjectJson]) -> List[str]:
+        """Save multiple custom Python objects to a specified SQLite table in a single transaction.
+
+        Args:
+            sqlite_table (str): The name of the SQLite table into which to save the custom Python objects.
+            custom_objects (dict[str, PythonObjectJson]): Dictionary with keys under which to save the custom Python
+                objects as keys and custom Python objects as values.
+
+        Returns:
+            list[str]: The keys under which the custom Python objects were saved.
+
+        """
+        connection = self._validate_or_create_table(sqlite_table)
+        rows = [
+            (key, self.sqlite_payload_format, self._encode_payload(custom_object.serialize()))
+            for key, custom_object in custom_objects.items()
+        ]
+        with connection:
+            connection.executemany(
+                # update existing rows in place instead of deleting and reinserting them with a new rowid
+                f"INSERT INTO {sqlite_table} (key, payload_format, payload) VALUES (?, ?, ?) "  # nosec B608
+                "ON CONFLICT(key) DO UPDATE SET payload_format = excluded.payload_format, payload = excluded.payload",
+                rows,
+            )
+        return list(custom_objects.keys())
+
+    def load_from_sqlite(self, sqlite_table: str, sqlite_key: str) -> None:
+        """Load the JSON values saved under a specified key in a specified SQLite table to the custom Python object.
+
+        Args:
+            sqlite_table (str): The name of the SQLite table from which to load the custom Python object data.
+            sqlite_key (str): The key under which the custom Python object JSON was saved.
+
+        Returns:
+            None
+
+        """
+        connection = self._validate_or_create_table(sqlite_table)
+        row = connection.execute(
+            f"SELECT payload_format, payload FROM {sqlite_table} WHERE key = ?",  # nosec B608
+            (sqlite_key,),
+        ).fetchone()
+        if not row:
+            raise KeyError(f'Key "{sqlite_key}" does not exist in SQLite table "{sqlite_table}". Unable to load data.')
+
+        self.deserialize(self._decode_payload(*row))
+
+    def load_many_from_sqlite(self, sqlite_table: str, sqlite_keys: List[str]) -> Dict[str, Any]:
+        """Load multiple custom Python objects saved under specified keys in a specified SQLite table.
+
+        Args:
+            sqlite_table (str): The name of the SQLite table from which to load the custom Python objects.
+            sqlite_keys (list[str]): The keys under which the custom Python objects were saved.
+
+        Returns:
+            dict[str, Any]: Dictionary with the requested keys found in the SQLite table as keys and the custom Python
+                objects deserialized from their saved JSON as values, in the order of the requested keys.
+
+        """
+        connection = self._validate_or_create_table(sqlite_table)
+
+        rows = {}
+        for i in range(0, len(sqlite_keys), SQLITE_MAX_QUERY_PARAMETERS):
+            keys_chunk = sqlite_keys[i : i + SQLITE_MAX_QUERY_PARAMETERS]
+            rows.update(
+                {
+                    key: (payload_format, payload)
+                    for key, payload_format, payload in connection.execute(
+                        f"SELECT key, payload_format, payload FROM {sqlite_table} "  # nosec B608
+                        f"WHERE key IN ({','.join('?' * len(keys_chunk))})",
+                        keys_chunk,
+                    )
+                }
+            )
+
+        return {
+            key: self._deserialize_new_instance(self._decode_payload(*rows[key])) for key in sqlite_keys if key in rows
+        }
+
+    def iter_from_sqlite(self, sqlite_table: str) -> Iterator[Tuple[str, Any]]:
+        """Iterate over all custom Python objects saved in a specified SQLite table in the order they were first saved.
+
+        Args:
+            sqlite_table (str): The name of the SQLite table from which to load the custom Python objects.
+
+        Returns:
+            Iterator[tuple[str, Any]]: Iterator of keys and custom Python objects deserialized from their saved JSON.
+
+        """
+        connection = self._validate_or_create_table(sqlite_table)
+        for key, payload_format, payload in connection.execute(
+            f"SELECT key, payload_format, payload FROM {sqlite_table} ORDER BY rowid"  # nosec B608
+        ):
+            yield key, self._deserialize_new_instance(self._decode_payload(payload_format, payload))
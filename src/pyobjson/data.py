@@ -9,26 +9,57 @@ Attributes:
 __author__ = "Wren J. Rudolph for Wrencode, LLC"
 __email__ = "dev@wrencode.com"
 
-import json
 import sys
-from re import search
-from base64 import b64decode, b64encode
-from datetime import datetime
-from importlib import import_module
-from inspect import getfullargspec, isfunction, ismethod
+from datetime import date, datetime, time, timedelta
+from enum import Enum
+from functools import lru_cache
 from logging import getLogger
-from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Type
+from time import perf_counter
+from types import FunctionType, MethodType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Type, Union
 
 from pyobjson.constants import DELIMITER as DLIM
-from pyobjson.constants import UNSERIALIZABLE
+from pyobjson.constants import CLONE_CACHE_MAX_SIZE, PYOBJSON_ATTRIBUTES, SCHEMA_FORMAT_VERSION, UNSERIALIZABLE
+from pyobjson.instrumentation import is_instrumentation_enabled, new_class_counters, phase, record_class_stats
+from pyobjson.projection import ProjectionTree, compile_projection_paths, project_attributes
+from pyobjson.schema import compile_class_schema
 from pyobjson.utils import (
+    compile_regex,
     derive_custom_callable_value,
     derive_custom_object_key,
+    get_instance_attributes,
+    resolve_custom_callable,
+    set_instance_attributes,
 )
 
 logger = getLogger(__name__)
 
+# JSON builtin value types that are serialized and deserialized without any conversion
+_JSON_BUILTIN_TYPES = {str, int, float, bool, type(None)}
+
+# keys of the marker dictionaries of shared references and attribute columns, where dictionaries with at most as many
+# keys that contain any of them are serialized as {"$escape": <dictionary>} so they are never deserialized as markers
+_MARKER_KEYS = frozenset(("$ref", "$id", "$columns", "$escape"))
+
+# immutable value types that are shared instead of copied when cloning
+_IMMUTABLE_TYPES = {str, int, float, bool, complex, bytes, range, type(None), datetime, date, time, timedelta}
+
+# clone stack operations
+_CLONE = "clone"  # clone a value into a container
+
+# deserialization stack operations
+_DESERIALIZE = "deserialize"  # deserialize JSON data into a container
+_CONVERT = "convert"  # convert a deserialized list into a set or tuple
+_BUILD = "build"  # build a custom class instance from its deserialized attributes
+_BUILD_COLUMNS = "build_columns"  # build a list of custom class instances from their deserialized attribute columns
+
+# array typecodes of packed numeric columns by value type and the range of packed integers
+_PACKED_COLUMN_TYPECODES = {float: "d", int: "q"}
+_PACKED_INT_RANGE = (-(2**63), 2**63 - 1)
+
+# alignment in bytes of out-of-band buffer segments (suitable for memory-mapped NumPy arrays of any dtype)
+BUFFER_SEGMENT_ALIGNMENT = 64
+
 
 def filter_attributes(attributes: Dict[str, Any], excluded_attributes: List[str]) -> Dict[str, Any]:
     """Function to filter out attributes in a dictionary based on a list of excluded attribute keys.
@@ -48,7 +79,7 @@ def filter_attributes(attributes: Dict[str, Any], excluded_attributes: List[str]
             for excl_att in excluded_attributes:
                 # exclude all attributes defined in instance from which data is being serialized that match the excluded
                 # attribute regex
-                if search(fr"{excl_att}", att):
+                if compile_regex(excl_att).search(att):
                     excluded_att_keys.add(att)
 
         attributes = {att: val for att, val in attributes.items() if att not in excluded_att_keys}
@@ -56,17 +87,13 @@ def filter_attributes(attributes: Dict[str, Any], excluded_attributes: List[str]
     return attributes
 
 
-def unpack_custom_class_vars(
-    custom_class_instance: Any,
-    pyobjson_base_custom_subclasses: List[Type],
-    excluded_attributes: List[str],
-    class_keys_for_excluded_attributes: List[str],
+def filter_custom_class_attributes(
+    custom_class_instance: Any, excluded_attributes: List[str], class_keys_for_excluded_attributes: List[str]
 ) -> Dict[str, Any]:
-    """Recursive function to un-type custom class type objects for serialization.
+    """Function to retrieve the attributes of a custom class instance that are not excluded from serialization.
 
     Args:
         custom_class_instance (Any): Custom Python class instance to be serialized.
-        pyobjson_base_custom_subclasses (list[Type]): List of custom Python class subclasses.
         excluded_attributes (list[str]): List of attributes to exclude from serialization. Supports regex pattern
             matching exclusions.
         class_keys_for_excluded_attributes (list[str]): List of Python class keys for which to exclude attributes
@@ -74,10 +101,10 @@ def unpack_custom_class_vars(
             in excluded_attributes will be excluded from all classes during serialization.
 
     Returns:
-        dict[str, Any]: Dictionary that extracts serializable data from custom objects.
+        dict[str, Any]: Dictionary of the custom class instance attributes to be serialized.
 
     """
-    attributes = dict(vars(custom_class_instance).items())
+    attributes = get_instance_attributes(custom_class_instance)
 
     if class_keys_for_excluded_attributes:
         if derive_custom_object_key(custom_class_instance) in class_keys_for_excluded_attributes:
@@ -87,21 +114,243 @@ def unpack_custom_class_vars(
         # filter out excluded attributes for all custom classes
         attributes = filter_attributes(attributes, excluded_attributes)
 
+    return attributes
+
+
+def unpack_custom_class_vars(
+    custom_class_instance: Any,
+    pyobjson_base_custom_subclasses: List[Type],
+    excluded_attributes: List[str],
+    class_keys_for_excluded_attributes: List[str],
+) -> Dict[str, Any]:
+    """Function to un-type custom class type objects (including nested custom class type objects) for serialization.
+
+    Args:
+        custom_class_instance (Any): Custom Python class instance to be serialized.
+        pyobjson_base_custom_subclasses (list[Type]): List of custom Python class subclasses.
+        excluded_attributes (list[str]): List of attributes to exclude from serialization. Supports regex pattern
+            matching exclusions.
+        class_keys_for_excluded_attributes (list[str]): List of Python class keys for which to exclude attributes
+            provided in excluded_attributes during serialization. If no class keys are provided, all attributes provided
+            in excluded_attributes will be excluded from all classes during serialization.
+
+    Returns:
+        dict[str, Any]: Dictionary that extracts serializable data from custom objects.
+
+    """
+    base_subclasses = set(pyobjson_base_custom_subclasses)
+
     unpacked = {}
-    for k, v in attributes.items():
-        unpacked[k] = (
-            {
-                derive_custom_object_key(v): unpack_custom_class_vars(
-                    v, pyobjson_base_custom_subclasses, excluded_attributes, class_keys_for_excluded_attributes
-                )
-            }
-            if type(v) in pyobjson_base_custom_subclasses
-            else v
-        )
+    # use an explicit stack of custom class instances and the dictionaries into which to unpack them instead of
+    # recursion to support arbitrarily deep nesting of custom class instances
+    stack = [(custom_class_instance, unpacked)]
+    while stack:
+        instance, instance_unpacked = stack.pop()
+        for k, v in filter_custom_class_attributes(
+            instance, excluded_attributes, class_keys_for_excluded_attributes
+        ).items():
+            if type(v) in base_subclasses:
+                instance_unpacked[k] = {derive_custom_object_key(v): (nested_unpacked := {})}
+                stack.append((v, nested_unpacked))
+            else:
+                instance_unpacked[k] = v
 
     return unpacked
 
 
+def find_shared_references(
+    obj: Any,
+    pyobjson_base_custom_subclasses: List[Type],
+    excluded_attributes: List[str],
+    class_keys_for_excluded_attributes: List[str],
+    only: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+    max_depth: Optional[int] = None,
+) -> Set[int]:
+    """Function to find the custom class instances, lists, and dictionaries that are referenced more than once
+    (including through cycles) in a Python object graph.
+
+    Args:
+        obj (Any): Python object graph to search.
+        pyobjson_base_custom_subclasses (list[Type]): List of custom Python class subclasses.
+        excluded_attributes (list[str]): List of attributes to exclude from serialization. Supports regex pattern
+            matching exclusions.
+        class_keys_for_excluded_attributes (list[str]): List of Python class keys for which to exclude attributes
+            provided in excluded_attributes during serialization. If no class keys are provided, all attributes provided
+            in excluded_attributes will be excluded from all classes during serialization.
+        only (Optional[Iterable[str]], optional): Dotted attribute paths of the only attributes to search (as used in
+            serialize). Defaults to None.
+        exclude (Optional[Iterable[str]], optional): Dotted attribute paths of attributes to exclude from the search
+            (as used in serialize). Defaults to None.
+        max_depth (Optional[int], optional): Maximum nesting depth of searched custom class instances (as used in
+            serialize). Defaults to None.
+
+    Returns:
+        set[int]: Set with the identities (as returned by id()) of all objects referenced more than once.
+
+    """
+    base_subclasses = set(pyobjson_base_custom_subclasses)
+    visited = set()
+    shared_references = set()
+
+    projection = (
+        (compile_projection_paths(only), compile_projection_paths(exclude), 0)
+        if only is not None or exclude is not None or max_depth is not None
+        else None
+    )
+    stack = [(obj, projection)]
+    while stack:
+        value, projection = stack.pop()
+        if type(value) in base_subclasses:
+            if projection is not None and max_depth is not None and projection[2] > max_depth:
+                continue
+            if id(value) in visited:
+                shared_references.add(id(value))
+                continue
+            visited.add(id(value))
+            attributes = filter_custom_class_attributes(value, excluded_attributes, class_keys_for_excluded_attributes)
+            if projection is None:
+                stack.extend((v, None) for v in attributes.values())
+            else:
+                only_projection, exclude_projection, depth = projection
+                projected_atts, nested_projections = project_attributes(
+                    type(value), tuple(attributes), only_projection, exclude_projection
+                )
+                stack.extend((attributes[att], (*nested_projections[att], depth + 1)) for att in projected_atts)
+        elif isinstance(value, (dict, list)):
+            if id(value) in visited:
+                shared_references.add(id(value))
+                continue
+            visited.add(id(value))
+            stack.extend((v, projection) for v in (value.values() if isinstance(value, dict) else value))
+        elif isinstance(value, (set, tuple)):
+            stack.extend((v, projection) for v in value)
+
+    return shared_references
+
+
+def parse_typed_key(typed_key: str) -> Tuple[Optional[str], Optional[str], str]:
+    """Function to split a pyobjson formatted dictionary key into its value type category, value type, and key.
+
+    Args:
+        typed_key (str): Dictionary key that may be formatted with custom delimiters to indicate a value type category
+            and a value type (e.g. collection::::set::::key_name or path::::key_name).
+
+    Returns:
+        tuple[Optional[str], Optional[str], str]: The value type category (or None), the value type (or None), and the
+            original key.
+
+    """
+    delimiters = typed_key.count(DLIM)
+    # keys formatted without a custom delimiter do not indicate a value type
+    if not delimiters:
+        return None, None, typed_key
+    # keys formatted with one custom delimiter indicate a value type
+    elif delimiters == 1:
+        type_name, key = typed_key.split(DLIM)
+        return None, type_name, key
+    # keys formatted with two custom delimiters indicate a value type category and a value type
+    elif delimiters == 2:
+        type_category, type_name, key = typed_key.split(DLIM)
+        return type_category, type_name, key
+    # keys formatted with more than two custom delimiters are not supported by pyobjson
+    else:
+        raise ValueError(f"JSON key ({typed_key}) is not compatible with pyobjson.")
+
+
+def convert_typed_value(
+    type_category: Optional[str],
+    type_name: Optional[str],
+    key: str,
+    value: Any,
+    out_of_band_buffer: Optional[memoryview] = None,
+) -> Any:
+    """Function to make a JSON value into a Python object of the type indicated by a pyobjson formatted dictionary key.
+
+    Args:
+        type_category (Optional[str]): The value type category parsed from the pyobjson formatted dictionary key.
+        type_name (Optional[str]): The value type parsed from the pyobjson formatted dictionary key.
+        key (str): The original key parsed from the pyobjson formatted dictionary key.
+        value (Any): The JSON value to be made into a Python object.
+        out_of_band_buffer (Optional[memoryview], optional): Memory containing the out-of-band segments of
+            buffer-protocol values. Defaults to None.
+
+    Returns:
+        Any: Python object of the indicated type.
+
+    """
+    if type_name is None:
+        return value
+    elif type_category == "collection":
+        if type_name == "set":
+            value = set(value)
+        elif type_name == "tuple":
+            value = tuple(value)
+        elif type_name == "bytes" or type_name == "bytearray":
+            from base64 import b64decode
+
+            value = b64decode(value)
+        # do nothing for dictionaries and lists because JSON supports them
+    elif type_category == "buffer":
+        value = deserialize_buffer(type_name, key, value, out_of_band_buffer)
+    elif type_category == "callable":
+        if type_name == "function":
+            # extract the callable components from a value with format
+            # module.callable[DLIM]callable_type[DLIM]arg1:type1,arg2:type2
+            callable_path, callable_args = value.split(DLIM, 1)
+            # import (or retrieve the cached) callable itself using the callable module and name and set it to the value
+            value = resolve_custom_callable(callable_path)
+        elif type_name == "method":
+            raise ValueError(f"JSON data ({key}: {value}) is not compatible with pyobjson.")
+    elif type_name == "path":  # handle posix paths
+        from pathlib import Path
+
+        value = Path(value)
+    elif type_name == "datetime":  # handle datetime objects
+        value = datetime.fromisoformat(value)
+    elif type_category == "packed" and type_name in _PACKED_COLUMN_TYPECODES.values():  # handle packed numeric columns
+        from array import array
+        from base64 import b64decode
+
+        packed_column = array(type_name)
+        packed_column.frombytes(b64decode(value))
+        # packed numeric columns are always stored in little-endian byte order
+        if sys.byteorder == "big":
+            packed_column.byteswap()
+        value = packed_column.tolist()
+    else:
+        raise ValueError(f"JSON data ({key}: {value}) is not compatible with pyobjson.")
+
+    return value
+
+
+def pack_numeric_column(column: List[Any]) -> Optional[Tuple[str, str]]:
+    """Function to pack a column of all integers or all floats into a base64-encoded little-endian array.
+
+    Args:
+        column (list[Any]): Column of attribute values to pack.
+
+    Returns:
+        Optional[tuple[str, str]]: The array typecode ("q" for 64-bit integers or "d" for double precision floats) and
+            the base64-encoded packed array, or None if the column cannot be packed.
+
+    """
+    column_type = type(column[0]) if column else None
+    if column_type not in _PACKED_COLUMN_TYPECODES or any(type(v) is not column_type for v in column):
+        return None
+    if column_type is int and (min(column) < _PACKED_INT_RANGE[0] or max(column) > _PACKED_INT_RANGE[1]):
+        return None
+
+    from array import array
+    from base64 import b64encode
+
+    packed_column = array(_PACKED_COLUMN_TYPECODES[column_type], column)
+    # always store packed numeric columns in little-endian byte order
+    if sys.byteorder == "big":
+        packed_column.byteswap()
+    return packed_column.typecode, b64encode(packed_column.tobytes()).decode("utf-8")
+
+
 def extract_typed_key_value_pairs(
     json_dict: Dict[str, Any], pyobjson_base_custom_subclasses_by_key: Dict[str, Type]
 ) -> Dict[str, Any]:
@@ -123,62 +372,352 @@ def extract_typed_key_value_pairs(
     for key, value in json_dict.items():
         # check if value is a custom object that will be deserialized as its respective object type or if key is
         # formatted with a custom delimiter to indicate a Python builtin value type
-        if key not in pyobjson_base_custom_subclasses_by_key.keys() and (delimiters := key.count(DLIM)):
-            # keys formatted with one custom delimiter indicate a value type
-            if delimiters == 1:
-                type_category = None
-                type_name, key = key.split(DLIM)
-            # keys formatted with two custom delimiters indicate a value type category and a value type
-            elif delimiters == 2:
-                type_category, type_name, key = key.split(DLIM)
-            # keys formatted with more than two custom delimiters are not supported by pyobjson
-            else:
-                raise ValueError(f"JSON data ({key}: {value}) is not compatible with pyobjson.")
-
-            if type_category == "collection":
-                if type_name == "dict":
-                    # do nothing because JSON supports dictionaries
-                    pass
-                elif type_name == "list":
-                    # do nothing because JSON supports lists
-                    pass
-                elif type_name == "set":
-                    value = set(value)
-                elif type_name == "tuple":
-                    value = tuple(value)
-                elif type_name == "bytes" or type_name == "bytearray":
-                    value = b64decode(value)
-            elif type_category == "callable":
-                if type_name == "function":
-                    # extract the callable components from a value with format
-                    # module.callable[DLIM]callable_type[DLIM]arg1:type1,arg2:type2
-                    callable_path, callable_args = value.split(DLIM, 1)
-                    # extract the callable module and name
-                    module, callable_name = callable_path.rsplit(".", 1)
-                    # use the callable module and name to import the callable itself and set it to the value
-                    value = getattr(import_module(module), callable_name)
-                elif type_name == "method":
-                    raise ValueError(f"JSON data ({key}: {value}) is not compatible with pyobjson.")
-
-            elif type_name == "path":  # handle posix paths
-                value = Path(value)
-            elif type_name == "datetime":  # handle datetime objects
-                value = datetime.fromisoformat(value)
-            else:
-                raise ValueError(f"JSON data ({key}: {value}) is not compatible with pyobjson.")
+        if key not in pyobjson_base_custom_subclasses_by_key:
+            type_category, type_name, key = parse_typed_key(key)
+            value = convert_typed_value(type_category, type_name, key, value)
 
         derived_key_value_pairs[key] = value
 
     return derived_key_value_pairs
 
 
+def _is_path(obj: Any) -> bool:
+    """Function to check if a Python object is a path without importing pathlib when no path could exist yet.
+
+    Args:
+        obj (Any): Python object to check.
+
+    Returns:
+        bool: Whether the Python object is a pathlib.Path instance.
+
+    """
+    # a Path instance can only exist if pathlib has already been imported, so skip importing it just for this check
+    pathlib = sys.modules.get("pathlib")
+    return pathlib is not None and isinstance(obj, pathlib.Path)
+
+
+def derive_buffer_type(obj: Any) -> Optional[str]:
+    """Function to identify the buffer-protocol values supported by pyobjson without importing their modules.
+
+    Args:
+        obj (Any): Python object to check.
+
+    Returns:
+        Optional[str]: "memoryview", "array" (for array.array), or "ndarray" (for NumPy arrays without Python object
+            elements), or None if the object is not a supported buffer-protocol value.
+
+    """
+    if type(obj) is memoryview:
+        return "memoryview"
+    # array.array and NumPy array instances can only exist if their modules have already been imported
+    if (array_module := sys.modules.get("array")) is not None and isinstance(obj, array_module.array):
+        return "array"
+    if (numpy := sys.modules.get("numpy")) is not None and isinstance(obj, numpy.ndarray) and not obj.dtype.hasobject:
+        return "ndarray"
+    return None
+
+
+def serialize_buffer(
+    obj: Any, buffer_type: str, out_of_band_buffers: Optional[List[Tuple[int, memoryview]]] = None
+) -> Dict[str, Any]:
+    """Function to serialize a buffer-protocol value with its format and shape metadata.
+
+    Args:
+        obj (Any): Buffer-protocol value (memoryview, array.array, or NumPy array) to serialize.
+        buffer_type (str): Buffer type as returned by derive_buffer_type.
+        out_of_band_buffers (Optional[list[tuple[int, memoryview]]], optional): List to which to append the offset and
+            the (uncopied when contiguous) raw bytes of the buffer to be written out-of-band instead of encoding them
+            with base64 in the JSON. Defaults to None.
+
+    Returns:
+        dict[str, Any]: Serializable dictionary with the buffer format, shape, and either the base64-encoded data or
+            the offset and size of the out-of-band buffer segment.
+
+    """
+    if buffer_type == "ndarray":
+        # the NumPy dtype string includes the byte order
+        serializable_buffer = {"format": obj.dtype.str, "shape": list(obj.shape)}
+        raw_buffer = memoryview(obj if obj.flags.c_contiguous else obj.copy(order="C"))
+    else:
+        raw_buffer = memoryview(obj)
+        serializable_buffer = {
+            "format": obj.typecode if buffer_type == "array" else raw_buffer.format,
+            "shape": list(raw_buffer.shape),
+            "byteorder": sys.byteorder,
+        }
+        if not raw_buffer.c_contiguous:
+            raw_buffer = memoryview(raw_buffer.tobytes())
+
+    raw_buffer = raw_buffer.cast("B") if raw_buffer.ndim else memoryview(raw_buffer.tobytes())
+    if out_of_band_buffers is None:
+        from base64 import b64encode
+
+        serializable_buffer["data"] = b64encode(raw_buffer).decode("utf-8")
+    else:
+        offset = 0
+        if out_of_band_buffers:
+            last_offset, last_buffer = out_of_band_buffers[-1]
+            # align every segment so memory-mapped arrays can be created directly from it
+            offset = -(-(last_offset + last_buffer.nbytes) // BUFFER_SEGMENT_ALIGNMENT) * BUFFER_SEGMENT_ALIGNMENT
+        out_of_band_buffers.append((offset, raw_buffer))
+        serializable_buffer["offset"] = offset
+        serializable_buffer["nbytes"] = raw_buffer.nbytes
+
+    return serializable_buffer
+
+
+def has_out_of_band_buffer_references(json_data: Any) -> bool:
+    """Function to check if JSON data contains buffer-protocol values whose raw bytes are stored out-of-band.
+
+    Args:
+        json_data (Any): JSON data to be deserialized.
+
+    Returns:
+        bool: Whether any serialized buffer in the JSON data references an out-of-band buffer segment.
+
+    """
+    stack = [json_data]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type is dict:
+            if "offset" in value and "nbytes" in value and "data" not in value:
+                return True
+            stack.extend(value.values())
+        elif value_type is list:
+            stack.extend(value)
+    return False
+
+
+def deserialize_buffer(
+    buffer_type: str, key: str, value: Dict[str, Any], out_of_band_buffer: Optional[memoryview] = None
+) -> Any:
+    """Function to deserialize a buffer-protocol value from its serialized format and shape metadata.
+
+    Args:
+        buffer_type (str): Buffer type ("memoryview", "array", or "ndarray").
+        key (str): The original attribute key of the buffer.
+        value (dict[str, Any]): Serialized buffer with format, shape, and data or out-of-band segment metadata.
+        out_of_band_buffer (Optional[memoryview], optional): Memory (e.g. memory-mapped) containing the out-of-band
+            buffer segments. Defaults to None.
+
+    Returns:
+        Any: The memoryview, array.array, or NumPy array. Memoryviews and NumPy arrays are read-only views of the
+            decoded (or memory-mapped) data.
+
+    """
+    if value.get("byteorder", sys.byteorder) != sys.byteorder:
+        raise ValueError(f'JSON data ({key}) was serialized with {value["byteorder"]}-endian byte order.')
+
+    if "data" in value:
+        from base64 import b64decode
+
+        raw_buffer = memoryview(b64decode(value["data"]))
+    elif out_of_band_buffer is not None:
+        # slicing a memoryview does not copy the underlying (memory-mapped) data
+        raw_buffer = out_of_band_buffer[value["offset"] : value["offset"] + value["nbytes"]].toreadonly()
+    else:
+        raise ValueError(f"JSON data ({key}) references an out-of-band buffer that was not provided.")
+
+    if buffer_type == "ndarray":
+        import numpy
+
+        return numpy.frombuffer(raw_buffer, dtype=numpy.dtype(value["format"])).reshape(value["shape"])
+    elif buffer_type == "array":
+        from array import array
+
+        # array.array always owns its memory, so the data is copied
+        deserialized_array = array(value["format"])
+        deserialized_array.frombytes(raw_buffer)
+        return deserialized_array
+    elif buffer_type == "memoryview":
+        return raw_buffer.cast(value["format"], value["shape"]) if raw_buffer.nbytes else raw_buffer
+    else:
+        raise ValueError(f"JSON data ({key}: {value}) is not compatible with pyobjson.")
+
+
+def derive_typed_key(att: str, val: Any, pyobjson_base_custom_subclasses: Set[Type]) -> str:
+    """Function to derive a pyobjson formatted attribute key indicating the Python object type of an attribute value.
+
+    Args:
+        att (str): Attribute name.
+        val (Any): Attribute value.
+        pyobjson_base_custom_subclasses (set[Type]): Set of custom Python class subclasses.
+
+    Returns:
+        str: Attribute key formatted with custom delimiters to indicate the Python object type of the attribute value.
+
+    """
+    if type(val) in pyobjson_base_custom_subclasses or val is None or type(val) in (str, int, float, bool):
+        # attribute keys for custom Python objects and JSON builtin values do not require type formatting
+        return att
+    elif isinstance(val, dict):
+        return f"collection{DLIM}dict{DLIM}{att}"
+    elif isinstance(val, (list, set, tuple, bytes, bytearray)):
+        return f"collection{DLIM}{derive_custom_object_key(val.__class__)}{DLIM}{att}"
+    elif buffer_type := derive_buffer_type(val):
+        return f"buffer{DLIM}{buffer_type}{DLIM}{att}"
+    elif _is_path(val):
+        return f"path{DLIM}{att}"
+    elif isinstance(val, Callable):
+        if isinstance(val, FunctionType):
+            callable_type = f"function{DLIM}"
+        elif isinstance(val, MethodType):
+            callable_type = f"method{DLIM}"
+        else:
+            callable_type = None
+
+        return f"callable{DLIM}{callable_type if callable_type else ''}{att}"
+    elif isinstance(val, datetime):
+        return f"datetime{DLIM}{att}"
+    else:
+        import json
+
+        try:
+            json.dumps(val)
+        except TypeError as e:
+            if str(e) == f"Object of type {type(val).__name__} is not JSON serializable":
+                return f"repr{DLIM}{derive_custom_object_key(val.__class__)}"
+            else:
+                return f"{UNSERIALIZABLE}{DLIM}{derive_custom_object_key(val.__class__)}"
+        return att
+
+
+def derive_schema_key(att: str, typed_att: str, val: Any, schema_type: Tuple[Optional[str], Optional[str]]) -> str:
+    """Function to derive the attribute key of an attribute with a schema type when serializing in schema mode.
+
+    Args:
+        att (str): Attribute name.
+        typed_att (str): Attribute key formatted with custom delimiters as derived by derive_typed_key.
+        val (Any): Attribute value.
+        schema_type (tuple[Optional[str], Optional[str]]): The value type category and value type of the attribute in
+            the class schema.
+
+    Returns:
+        str: The plain attribute name if the attribute value matches the schema type, otherwise the formatted attribute
+            key (with the "value" type for values that do not require type formatting but do not match the schema).
+
+    """
+    if typed_att == att:
+        if val is None or schema_type == (None, None):
+            return att
+        # mark values that do not require type formatting so they are not converted to the schema type
+        return f"value{DLIM}{att}"
+    elif parse_typed_key(typed_att)[:2] == schema_type:
+        return att
+    return typed_att
+
+
+def serialize_value(obj: Any) -> Any:
+    """Function to serialize a Python object that is not a custom class instance or a collection for conversion to JSON.
+
+    Args:
+        obj (Any): Python object to serialize.
+
+    Returns:
+        Any: Serializable value.
+
+    """
+    if isinstance(obj, (bytes, bytearray)):
+        from base64 import b64encode
+
+        return b64encode(obj).decode("utf-8")
+
+    elif buffer_type := derive_buffer_type(obj):
+        return serialize_buffer(obj, buffer_type)
+
+    elif _is_path(obj):
+        return str(obj)
+
+    elif isinstance(obj, Callable):
+        return derive_custom_callable_value(obj)
+
+    elif isinstance(obj, datetime):
+        return obj.isoformat()
+
+    else:
+        import json
+
+        try:
+            json.dumps(obj)
+        except TypeError as e:
+            if str(e) == f"Object of type {type(obj).__name__} is not JSON serializable.":
+                return repr(obj)
+            else:
+                return UNSERIALIZABLE
+        return obj
+
+
+def _derive_columns(
+    instances: Union[List[Any], Tuple[Any, ...]],
+    base_subclasses: Set[Type],
+    excluded_attributes: List[str],
+    class_keys_for_excluded_attributes: List[str],
+    serializable_atts_by_filter_key: Dict[Tuple[Type, Tuple[str, ...]], Tuple[str, ...]],
+) -> Optional[Dict[str, List[Any]]]:
+    """Function to split a homogeneous list of custom class instances into parallel per-attribute columns.
+
+    Args:
+        instances (Union[list[Any], tuple[Any, ...]]): List or tuple of Python objects to split into columns.
+        base_subclasses (set[Type]): Set of custom Python class subclasses.
+        excluded_attributes (list[str]): List of attributes to exclude from serialization. Supports regex pattern
+            matching exclusions.
+        class_keys_for_excluded_attributes (list[str]): List of Python class keys for which to exclude attributes
+            provided in excluded_attributes during serialization.
+        serializable_atts_by_filter_key (dict[tuple[Type, tuple[str, ...]], tuple[str, ...]]): Cache of serializable
+            attribute names by class and set of instance attributes.
+
+    Returns:
+        Optional[dict[str, list[Any]]]: Dictionary with pyobjson formatted attribute keys as keys and lists of the
+            (unserialized) attribute values of all instances as values, or None if the objects are not all instances
+            of the same custom class with the same serializable attributes and attribute value types.
+
+    """
+    instance_type = type(instances[0])
+    if instance_type not in base_subclasses or any(type(instance) is not instance_type for instance in instances):
+        return None
+
+    serializable_atts = None
+    rows = []
+    for instance in instances:
+        instance_attributes = get_instance_attributes(instance)
+        filter_key = (instance_type, tuple(instance_attributes))
+        if (instance_serializable_atts := serializable_atts_by_filter_key.get(filter_key)) is None:
+            instance_serializable_atts = serializable_atts_by_filter_key[filter_key] = tuple(
+                filter_custom_class_attributes(instance, excluded_attributes, class_keys_for_excluded_attributes)
+            )
+        if serializable_atts is None:
+            serializable_atts = instance_serializable_atts
+        elif instance_serializable_atts != serializable_atts:
+            return None
+        rows.append(instance_attributes)
+
+    columns = {}
+    for att in serializable_atts:
+        column = [instance_attributes[att] for instance_attributes in rows]
+        # every value in a column must have the same pyobjson formatted attribute key
+        typed_atts = {derive_typed_key(att, val, base_subclasses) for val in column}
+        if len(typed_atts) != 1:
+            return None
+        columns[typed_atts.pop()] = column
+    return columns
+
+
 def serialize(
     obj: Any,
     pyobjson_base_custom_subclasses: List[Type],
     excluded_attributes: List[str],
     class_keys_for_excluded_attributes: List[str],
+    track_references: bool = False,
+    columnar: bool = False,
+    pack_numeric_columns: bool = False,
+    out_of_band_buffers: Optional[List[Tuple[int, memoryview]]] = None,
+    schema: bool = False,
+    only: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+    max_depth: Optional[int] = None,
 ) -> Any:
-    """Recursive function to serialize custom Python objects into nested dictionaries for conversion to JSON.
+    """Function to serialize custom Python objects into nested dictionaries for conversion to JSON.
 
     Args:
         obj (Any): Python object to serialize.
@@ -188,97 +727,651 @@ def serialize(
         class_keys_for_excluded_attributes (Optional[list[str]], optional): List of Python class keys for which to
             exclude attributes provided in excluded_attributes during serialization. If no class keys are provided,
             all attributes provided in excluded_attributes will be excluded from all classes during serialization.
+        track_references (bool, optional): Whether to serialize custom class instances, lists, and dictionaries that are
+            referenced more than once (including through cycles) only once with a "$id" value and to serialize all
+            other references to them as {"$ref": <id>}. Defaults to False.
+        columnar (bool, optional): Whether to serialize lists and tuples of two or more instances of the same custom
+            class (with the same attributes and attribute value types) as {"$columns": <class key>, "$length": <number
+            of instances>, "$data": {<attribute key>: [<attribute values>]}} instead of as lists of separate
+            dictionaries. Lists containing shared references (or serialized with a projection from only, exclude, or
+            max_depth) are not serialized as columns. Defaults to False.
+        pack_numeric_columns (bool, optional): Whether to pack columns of all integers or all floats into base64-encoded
+            arrays when columnar is True. Defaults to False.
+        out_of_band_buffers (Optional[list[tuple[int, memoryview]]], optional): List to which to append the aligned
+            offset and raw bytes of every buffer-protocol value (memoryview, array.array, or NumPy array) to be written
+            out-of-band as a single side segment file, in which case the JSON only contains the offset and size of each
+            segment. If None, buffer-protocol values are base64-encoded in the JSON. Defaults to None.
+        schema (bool, optional): Whether to serialize in schema mode, in which attributes of custom class instances
+            with values matching the types in the class schema compiled from the __init__ type annotations of their
+            class are serialized with plain attribute names, and the serialized data is wrapped as
+            {"$schema": <schema format version>, "$data": <serialized data>}. Defaults to False.
+        only (Optional[Iterable[str]], optional): Dotted attribute paths across nested custom class instances (e.g.
+            "attribute" or "attribute.nested_attribute") of the only attributes to serialize, where paths continue
+            through the lists, sets, tuples, and dictionaries containing nested custom class instances. Attributes
+            that are not selected are never visited. If None, all attributes are serialized. Defaults to None.
+        exclude (Optional[Iterable[str]], optional): Dotted attribute paths across nested custom class instances of
+            attributes to exclude from serialization in addition to excluded_attributes. Excluded attributes are never
+            visited. Defaults to None.
+        max_depth (Optional[int], optional): Maximum nesting depth of serialized custom class instances (where the
+            serialized object is at depth 0), below which custom class instances are serialized as None without
+            being visited. If None, custom class instances are serialized at all depths. Defaults to None.
 
     Returns:
         dict[str, Any]: Serializable dictionary.
 
     """
-    if type(obj) in pyobjson_base_custom_subclasses:
-        serializable_obj = {}
-        attributes = {
-            k: v
-            for k, v in unpack_custom_class_vars(
-                obj, pyobjson_base_custom_subclasses, excluded_attributes, class_keys_for_excluded_attributes
-            ).items()
-        }
+    base_subclasses = set(pyobjson_base_custom_subclasses)
+    # the projection of each value is None if no projection was requested, or a tuple of the only and exclude projection
+    # trees and the nesting depth of the custom class instances of the value
+    projection: Optional[Tuple[Optional[ProjectionTree], Optional[ProjectionTree], int]] = (
+        (compile_projection_paths(only), compile_projection_paths(exclude), 0)
+        if only is not None or exclude is not None or max_depth is not None
+        else None
+    )
+    shared_references = (
+        find_shared_references(
+            obj,
+            pyobjson_base_custom_subclasses,
+            excluded_attributes,
+            class_keys_for_excluded_attributes,
+            only=only,
+            exclude=exclude,
+            max_depth=max_depth,
+        )
+        if track_references
+        else set()
+    )
+    reference_ids: Dict[int, int] = {}
+    class_keys: Dict[Type, str] = {}
+    serializable_atts_by_filter_key: Dict[Tuple[Type, Tuple[str, ...]], Tuple[str, ...]] = {}
+    # only collect per-class counters while instrumentation is enabled
+    class_stats: Optional[Dict[str, Dict[str, float]]] = {} if is_instrumentation_enabled() else None
 
-        for att, val in attributes.items():
-            if isinstance(val, dict):
-                # noinspection PyUnboundLocalVariable
-                if (
-                    len(val) == 1
-                    and (single_key := next(iter(val.keys())))
-                    and single_key
-                    in [derive_custom_object_key(subclass) for subclass in pyobjson_base_custom_subclasses]
-                ):
-                    # do nothing because attribute key for custom Python object is already formatted correctly by
-                    # unpack custom_class_vars()
-                    pass
-                else:
-                    att = f"collection{DLIM}dict{DLIM}{att}"
-            elif isinstance(val, (list, set, tuple, bytes, bytearray)):
-                att = f"collection{DLIM}{derive_custom_object_key(val.__class__)}{DLIM}{att}"
-            elif isinstance(val, Path):
-                att = f"path{DLIM}{att}"
-            elif isinstance(val, Callable):
-                if isfunction(val):
-                    callable_type = f"function{DLIM}"
-                elif ismethod(val):
-                    callable_type = f"method{DLIM}"
+    with phase("serialize", obj if type(obj) in base_subclasses else None):
+        serialized = [None]
+        # use an explicit stack of (object to serialize, container into which to write the serialized object, key or
+        # index in that container, projection of the object) instead of recursion to support arbitrarily deep object
+        # graphs, and write JSON builtin values directly into their containers without pushing them onto the stack
+        stack: List[Tuple[Any, Any, Any, Any]] = [(obj, serialized, 0, projection)]
+        while stack:
+            value, container, container_key, projection = stack.pop()
+            value_type = type(value)
+
+            if value_type in _JSON_BUILTIN_TYPES:
+                container[container_key] = value
+                continue
+
+            if (
+                projection is not None
+                and max_depth is not None
+                and projection[2] > max_depth
+                and value_type in base_subclasses
+            ):
+                # custom class instances nested deeper than the maximum depth are never visited
+                container[container_key] = None
+                continue
+
+            reference_id = None
+            if shared_references and id(value) in shared_references:
+                if id(value) in reference_ids:
+                    container[container_key] = {"$ref": reference_ids[id(value)]}
+                    continue
+                reference_id = reference_ids[id(value)] = len(reference_ids) + 1
+
+            if value_type in base_subclasses:
+                if class_stats is not None:
+                    node_start = perf_counter()
+
+                if not (class_key := class_keys.get(value_type)):
+                    class_key = class_keys[value_type] = derive_custom_object_key(value_type)
+
+                serializable_obj = {"$id": reference_id} if reference_id else {}
+                container[container_key] = {class_key: serializable_obj}
+
+                # only match attribute names against the excluded attribute patterns once per class and set of
+                # attributes
+                instance_attributes = get_instance_attributes(value)
+                filter_key = (value_type, tuple(instance_attributes))
+                if (serializable_atts := serializable_atts_by_filter_key.get(filter_key)) is None:
+                    serializable_atts = serializable_atts_by_filter_key[filter_key] = tuple(
+                        filter_custom_class_attributes(value, excluded_attributes, class_keys_for_excluded_attributes)
+                    )
+
+                nested_projections = None
+                if projection is not None:
+                    # select the attributes in the projection (compiled once per class and projection)
+                    only_projection, exclude_projection, depth = projection
+                    serializable_atts, nested_projections = project_attributes(
+                        value_type, serializable_atts, only_projection, exclude_projection
+                    )
+
+                class_schema = compile_class_schema(value_type) if schema else None
+                children = []
+                for att in serializable_atts:
+                    val = instance_attributes[att]
+                    typed_att = derive_typed_key(att, val, base_subclasses)
+                    if class_schema and (schema_type := class_schema.get(att)) is not None:
+                        typed_att = derive_schema_key(att, typed_att, val, schema_type)
+                    serializable_obj[typed_att] = val
+                    if type(val) not in _JSON_BUILTIN_TYPES:
+                        children.append(
+                            (
+                                val,
+                                serializable_obj,
+                                typed_att,
+                                (*nested_projections[att], depth + 1) if nested_projections is not None else None,
+                            )
+                        )
+                # push children in reverse so they are serialized in document order (required for reference IDs)
+                stack.extend(reversed(children))
+
+                if class_stats is not None:
+                    counters = class_stats.get(class_key) or class_stats.setdefault(class_key, new_class_counters())
+                    counters["serialized_objects"] += 1
+                    counters["serialized_attributes"] += len(serializable_atts)
+                    counters["serialize_seconds"] += perf_counter() - node_start
+
+            elif isinstance(value, dict):
+                serializable_dict = dict(value)
+                if reference_id:
+                    container[container_key] = {"$id": reference_id, "$dict": serializable_dict}
+                elif len(value) <= 3 and not _MARKER_KEYS.isdisjoint(value):
+                    # escape dictionaries that would otherwise be deserialized as markers
+                    container[container_key] = {"$escape": serializable_dict}
                 else:
-                    callable_type = None
+                    container[container_key] = serializable_dict
+                stack.extend(
+                    reversed(
+                        [
+                            (v, serializable_dict, k, projection)
+                            for k, v in value.items()
+                            if type(v) not in _JSON_BUILTIN_TYPES
+                        ]
+                    )
+                )
 
-                att = f"callable{DLIM}{callable_type if callable_type else ''}{att}"
-            elif isinstance(val, datetime):
-                att = f"datetime{DLIM}{att}"
-            else:
-                try:
-                    json.dumps(val)
-                except TypeError as e:
-                    if str(e) == f"Object of type {type(val).__name__} is not JSON serializable":
-                        att = f"repr{DLIM}{derive_custom_object_key(val.__class__)}"
+            elif (
+                columnar
+                and projection is None
+                and not reference_id
+                and isinstance(value, (list, tuple))
+                and len(value) > 1
+                and not (shared_references and any(id(v) in shared_references for v in value))
+                and (
+                    columns := _derive_columns(
+                        value,
+                        base_subclasses,
+                        excluded_attributes,
+                        class_keys_for_excluded_attributes,
+                        serializable_atts_by_filter_key,
+                    )
+                )
+                is not None
+            ):
+                if class_stats is not None:
+                    node_start = perf_counter()
+
+                instance_type = type(value[0])
+                if not (class_key := class_keys.get(instance_type)):
+                    class_key = class_keys[instance_type] = derive_custom_object_key(instance_type)
+
+                serializable_columns = {}
+                container[container_key] = {"$columns": class_key, "$length": len(value), "$data": serializable_columns}
+
+                children = []
+                for typed_att, column in columns.items():
+                    if pack_numeric_columns and (packed_column := pack_numeric_column(column)):
+                        typecode, serializable_column = packed_column
+                        serializable_columns[f"packed{DLIM}{typecode}{DLIM}{typed_att}"] = serializable_column
                     else:
-                        att = f"{UNSERIALIZABLE}{DLIM}{derive_custom_object_key(val.__class__)}"
+                        # columns are new lists, so their values can be serialized in place
+                        serializable_columns[typed_att] = column
+                        children.extend(
+                            (v, column, i, None) for i, v in enumerate(column) if type(v) not in _JSON_BUILTIN_TYPES
+                        )
+                # push children in reverse so they are serialized in document order (required for reference IDs)
+                stack.extend(reversed(children))
 
-            serializable_obj[att] = serialize(
-                val, pyobjson_base_custom_subclasses, excluded_attributes, class_keys_for_excluded_attributes
-            )
+                if class_stats is not None:
+                    counters = class_stats.get(class_key) or class_stats.setdefault(class_key, new_class_counters())
+                    counters["serialized_objects"] += len(value)
+                    counters["serialized_attributes"] += len(value) * len(columns)
+                    counters["serialize_seconds"] += perf_counter() - node_start
 
-        return {derive_custom_object_key(obj.__class__): serializable_obj}
+            elif isinstance(value, (list, set, tuple)):
+                serializable_list = list(value)
+                container[container_key] = (
+                    {"$id": reference_id, "$list": serializable_list} if reference_id else serializable_list
+                )
+                stack.extend(
+                    reversed(
+                        [
+                            (v, serializable_list, i, projection)
+                            for i, v in enumerate(serializable_list)
+                            if type(v) not in _JSON_BUILTIN_TYPES
+                        ]
+                    )
+                )
 
-    elif isinstance(obj, dict):
-        return {
-            k: serialize(v, pyobjson_base_custom_subclasses, excluded_attributes, class_keys_for_excluded_attributes)
-            for k, v in obj.items()
-        }
+            elif buffer_type := derive_buffer_type(value):
+                container[container_key] = serialize_buffer(value, buffer_type, out_of_band_buffers)
 
-    elif isinstance(obj, (list, set, tuple)):
-        return [
-            serialize(v, pyobjson_base_custom_subclasses, excluded_attributes, class_keys_for_excluded_attributes)
-            for v in obj
-        ]
+            else:
+                container[container_key] = serialize_value(value)
 
-    elif isinstance(obj, (bytes, bytearray)):
-        return b64encode(obj).decode("utf-8")
+    if class_stats:
+        record_class_stats(class_stats)
+    if schema:
+        return {"$schema": SCHEMA_FORMAT_VERSION, "$data": serialized[0]}
+    return serialized[0]
 
-    elif isinstance(obj, Path):
-        return str(obj)
 
-    elif isinstance(obj, Callable):
-        return derive_custom_callable_value(obj)
+def _has_non_str_keys(serializable_data: Any) -> bool:
+    """Function to check if any dictionary in serialized data has keys that are not strings.
 
-    elif isinstance(obj, datetime):
-        return obj.isoformat()
+    Args:
+        serializable_data (Any): Serialized data.
+
+    Returns:
+        bool: Whether any dictionary in the serialized data has a key that is not a string.
+
+    """
+    stack = [serializable_data]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type is dict:
+            if any(type(key) is not str for key in value):
+                return True
+            stack.extend(value.values())
+        elif value_type is list:
+            stack.extend(value)
+    return False
+
+
+def _copy_with_json_keys(serializable_data: Any) -> Any:
+    """Function to copy the dictionaries and lists of serialized data with all dictionary keys converted to their JSON
+    object keys (matching the key conversion of json.dumps), so the data can be encoded with sorted keys.
+
+    Args:
+        serializable_data (Any): Serialized data.
+
+    Returns:
+        Any: Copy of the serialized data with string keys only.
+
+    """
+    import json
+
+    copied = [serializable_data]
+    stack: List[Tuple[Any, Any]] = [(copied, 0)]
+    while stack:
+        container, container_key = stack.pop()
+        value = container[container_key]
+        value_type = type(value)
+        if value_type is dict:
+            value = container[container_key] = {
+                key if type(key) is str else json.dumps(key): nested_value for key, nested_value in value.items()
+            }
+            stack.extend((value, key) for key in value)
+        elif value_type is list:
+            value = container[container_key] = list(value)
+            stack.extend((value, i) for i in range(len(value)))
+    return copied[0]
+
+
+def _encode_canonical(value: Any, has_non_str_keys: Optional[bool] = None) -> str:
+    """Function to encode serialized data as canonical JSON (compact, with sorted JSON object keys, and without escaping
+    non-ASCII characters).
+
+    Args:
+        value (Any): Serialized data.
+        has_non_str_keys (Optional[bool], optional): Whether any dictionary in the serialized data has keys that are
+            not strings, or None to check. Defaults to None.
+
+    Returns:
+        str: Canonical JSON.
+
+    """
+    import json
+
+    if has_non_str_keys is None:
+        has_non_str_keys = _has_non_str_keys(value)
+    if has_non_str_keys:
+        # sort non-string keys (which json.dumps cannot sort among string keys) by their JSON object keys
+        value = _copy_with_json_keys(value)
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def derive_fingerprint(serializable_data: Any, buffer_segments: Optional[List[Tuple[int, memoryview]]] = None) -> str:
+    """Function to derive a stable fingerprint of serialized data by hashing its canonical JSON (with sorted keys and
+    sorted set items) with BLAKE2b, so equal data has the same fingerprint in any process.
+
+    Args:
+        serializable_data (Any): Serialized data (as returned by serialize). The items of serialized sets are sorted
+            in place.
+        buffer_segments (Optional[list[tuple[int, memoryview]]], optional): Out-of-band segments of buffer-protocol
+            values serialized with out_of_band_buffers, which are included in the fingerprint. Defaults to None.
+
+    Returns:
+        str: Hexadecimal fingerprint of 32 characters.
+
+    """
+    from hashlib import blake2b
+
+    # sort the items of serialized sets (whose iteration order depends on string hash randomization) by their JSON
+    has_non_str_keys = False
+    stack = [serializable_data]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type is dict:
+            for key, nested_value in value.items():
+                if type(key) is not str:
+                    has_non_str_keys = True
+                elif type(nested_value) is list and DLIM in key and parse_typed_key(key)[1] in ("set", "frozenset"):
+                    nested_value.sort(key=_encode_canonical)
+                stack.append(nested_value)
+        elif value_type is list:
+            stack.extend(value)
+
+    hasher = blake2b(_encode_canonical(serializable_data, has_non_str_keys).encode("utf-8"), digest_size=16)
+    for offset, buffer_segment in buffer_segments or []:
+        hasher.update(offset.to_bytes(8, "little"))
+        hasher.update(buffer_segment)
+    return hasher.hexdigest()
+
+
+@lru_cache(maxsize=CLONE_CACHE_MAX_SIZE)
+def _derive_clone_attributes(
+    custom_class: Type,
+    attribute_names: Tuple[str, ...],
+    excluded_attributes: Tuple[str, ...],
+    class_keys_for_excluded_attributes: Tuple[str, ...],
+) -> FrozenSet[str]:
+    """Function to derive the names of the attributes of a custom class that are cloned (instead of shared) by matching
+    them against the excluded attribute patterns once per class and set of attributes.
+
+    Args:
+        custom_class (Type): Custom class of the cloned instances.
+        attribute_names (tuple[str, ...]): Names of the attributes of the cloned instances.
+        excluded_attributes (tuple[str, ...]): Attributes excluded from serialization. Supports regex pattern matching
+            exclusions.
+        class_keys_for_excluded_attributes (tuple[str, ...]): Python class keys for which to exclude attributes provided
+            in excluded_attributes. If no class keys are provided, excluded attributes are excluded from all classes.
+
+    Returns:
+        frozenset[str]: Names of the attributes that are not excluded from serialization.
+
+    """
+    attributes = dict.fromkeys(attribute_names)
+    if (
+        not class_keys_for_excluded_attributes
+        or derive_custom_object_key(custom_class) in class_keys_for_excluded_attributes
+    ):
+        attributes = filter_attributes(attributes, list(excluded_attributes))
+    return frozenset(attributes)
+
+
+def _clone_value(value: Any) -> Any:
+    """Function to copy a Python object that is not a custom class instance or a collection when cloning.
+
+    Args:
+        value (Any): Python object to copy.
+
+    Returns:
+        Any: The same object if it is immutable (or a function, path, or enum member), otherwise a copy of it.
+
+    """
+    if isinstance(value, (Callable, Enum)) or _is_path(value):
+        return value
+
+    elif type(value) is bytearray:
+        return bytearray(value)
+
+    elif buffer_type := derive_buffer_type(value):
+        if buffer_type == "ndarray":
+            return value.copy()
+        elif buffer_type == "array":
+            return value.__copy__()
+        # copied memoryviews are read-only views of a copy of the data (matching deserialized memoryviews)
+        raw_buffer = memoryview(value.tobytes())
+        return raw_buffer.cast(value.format, value.shape) if value.ndim and raw_buffer.nbytes else raw_buffer
 
     else:
-        try:
-            json.dumps(obj)
-        except TypeError as e:
-            if str(e) == f"Object of type {type(obj).__name__} is not JSON serializable.":
-                return repr(obj)
+        from copy import deepcopy
+
+        return deepcopy(value)
+
+
+def clone(
+    obj: Any,
+    pyobjson_base_custom_subclasses: List[Type],
+    excluded_attributes: List[str],
+    class_keys_for_excluded_attributes: List[str],
+) -> Any:
+    """Function to deep copy custom Python objects in a single pass without serializing them.
+
+    Args:
+        obj (Any): Python object to clone.
+        pyobjson_base_custom_subclasses (list[Type]): List of custom Python class subclasses.
+        excluded_attributes (list[str]): List of attributes excluded from serialization, which are shared with (instead
+            of copied from) the original custom class instances. Supports regex pattern matching exclusions.
+        class_keys_for_excluded_attributes (list[str]): List of Python class keys for which attributes provided in
+            excluded_attributes are shared. If no class keys are provided, all attributes provided in
+            excluded_attributes will be shared for all classes.
+
+    Returns:
+        Any: Clone of the Python object, in which custom class instances, lists, dictionaries, and sets are copied
+            (keeping objects referenced more than once, including through cycles, shared within the clone), while
+            immutable values (including tuples and frozensets of them) are shared with the original object.
+
+    """
+    base_subclasses = set(pyobjson_base_custom_subclasses)
+    excluded_atts = tuple(excluded_attributes)
+    class_keys = tuple(class_keys_for_excluded_attributes)
+    # clones by the identities (as returned by id()) of the original objects, which stay alive during cloning
+    clones: Dict[int, Any] = {}
+
+    with phase("clone", obj if type(obj) in base_subclasses else None):
+        cloned = [None]
+        # use an explicit stack of (operation, value, container into which to write the cloned value, key or index in
+        # that container) instead of recursion to support arbitrarily deep object graphs, and write immutable values
+        # directly into their containers without pushing them onto the stack
+        stack: List[Tuple[str, Any, Any, Any]] = [(_CLONE, obj, cloned, 0)]
+        while stack:
+            op, value, container, container_key = stack.pop()
+
+            if op == _CONVERT:
+                # convert the cloned items of a set or tuple after all of them were cloned
+                value_type, items, value_id = value
+                container[container_key] = clones[value_id] = value_type(items)
+                continue
+
+            if op == _BUILD:
+                # assign the attributes of a cloned custom class instance after all of them were cloned
+                set_instance_attributes(value, container)
+                continue
+
+            value_type = type(value)
+            if value_type in _IMMUTABLE_TYPES:
+                container[container_key] = value
+                continue
+
+            if (value_clone := clones.get(id(value))) is not None:
+                container[container_key] = value_clone
+                continue
+
+            if value_type in base_subclasses:
+                # create the clone without calling __init__ so cycles can reference it before its attributes are set
+                value_clone = container[container_key] = clones[id(value)] = value_type.__new__(value_type)
+
+                instance_attributes = get_instance_attributes(value)
+                cloned_atts = _derive_clone_attributes(
+                    value_type, tuple(instance_attributes), excluded_atts, class_keys
+                )
+
+                clone_attributes = {}
+                children = []
+                for att, val in instance_attributes.items():
+                    if att in cloned_atts:
+                        clone_attributes[att] = val
+                        if type(val) not in _IMMUTABLE_TYPES:
+                            children.append((_CLONE, val, clone_attributes, att))
+                    elif att in PYOBJSON_ATTRIBUTES and type(val) is list:
+                        # the pyobjson attributes of clones never share state with the original instances
+                        clone_attributes[att] = list(val)
+                    else:
+                        # excluded attributes (e.g. connections or file paths) are shared with the original instances
+                        clone_attributes[att] = val
+                stack.append((_BUILD, value_clone, clone_attributes, None))
+                stack.extend(children)
+
+            elif isinstance(value, dict):
+                # shallow copies keep the dictionary type (e.g. OrderedDict or defaultdict) and keys, and their values
+                # are cloned in place
+                value_clone = container[container_key] = clones[id(value)] = value.copy()
+                stack.extend(
+                    (_CLONE, v, value_clone, k) for k, v in value_clone.items() if type(v) not in _IMMUTABLE_TYPES
+                )
+
+            elif value_type is list:
+                value_clone = container[container_key] = clones[id(value)] = value.copy()
+                stack.extend(
+                    (_CLONE, v, value_clone, i) for i, v in enumerate(value_clone) if type(v) not in _IMMUTABLE_TYPES
+                )
+
+            elif value_type in (set, frozenset, tuple):
+                if all(type(v) in _IMMUTABLE_TYPES for v in value):
+                    # sets are copied, while frozensets and tuples of immutable values are immutable themselves
+                    container[container_key] = clones[id(value)] = value.copy() if value_type is set else value
+                    continue
+
+                # clone the items into a list and convert it once all of them were cloned
+                items = list(value)
+                stack.append((_CONVERT, (value_type, items, id(value)), container, container_key))
+                stack.extend((_CLONE, v, items, i) for i, v in enumerate(items) if type(v) not in _IMMUTABLE_TYPES)
+
             else:
-                return UNSERIALIZABLE
-        return obj
+                container[container_key] = _clone_value(value)
+
+    return cloned[0]
+
+
+@lru_cache(maxsize=None)
+def derive_required_class_args(ClassObject: Type) -> Tuple[str, ...]:
+    """Function to retrieve the required __init__ arguments (without defaults) of a custom class, cached by class.
+
+    Args:
+        ClassObject (Type): Custom class for which to retrieve the required __init__ arguments.
+
+    Returns:
+        tuple[str, ...]: Names of the required __init__ arguments of the custom class.
+
+    """
+    from inspect import getfullargspec
+
+    # get __init__ arguments for custom subclass
+    class_arg_spec = getfullargspec(ClassObject.__init__)
+    if class_arg_spec.defaults:
+        # exclude the Python self instance parameter and any arguments that have defaults from required args
+        return tuple(class_arg_spec.args[1 : -len(class_arg_spec.defaults)])
+    # exclude the Python self instance parameter from required args
+    return tuple(class_arg_spec.args[1:])
+
+
+def _derive_applied_extra_attributes(
+    ClassObject: Type,
+    class_instance_atts: Set[str],
+    required_class_args: Tuple[str, ...],
+    extra_attributes: Dict[str, Any],
+    class_keys_for_extra_attributes: Optional[List[str]],
+) -> Dict[str, Any]:
+    """Function to select the extra attributes to apply to a custom class instance missing required attributes.
+
+    Args:
+        ClassObject (Type): Custom class of the instance being deserialized.
+        class_instance_atts (set[str]): Original names of the attributes in the deserialized data.
+        required_class_args (tuple[str, ...]): Names of the required __init__ arguments of the custom class.
+        extra_attributes (dict[str, Any]): Dictionary with extra required class attributes for custom Python objects.
+        class_keys_for_extra_attributes (Optional[list[str]]): List of Python class keys for which to provide extra
+            Python class instantiation arguments provided in extra_attributes during deserialization.
+
+    Returns:
+        dict[str, Any]: Dictionary of the extra attributes to apply to the custom class instance.
+
+    """
+    applied_extras = {}
+    # check if any required instance attributes are missing from the deserialized data
+    if missing_instances_atts := set(required_class_args).difference(class_instance_atts):
+        if set(extra_attributes.keys()).issuperset(missing_instances_atts):
+            if class_keys_for_extra_attributes:
+                if derive_custom_object_key(ClassObject) in class_keys_for_extra_attributes:
+                    # apply all extra attributes for classes with keys in class_keys_for_extra_attributes
+                    applied_extras = extra_attributes
+                else:
+                    # apply only required extra attributes for classes without keys in class_keys_for_extra_attributes
+                    applied_extras = {k: v for k, v in extra_attributes.items() if k in missing_instances_atts}
+            else:
+                # apply all extra attributes for all custom classes if no class_keys_for_extra_attributes
+                applied_extras = extra_attributes
+        else:
+            logger.warning(
+                f"Missing required instance attributes "
+                f'"{missing_instances_atts.difference(set(extra_attributes.keys()))}" for custom '
+                f'class "{ClassObject.__name__}".'
+            )
+            sys.exit(1)
+    return applied_extras
+
+
+def _push_typed_key_value_pairs(
+    json_dict: Dict[str, Any],
+    deserialized_dict: Dict[str, Any],
+    stack: List[Tuple[Any, ...]],
+    out_of_band_buffer: Optional[memoryview] = None,
+    class_schema: Optional[Dict[str, Tuple[Optional[str], Optional[str]]]] = None,
+) -> None:
+    """Function to write the values of a JSON dictionary with pyobjson formatted keys into a dictionary with the
+    original keys, converting values that do not contain nested JSON data directly and pushing all other values onto
+    the deserialization stack.
+
+    Args:
+        json_dict (dict[str, Any]): JSON dictionary that may contain keys formatted with custom delimiters.
+        deserialized_dict (dict[str, Any]): Dictionary into which to write the deserialized values.
+        stack (list[tuple[Any, ...]]): Deserialization stack of pending operations.
+        out_of_band_buffer (Optional[memoryview], optional): Memory containing the out-of-band segments of
+            buffer-protocol values. Defaults to None.
+        class_schema (Optional[dict[str, tuple[Optional[str], Optional[str]]]], optional): Schema of the custom class
+            whose attributes are deserialized when deserializing data serialized in schema mode. Defaults to None.
+
+    Returns:
+        None
+
+    """
+    children = []
+    for typed_key, value in json_dict.items():
+        if class_schema and (schema_type := class_schema.get(typed_key)) is not None:
+            # use the schema type for plain attribute names without parsing the key
+            key = typed_key
+            type_category, type_name = schema_type if value is not None else (None, None)
+        else:
+            type_category, type_name, key = parse_typed_key(typed_key)
+            if type_name == "value" and type_category is None:
+                # values marked as not requiring type formatting in schema mode
+                type_name = None
+        deserialized_dict[key] = value
+        if type_category == "collection" and type_name not in ("bytes", "bytearray"):
+            if type(value) not in _JSON_BUILTIN_TYPES:
+                children.append((_DESERIALIZE, value, deserialized_dict, key))
+            if type_name == "set" or type_name == "tuple":
+                # convert sets and tuples after their elements have been deserialized
+                children.append((_CONVERT, deserialized_dict, key, type_name))
+        elif type_name is not None:
+            deserialized_dict[key] = convert_typed_value(type_category, type_name, key, value, out_of_band_buffer)
+        elif type(value) not in _JSON_BUILTIN_TYPES:
+            children.append((_DESERIALIZE, value, deserialized_dict, key))
+    # push children in reverse so they are deserialized in document order (required for reference IDs)
+    stack.extend(reversed(children))
 
 
 def deserialize(
@@ -287,11 +1380,13 @@ def deserialize(
     base_class_instance: Optional[Any] = None,
     extra_attributes: Optional[Dict[str, Any]] = None,
     class_keys_for_extra_attributes: Optional[List[str]] = None,
+    out_of_band_buffer: Optional[memoryview] = None,
 ) -> Any:
-    """Recursive function to deserialize JSON into typed data structures for conversion to custom Python objects.
+    """Function to deserialize JSON into typed data structures for conversion to custom Python objects.
 
     Args:
-        json_data (Any): JSON data to be deserialized.
+        json_data (Any): JSON data to be deserialized. The JSON data is never modified, so the same parsed JSON data
+            can be deserialized repeatedly or concurrently by multiple threads.
         pyobjson_base_custom_subclasses_by_key (dict[str, Type]): Dictionary with lowercase strings of all subclasses of
             PythonObjectJson as keys and subclasses as values.
         base_class_instance (Optional[Any], optional): Target class instance into which to deserialize JSON data.
@@ -301,115 +1396,290 @@ def deserialize(
             provide extra Python class instantiation arguments provided in extra_attributes during
             deserialization. If no class keys are provided, any attributes provided in extra_attributes will be
             provided as Python class instantiation arguments to all classes during deserialization.
+        out_of_band_buffer (Optional[memoryview], optional): Memory (e.g. a memory-mapped file) containing the
+            out-of-band segments of buffer-protocol values serialized with out_of_band_buffers. Defaults to None.
 
     Returns:
-        obj (Any): Object deserialized from JSON.
+        obj (Any): Object deserialized from JSON. Shared references serialized with "$id" and "$ref" values are restored
+            as references to the same object.
     """
     if not extra_attributes:
         extra_attributes = {}
 
-    base_subclasses: Dict[str, Type] = pyobjson_base_custom_subclasses_by_key
-    if isinstance(json_data, list):  # recursively deserialize all elements if json_data is a list
-        return [
-            deserialize(
-                item,
-                base_subclasses,
-                extra_attributes=extra_attributes,
-                class_keys_for_extra_attributes=class_keys_for_extra_attributes,
+    # unwrap data serialized in schema mode
+    schema = False
+    if isinstance(json_data, dict) and len(json_data) == 2 and "$schema" in json_data and "$data" in json_data:
+        if json_data["$schema"] != SCHEMA_FORMAT_VERSION:
+            raise ValueError(
+                f"JSON data schema format version ({json_data['$schema']}) is not compatible with pyobjson."
             )
-            for item in json_data
-        ]
-    elif isinstance(json_data, dict):  # recursively deserialize all values if json_data is a dictionary
-        # check if json_data is a dict with only one key that matches a custom subclass for object derivation
-        # noinspection PyUnboundLocalVariable
-        if len(json_data) == 1 and (single_key := next(iter(json_data.keys()))) and single_key in base_subclasses:
-            # noinspection PyPep8Naming
-            ClassObject = base_subclasses[single_key]  # retrieve custom subclass
-
-            # get __init__ arguments for custom subclass
-            class_arg_spec = getfullargspec(ClassObject.__init__)
-            if class_arg_spec.defaults:
-                # exclude the Python self instance parameter and any arguments that have defaults from required args
-                required_class_args = class_arg_spec.args[1: -len(class_arg_spec.defaults)]
-            else:
-                # exclude the Python self instance parameter from required args
-                required_class_args = class_arg_spec.args[1:]
+        schema = True
+        json_data = json_data["$data"]
+
+    base_subclasses: Dict[str, Type] = pyobjson_base_custom_subclasses_by_key
+    references: Dict[int, Any] = {}
+    # only collect per-class counters while instrumentation is enabled
+    class_stats: Optional[Dict[str, Dict[str, float]]] = {} if is_instrumentation_enabled() else None
 
-            class_instance_attributes: Dict[str, Any] = json_data[single_key]  # get JSON to be deserialized
+    with phase("deserialize", base_class_instance):
+        deserialized = [None]
+        # use an explicit stack of pending operations instead of recursion to support arbitrarily deep JSON data, where
+        # custom class instances are built only after all of their attributes have been deserialized
+        stack: List[Tuple[Any, ...]] = [(_DESERIALIZE, json_data, deserialized, 0)]
+        while stack:
+            operation = stack.pop()
 
-            if ClassObject == base_class_instance.__class__:
-                # avoid creating a new class instance if an existing base class instance has been provided
-                class_instance = base_class_instance
-            else:
-                # extract original attribute names from pyobjson formatted attribute keys
-                extracted_class_instance_atts = {att.split(DLIM)[-1] for att in class_instance_attributes.keys()}
-
-                # check if any required instance attributes are missing from the deserialized data
-                if missing_instances_atts := set(required_class_args).difference(extracted_class_instance_atts):
-                    if set(extra_attributes.keys()).issuperset(missing_instances_atts):
-                        if class_keys_for_extra_attributes:
-                            if derive_custom_object_key(ClassObject) in class_keys_for_extra_attributes:
-                                # apply all extra attributes for classes with keys in class_keys_for_extra_attributes
-                                class_instance_attributes.update(extra_attributes)
-                            else:
-                                # apply only required extra attributes for classes without keys in
-                                # class_keys_for_extra_attributes
-                                class_instance_attributes.update(
-                                    {
-                                        k: v
-                                        for k, v in extra_attributes
-                                        if k in missing_instances_atts.difference(set(extra_attributes.keys()))
-                                    }
-                                )
+            if class_stats is not None:
+                operation_start = perf_counter()
+
+            if operation[0] == _BUILD:
+                (
+                    _,
+                    ClassObject,
+                    class_instance,
+                    initialize,
+                    attributes,
+                    applied_extras,
+                    required_args,
+                    container,
+                    key,
+                ) = operation
+                # apply extra attributes after (and in place of) the deserialized attributes
+                attributes.update(applied_extras)
+                if class_instance is None:
+                    # create an instance of the custom subclass using the __init__ arguments
+                    class_instance = ClassObject(**{k: v for k, v in attributes.items() if k in required_args})
+                elif initialize:
+                    # initialize the already registered shared custom subclass instance using the __init__ arguments
+                    ClassObject.__init__(class_instance, **{k: v for k, v in attributes.items() if k in required_args})
+                # assign the remaining class attributes to the class instance
+                set_instance_attributes(class_instance, attributes)
+                container[key] = class_instance
+
+                if class_stats is not None:
+                    class_key = derive_custom_object_key(ClassObject)
+                    counters = class_stats.get(class_key) or class_stats.setdefault(class_key, new_class_counters())
+                    counters["deserialized_objects"] += 1
+                    counters["deserialized_attributes"] += len(attributes)
+                    counters["deserialize_seconds"] += perf_counter() - operation_start
+                continue
+
+            if operation[0] == _BUILD_COLUMNS:
+                _, ClassObject, columns, length, applied_extras, required_args, container, key = operation
+                column_atts = list(columns)
+                class_instances = []
+                # build all custom class instances in a single pass over the rows of the deserialized columns
+                for row in zip(*columns.values()) if columns else [()] * length:
+                    attributes = dict(zip(column_atts, row))
+                    # apply extra attributes after (and in place of) the deserialized attributes
+                    attributes.update(applied_extras)
+                    class_instance = ClassObject(**{k: v for k, v in attributes.items() if k in required_args})
+                    set_instance_attributes(class_instance, attributes)
+                    class_instances.append(class_instance)
+                container[key] = class_instances
+
+                if class_stats is not None:
+                    class_key = derive_custom_object_key(ClassObject)
+                    counters = class_stats.get(class_key) or class_stats.setdefault(class_key, new_class_counters())
+                    counters["deserialized_objects"] += length
+                    counters["deserialized_attributes"] += length * len(column_atts)
+                    counters["deserialize_seconds"] += perf_counter() - operation_start
+                continue
+
+            if operation[0] == _CONVERT:
+                _, container, key, type_name = operation
+                container[key] = set(container[key]) if type_name == "set" else tuple(container[key])
+                continue
+
+            _, json_value, container, key = operation
+
+            if isinstance(json_value, list):  # deserialize all elements if json_value is a list
+                deserialized_list = container[key] = list(json_value)
+                stack.extend(
+                    reversed(
+                        [
+                            (_DESERIALIZE, item, deserialized_list, i)
+                            for i, item in enumerate(json_value)
+                            if type(item) not in _JSON_BUILTIN_TYPES
+                        ]
+                    )
+                )
+
+            elif isinstance(json_value, dict):  # deserialize all values if json_value is a dictionary
+                # check if json_value is an escaped dictionary whose keys would otherwise be deserialized as markers
+                if len(json_value) == 1 and "$escape" in json_value:
+                    container[key] = deserialized_dict = {}
+                    _push_typed_key_value_pairs(json_value["$escape"], deserialized_dict, stack, out_of_band_buffer)
+                    continue
+
+                # check if json_value is a reference to an already deserialized shared object
+                if len(json_value) == 1 and isinstance(json_value.get("$ref"), int):
+                    container[key] = references[json_value["$ref"]]
+                    continue
+
+                # check if json_value is a shared list or dictionary and register it before deserializing its contents
+                # so references to it from within its contents (cycles) can be restored
+                if len(json_value) == 2 and isinstance(reference_id := json_value.get("$id"), int):
+                    if "$list" in json_value:
+                        shared_list = container[key] = references[reference_id] = list(json_value["$list"])
+                        stack.extend(
+                            reversed(
+                                [
+                                    (_DESERIALIZE, item, shared_list, i)
+                                    for i, item in enumerate(json_value["$list"])
+                                    if type(item) not in _JSON_BUILTIN_TYPES
+                                ]
+                            )
+                        )
+                        continue
+                    elif "$dict" in json_value:
+                        container[key] = references[reference_id] = {}
+                        _push_typed_key_value_pairs(json_value["$dict"], container[key], stack, out_of_band_buffer)
+                        continue
+
+                # check if json_value is a homogeneous list of custom class instances serialized as attribute columns
+                if len(json_value) == 3 and "$columns" in json_value:
+                    # noinspection PyPep8Naming
+                    ClassObject = base_subclasses[json_value["$columns"]]  # retrieve custom subclass
+                    required_class_args = derive_required_class_args(ClassObject)
+
+                    columns: Dict[str, List[Any]] = {}
+                    children = []
+                    for typed_key, column in json_value["$data"].items():
+                        type_category, type_name, att = parse_typed_key(typed_key)
+                        if type_category == "packed":
+                            columns[att] = convert_typed_value(type_category, type_name, att, column)
+                        elif type_category == "collection" and type_name not in ("bytes", "bytearray"):
+                            columns[att] = deserialized_column = list(column)
+                            for i, item in enumerate(column):
+                                if type(item) not in _JSON_BUILTIN_TYPES:
+                                    children.append((_DESERIALIZE, item, deserialized_column, i))
+                                if type_name == "set" or type_name == "tuple":
+                                    # convert sets and tuples after their elements have been deserialized
+                                    children.append((_CONVERT, deserialized_column, i, type_name))
+                        elif type_name is not None:
+                            columns[att] = [
+                                convert_typed_value(type_category, type_name, att, item, out_of_band_buffer)
+                                for item in column
+                            ]
                         else:
-                            # apply all extra attributes for all custom classes if no class_keys_for_extra_attributes
-                            class_instance_attributes.update(extra_attributes)
-                    else:
-                        logger.warning(
-                            f"Missing required instance attributes "
-                            f'"{missing_instances_atts.difference(set(extra_attributes.keys()))}" for custom '
-                            f'class "{ClassObject.__name__}".'
+                            columns[att] = deserialized_column = list(column)
+                            children.extend(
+                                (_DESERIALIZE, item, deserialized_column, i)
+                                for i, item in enumerate(column)
+                                if type(item) not in _JSON_BUILTIN_TYPES
+                            )
+
+                    applied_extras = _derive_applied_extra_attributes(
+                        ClassObject,
+                        set(columns),
+                        required_class_args,
+                        extra_attributes,
+                        class_keys_for_extra_attributes,
+                    )
+                    stack.append(
+                        (
+                            _BUILD_COLUMNS,
+                            ClassObject,
+                            columns,
+                            json_value["$length"],
+                            applied_extras,
+                            required_class_args,
+                            container,
+                            key,
                         )
-                        sys.exit(1)
-
-                # create an instance of the custom subclass using the __init__ arguments
-                class_instance = ClassObject(
-                    **{
-                        k: deserialize(
-                            v,
-                            base_subclasses,
-                            extra_attributes=extra_attributes,
-                            class_keys_for_extra_attributes=class_keys_for_extra_attributes,
+                    )
+                    # push children in reverse so they are deserialized in document order (required for reference IDs)
+                    stack.extend(reversed(children))
+                    continue
+
+                # check if json_value is a dict with only one key that matches a custom subclass for object derivation
+                if (
+                    len(json_value) == 1
+                    and (single_key := next(iter(json_value.keys())))
+                    and single_key in base_subclasses
+                ):
+                    # noinspection PyPep8Naming
+                    ClassObject = base_subclasses[single_key]  # retrieve custom subclass
+
+                    required_class_args = derive_required_class_args(ClassObject)
+
+                    class_instance_attributes: Dict[str, Any] = json_value[single_key]  # get JSON to be deserialized
+                    reference_id = class_instance_attributes.get("$id")
+
+                    class_instance = None
+                    initialize = False
+                    applied_extras = {}
+                    if container is deserialized and ClassObject == base_class_instance.__class__:
+                        # avoid creating a new class instance if an existing base class instance has been provided
+                        class_instance = base_class_instance
+                        if reference_id:
+                            references[reference_id] = class_instance
+                    else:
+                        # select extra attributes for any required attributes missing from the deserialized data using
+                        # the original attribute names extracted from the pyobjson formatted attribute keys
+                        applied_extras = _derive_applied_extra_attributes(
+                            ClassObject,
+                            {att.split(DLIM)[-1] for att in class_instance_attributes.keys()},
+                            required_class_args,
+                            extra_attributes,
+                            class_keys_for_extra_attributes,
                         )
-                        for k, v in extract_typed_key_value_pairs(class_instance_attributes, base_subclasses).items()
-                        if k in required_class_args
-                    }
-                )
 
-            # assign the remaining class attributes to the class instance
-            # noinspection PyUnresolvedReferences
-            vars(class_instance).update(
-                {
-                    k: deserialize(
-                        v,
-                        base_subclasses,
-                        extra_attributes=extra_attributes,
-                        class_keys_for_extra_attributes=class_keys_for_extra_attributes,
+                        if reference_id:
+                            # create and register an uninitialized instance of shared custom subclasses before
+                            # deserializing their attributes so references to them from within their attributes (cycles)
+                            # can be restored
+                            class_instance = references[reference_id] = ClassObject.__new__(ClassObject)
+                            initialize = True
+
+                    deserialized_attributes: Dict[str, Any] = {}
+                    stack.append(
+                        (
+                            _BUILD,
+                            ClassObject,
+                            class_instance,
+                            initialize,
+                            deserialized_attributes,
+                            applied_extras,
+                            required_class_args,
+                            container,
+                            key,
+                        )
+                    )
+                    if reference_id:
+                        # exclude the reference ID of shared custom class instances from their attributes
+                        class_instance_attributes = {k: v for k, v in class_instance_attributes.items() if k != "$id"}
+                    _push_typed_key_value_pairs(
+                        class_instance_attributes,
+                        deserialized_attributes,
+                        stack,
+                        out_of_band_buffer,
+                        compile_class_schema(ClassObject) if schema else None,
                     )
-                    for k, v in extract_typed_key_value_pairs(class_instance_attributes, base_subclasses).items()
-                }
-            )
 
-            return class_instance if not base_class_instance else None
-        else:
-            return {
-                k: deserialize(
-                    v,
-                    base_subclasses,
-                    extra_attributes=extra_attributes,
-                    class_keys_for_extra_attributes=class_keys_for_extra_attributes,
-                )
-                for k, v in extract_typed_key_value_pairs(json_data, base_subclasses).items()
-            }
-    else:
-        return json_data
+                    if class_stats is not None:
+                        counters = class_stats.get(single_key) or class_stats.setdefault(
+                            single_key, new_class_counters()
+                        )
+                        counters["deserialize_seconds"] += perf_counter() - operation_start
+
+                else:
+                    container[key] = deserialized_dict = {}
+                    _push_typed_key_value_pairs(json_value, deserialized_dict, stack, out_of_band_buffer)
+
+            else:
+                container[key] = json_value
+
+    if class_stats:
+        record_class_stats(class_stats)
+
+    # custom class instances deserialized into an existing base class instance are not returned
+    if (
+        base_class_instance is not None
+        and isinstance(json_data, dict)
+        and len(json_data) == 1
+        and next(iter(json_data.keys())) in base_subclasses
+    ):
+        return None
+    return deserialized[0]
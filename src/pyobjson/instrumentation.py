@@ -0,0 +1,294 @@
+"""Python Object JSON Tool pyobjson.instrumentation module.
+
+Attributes:
+    __author__ (str): Python package template author.
+    __email__ (str): Python package template author email.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import threading
+from contextlib import contextmanager
+from copy import deepcopy
+from logging import INFO, Logger, getLogger
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from pyobjson.utils import derive_custom_object_key
+
+logger = getLogger(__name__)
+
+# per-class counters kept for every custom class serialized or deserialized while instrumentation is enabled
+CLASS_COUNTERS = (
+    "serialized_objects",
+    "serialized_attributes",
+    "serialize_seconds",
+    "deserialized_objects",
+    "deserialized_attributes",
+    "deserialize_seconds",
+    "bytes_written",
+    "bytes_read",
+)
+
+# whether instrumentation is enabled, derived (under the lock) from whether it was enabled with enable_instrumentation
+# and from the number of instrumented blocks currently running in any thread
+_enabled = False
+_explicitly_enabled = False
+_instrumented_blocks = 0
+_lock = threading.Lock()
+_class_stats: Dict[str, Dict[str, float]] = {}
+_phase_stats: Dict[str, Dict[str, float]] = {}
+_phase_hooks: List[Callable[[str, str, Dict[str, Any]], None]] = []
+
+
+def is_instrumentation_enabled() -> bool:
+    """Check if pyobjson instrumentation is enabled.
+
+    Returns:
+        bool: Whether pyobjson instrumentation is enabled.
+
+    """
+    return _enabled
+
+
+def enable_instrumentation() -> None:
+    """Enable pyobjson instrumentation of serialization, deserialization, and I/O phases and per-class counters.
+
+    Returns:
+        None
+
+    """
+    global _enabled, _explicitly_enabled
+    with _lock:
+        _explicitly_enabled = True
+        _enabled = True
+
+
+def disable_instrumentation() -> None:
+    """Disable pyobjson instrumentation enabled with enable_instrumentation. Instrumentation stays enabled until all
+    instrumented blocks running in any thread have exited.
+
+    Returns:
+        None
+
+    """
+    global _enabled, _explicitly_enabled
+    with _lock:
+        _explicitly_enabled = False
+        _enabled = _instrumented_blocks > 0
+
+
+@contextmanager
+def instrumented(reset: bool = False) -> Iterator[None]:
+    """Context manager to enable pyobjson instrumentation within a block. Instrumented blocks are counted, so blocks
+    running concurrently in multiple threads keep instrumentation enabled until the last of them exits.
+
+    Args:
+        reset (bool, optional): Whether to reset all collected statistics before enabling instrumentation. Defaults to
+            False.
+
+    Returns:
+        Iterator[None]: Context manager enabling pyobjson instrumentation.
+
+    """
+    global _enabled, _instrumented_blocks
+    if reset:
+        reset_stats()
+    with _lock:
+        _instrumented_blocks += 1
+        _enabled = True
+    try:
+        yield
+    finally:
+        with _lock:
+            _instrumented_blocks -= 1
+            _enabled = _explicitly_enabled or _instrumented_blocks > 0
+
+
+def add_phase_hook(hook: Callable[[str, str, Dict[str, Any]], None]) -> None:
+    """Add a callback to be called at the start and end of every instrumented phase while instrumentation is enabled.
+
+    Args:
+        hook (Callable[[str, str, dict[str, Any]], None]): Callback called with the event ("start" or "end"), the phase
+            name (e.g. "serialize" or "save_to_json_file"), and a dictionary of phase details (the class key of the
+            root object, plus the elapsed seconds and any bytes written or read on "end").
+
+    Returns:
+        None
+
+    """
+    with _lock:
+        _phase_hooks.append(hook)
+
+
+def remove_phase_hook(hook: Callable[[str, str, Dict[str, Any]], None]) -> None:
+    """Remove a callback previously added with add_phase_hook.
+
+    Args:
+        hook (Callable[[str, str, dict[str, Any]], None]): The callback to remove.
+
+    Returns:
+        None
+
+    """
+    with _lock:
+        _phase_hooks.remove(hook)
+
+
+def new_class_counters() -> Dict[str, float]:
+    """Create a dictionary of zeroed per-class counters.
+
+    Returns:
+        dict[str, float]: Dictionary with the names in CLASS_COUNTERS as keys and zeros as values.
+
+    """
+    return dict.fromkeys(CLASS_COUNTERS, 0)
+
+
+def record_class_stats(class_stats: Dict[str, Dict[str, float]]) -> None:
+    """Add per-class counters collected during a single serialization or deserialization to the global statistics.
+
+    Args:
+        class_stats (dict[str, dict[str, float]]): Dictionary with class keys as keys and per-class counters as values.
+
+    Returns:
+        None
+
+    """
+    with _lock:
+        for class_key, counters in class_stats.items():
+            global_counters = _class_stats.setdefault(class_key, new_class_counters())
+            for counter, value in counters.items():
+                global_counters[counter] += value
+
+
+class _Phase(object):
+    """Context manager timing an instrumented phase, calling phase hooks, and recording phase statistics."""
+
+    def __init__(self, name: str, class_key: Optional[str]):
+        self.name: str = name
+        self.details: Dict[str, Any] = {"class_key": class_key}
+        self.start: float = 0.0
+
+    def __enter__(self) -> "_Phase":
+        for hook in list(_phase_hooks):
+            hook("start", self.name, self.details)
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.details["seconds"] = perf_counter() - self.start
+        with _lock:
+            phase_stats = _phase_stats.setdefault(self.name, {"calls": 0, "seconds": 0.0, "errors": 0})
+            phase_stats["calls"] += 1
+            phase_stats["seconds"] += self.details["seconds"]
+            phase_stats["errors"] += 1 if exc_type else 0
+        for hook in list(_phase_hooks):
+            hook("end", self.name, self.details)
+
+    def record_bytes(self, counter: str, byte_count: int) -> None:
+        """Record the bytes written or read during the phase for the class of the root object.
+
+        Args:
+            counter (str): The per-class counter to increment ("bytes_written" or "bytes_read").
+            byte_count (int): The number of bytes written or read.
+
+        Returns:
+            None
+
+        """
+        self.details[counter] = byte_count
+        if self.details["class_key"]:
+            record_class_stats({self.details["class_key"]: {counter: byte_count}})
+
+
+class _DisabledPhase(object):
+    """No-op stand-in for _Phase used while instrumentation is disabled."""
+
+    def __enter__(self) -> "_DisabledPhase":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        pass
+
+    def record_bytes(self, counter: str, byte_count: int) -> None:
+        pass
+
+
+_disabled_phase = _DisabledPhase()
+
+
+def phase(name: str, root_object: Optional[Any] = None) -> Any:
+    """Create a context manager for an instrumented phase, which does nothing while instrumentation is disabled.
+
+    Args:
+        name (str): The phase name.
+        root_object (Optional[Any], optional): The root custom class instance (or class) of the phase, used to derive
+            the class key reported to phase hooks and used for byte counters. Defaults to None.
+
+    Returns:
+        Any: Context manager for the phase with a record_bytes method.
+
+    """
+    if not _enabled:
+        return _disabled_phase
+    return _Phase(name, derive_custom_object_key(root_object) if root_object is not None else None)
+
+
+def stats() -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Create a snapshot of the pyobjson instrumentation statistics collected since the last reset.
+
+    Returns:
+        dict[str, dict[str, dict[str, float]]]: Dictionary with per-class counters by class key under "classes" and
+            call counts, error counts, and total seconds by phase name under "phases".
+
+    """
+    with _lock:
+        return {"classes": deepcopy(_class_stats), "phases": deepcopy(_phase_stats)}
+
+
+def reset_stats() -> None:
+    """Reset all collected pyobjson instrumentation statistics.
+
+    Returns:
+        None
+
+    """
+    with _lock:
+        _class_stats.clear()
+        _phase_stats.clear()
+
+
+def log_stats(stats_logger: Optional[Logger] = None, level: int = INFO) -> None:
+    """Export a snapshot of the pyobjson instrumentation statistics to a logger with one record per phase and class.
+
+    Args:
+        stats_logger (Optional[Logger], optional): The logger to which to export the statistics. Defaults to None,
+            which uses the pyobjson.instrumentation logger.
+        level (int, optional): The log level of the exported records. Defaults to INFO.
+
+    Returns:
+        None
+
+    """
+    stats_logger = stats_logger or logger
+    snapshot = stats()
+    for phase_name, phase_stats in sorted(snapshot["phases"].items()):
+        stats_logger.log(
+            level,
+            f'pyobjson phase "{phase_name}": {phase_stats["calls"]} calls, {phase_stats["errors"]} errors, '
+            f'{phase_stats["seconds"]:.6f} s',
+        )
+    for class_key, counters in sorted(
+        snapshot["classes"].items(), key=lambda item: -(item[1]["serialize_seconds"] + item[1]["deserialize_seconds"])
+    ):
+        stats_logger.log(
+            level,
+            f'pyobjson class "{class_key}": '
+            + ", ".join(
+                f"{counter}={value:.6f}" if isinstance(value, float) else f"{counter}={value}"
+                for counter, value in counters.items()
+            ),
+        )
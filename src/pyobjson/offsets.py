@@ -0,0 +1,177 @@
+"""Python Object JSON Tool pyobjson.offsets module.
+
+Attributes:
+    __author__ (str): Python package template author.
+    __email__ (str): Python package template author email.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import json
+import mmap
+from functools import lru_cache
+from logging import getLogger
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Union
+
+from pyobjson.constants import OFFSET_INDEX_FORMAT_VERSION
+from pyobjson.data import parse_typed_key
+
+logger = getLogger(__name__)
+
+# JSON indentation (matching json.dump with indent=2) of attribute values and of their items
+_ATTRIBUTE_INDENT = " " * 4
+_ITEM_INDENT = " " * 6
+
+
+def _encode(value: Any, indent: str) -> bytes:
+    """Function to encode a value as indented JSON nested at a given indentation.
+
+    Args:
+        value (Any): JSON serializable value.
+        indent (str): Indentation of the line on which the value starts.
+
+    Returns:
+        bytes: UTF-8 encoded JSON (JSON strings never contain raw newlines, so nested lines can be indented safely).
+
+    """
+    return json.dumps(value, ensure_ascii=False, indent=2).replace("\n", f"\n{indent}").encode("utf-8")
+
+
+def dump_with_offset_index(serializable_dict: Dict[str, Any], json_file_out: BinaryIO) -> Dict[str, Any]:
+    """Function to write the serializable dictionary of a custom class instance as JSON (identical to json.dump with
+    indent=2) and record the byte offsets and lengths of each attribute value and of each item of list and dictionary
+    attribute values.
+
+    Args:
+        serializable_dict (dict[str, Any]): Serializable dictionary of a custom class instance (as returned by
+            PythonObjectJson.serialize without track_references or schema).
+        json_file_out (BinaryIO): Binary file to which to write the JSON.
+
+    Returns:
+        dict[str, Any]: Offset index with the original attribute names as keys of its attributes dictionary.
+
+    """
+    ((class_key, serializable_atts),) = serializable_dict.items()
+
+    attributes_index = {}
+    position = 0
+
+    def write(chunk: bytes) -> None:
+        nonlocal position
+        json_file_out.write(chunk)
+        position += len(chunk)
+
+    write(f"{{\n  {json.dumps(class_key, ensure_ascii=False)}: {{".encode("utf-8"))
+    for i, (typed_att, val) in enumerate(serializable_atts.items()):
+        write(f"{',' if i else ''}\n{_ATTRIBUTE_INDENT}{json.dumps(typed_att, ensure_ascii=False)}: ".encode("utf-8"))
+        attribute_offset = position
+
+        type_category, type_name, att = parse_typed_key(typed_att)
+        items_index: Optional[Union[List[List[int]], Dict[str, List[Any]]]] = None
+        if type_category == "collection" and type(val) is list and val:
+            # record the offsets of the items of list, set, and tuple attribute values
+            items_index = []
+            write(b"[")
+            for j, item in enumerate(val):
+                write(f"{',' if j else ''}\n{_ITEM_INDENT}".encode("utf-8"))
+                item_offset = position
+                write(_encode(item, _ITEM_INDENT))
+                items_index.append([item_offset, position - item_offset])
+            write(f"\n{_ATTRIBUTE_INDENT}]".encode("utf-8"))
+        elif (
+            type_category == "collection"
+            and type_name == "dict"
+            and type(val) is dict
+            and val
+            and all(type(key) is str for key in val)
+            and not (len(val) == 1 and "$escape" in val)
+        ):
+            # record the pyobjson formatted keys and offsets of the values of dictionary attribute values
+            items_index = {}
+            write(b"{")
+            for j, (typed_key, item) in enumerate(val.items()):
+                encoded_key = json.dumps(typed_key, ensure_ascii=False)
+                write(f"{',' if j else ''}\n{_ITEM_INDENT}{encoded_key}: ".encode("utf-8"))
+                item_offset = position
+                write(_encode(item, _ITEM_INDENT))
+                items_index[parse_typed_key(typed_key)[2]] = [typed_key, item_offset, position - item_offset]
+            write(f"\n{_ATTRIBUTE_INDENT}}}".encode("utf-8"))
+        else:
+            write(_encode(val, _ATTRIBUTE_INDENT))
+
+        attributes_index[att] = {
+            "key": typed_att,
+            "offset": attribute_offset,
+            "length": position - attribute_offset,
+            "items": items_index,
+        }
+    write(b"\n  }\n}" if serializable_atts else b"}\n}")
+
+    return {
+        "format_version": OFFSET_INDEX_FORMAT_VERSION,
+        "class_key": class_key,
+        "size": position,
+        "attributes": attributes_index,
+    }
+
+
+@lru_cache(maxsize=16)
+def _read_offset_index(index_file_path: str, index_file_mtime_ns: int) -> Dict[str, Any]:
+    """Function to read an offset index file, cached by file path and modification time.
+
+    Args:
+        index_file_path (str): Path of the offset index file.
+        index_file_mtime_ns (int): Modification time of the offset index file in nanoseconds.
+
+    Returns:
+        dict[str, Any]: Offset index.
+
+    """
+    with open(index_file_path, "rb") as index_file_in:
+        offset_index = json.loads(index_file_in.read())
+
+    if offset_index.get("format_version") != OFFSET_INDEX_FORMAT_VERSION:
+        raise ValueError(
+            f"Offset index format version ({offset_index.get('format_version')}) is not compatible with pyobjson."
+        )
+    return offset_index
+
+
+def read_offset_index(index_file_path: Path, json_file_path: Path) -> Dict[str, Any]:
+    """Function to read the offset index file of a JSON file and confirm that it matches the JSON file.
+
+    Args:
+        index_file_path (Path): Path of the offset index file.
+        json_file_path (Path): Path of the JSON file indexed by the offset index file.
+
+    Returns:
+        dict[str, Any]: Offset index.
+
+    """
+    if not index_file_path.exists():
+        raise FileNotFoundError(f"Offset index file {index_file_path} does not exist. Unable to load item.")
+
+    offset_index = _read_offset_index(str(index_file_path), index_file_path.stat().st_mtime_ns)
+    if offset_index["size"] != json_file_path.stat().st_size:
+        raise ValueError(f"Offset index file {index_file_path} does not match JSON file {json_file_path}.")
+    return offset_index
+
+
+def read_json_fragment(json_file_path: Path, offset: int, length: int) -> Any:
+    """Function to read and decode only the JSON value at a given byte offset of a JSON file using a memory map.
+
+    Args:
+        json_file_path (Path): Path of the JSON file.
+        offset (int): Byte offset of the JSON value in the JSON file.
+        length (int): Length in bytes of the JSON value.
+
+    Returns:
+        Any: Decoded JSON value.
+
+    """
+    with open(json_file_path, "rb") as json_file_in:
+        with mmap.mmap(json_file_in.fileno(), 0, access=mmap.ACCESS_READ) as json_file_map:
+            return json.loads(json_file_map[offset : offset + length])
@@ -0,0 +1,72 @@
+"""Python Object JSON Tool pyobjson.prefork module.
+
+Attributes:
+    __author__ (str): Python package template author.
+    __email__ (str): Python package template author email.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import gc
+from logging import getLogger
+from typing import Iterable, List, Optional, Type
+
+from pyobjson.base import PythonObjectJson, get_base_subclasses
+from pyobjson.constants import PYOBJSON_ATTRIBUTES
+from pyobjson.data import derive_required_class_args
+from pyobjson.schema import compile_class_schema
+from pyobjson.utils import compile_regex, get_nested_subclasses, get_slot_names
+
+logger = getLogger(__name__)
+
+# modules that pyobjson only imports on first use
+_LAZILY_IMPORTED_MODULES = ("base64", "concurrent.futures", "inspect", "json", "pathlib")
+
+
+def warmup(
+    classes: Optional[Iterable[Type]] = None, attribute_patterns: Optional[Iterable[str]] = None, freeze: bool = True
+) -> List[Type]:
+    """Function to build the per-class caches and lookup tables of pyobjson ahead of time (e.g. in the master process
+    before forking worker processes), so the first serialization or deserialization in each worker process is as fast
+    as any later one and the cached objects stay in memory pages shared with the worker processes.
+
+    Args:
+        classes (Optional[Iterable[Type]], optional): Custom classes for which to build the caches, including all of
+            their nested subclasses. If None, the caches are built for all subclasses of PythonObjectJson. Defaults to
+            None.
+        attribute_patterns (Optional[Iterable[str]], optional): Excluded or extra attribute regular expressions to
+            compile in addition to the pyobjson attribute names. Defaults to None.
+        freeze (bool, optional): Whether to move all objects tracked by the garbage collector (including the caches) to
+            a permanent generation with gc.freeze(), so garbage collections in forked worker processes never write to
+            (and copy) the memory pages they share with the master process. For the most memory sharing, also call
+            gc.disable() early in the master process and gc.enable() early in each worker process. Defaults to True.
+
+    Returns:
+        list[Type]: The custom classes for which the caches were built.
+
+    """
+    for module_name in _LAZILY_IMPORTED_MODULES:
+        __import__(module_name)
+
+    # collect the custom classes (and their nested subclasses) without duplicates in a stable order
+    custom_classes = {}
+    for base_class in classes if classes is not None else [PythonObjectJson]:
+        custom_classes.update(dict.fromkeys([base_class, *get_nested_subclasses(base_class)]))
+    custom_classes.pop(PythonObjectJson, None)
+
+    for custom_class in custom_classes:
+        get_base_subclasses(custom_class.__mro__[-2])
+        derive_required_class_args(custom_class)
+        get_slot_names(custom_class)
+        compile_class_schema(custom_class)
+
+    for attribute_pattern in (*PYOBJSON_ATTRIBUTES, *(attribute_patterns or [])):
+        compile_regex(attribute_pattern)
+
+    if freeze:
+        gc.freeze()
+
+    logger.debug(f"Warmed up pyobjson caches for {len(custom_classes)} custom classes (frozen: {freeze}).")
+    return list(custom_classes)
@@ -0,0 +1,121 @@
+"""Python Object JSON Tool pyobjson.projection module.
+
+Attributes:
+    __author__ (str): Python package template author.
+    __email__ (str): Python package template author email.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+from functools import lru_cache
+from logging import getLogger
+from typing import Any, Dict, Iterable, Optional, Tuple, Type
+
+from pyobjson.constants import PROJECTION_CACHE_MAX_SIZE
+
+logger = getLogger(__name__)
+
+# compiled projections are hashable trees of (attribute name, nested projection) pairs sorted by attribute name, where a
+# nested projection of None selects (or excludes) the entire attribute value
+ProjectionTree = Tuple[Tuple[str, Any], ...]
+
+
+def _freeze_projection(projection: Dict[str, Any]) -> ProjectionTree:
+    """Function to convert a nested dictionary projection into a hashable projection tree.
+
+    Args:
+        projection (dict[str, Any]): Dictionary with attribute names as keys and nested dictionary projections (or
+            None for entire attribute values) as values.
+
+    Returns:
+        ProjectionTree: Hashable projection tree.
+
+    """
+    return tuple(
+        (att, _freeze_projection(nested) if nested is not None else None) for att, nested in sorted(projection.items())
+    )
+
+
+@lru_cache(maxsize=PROJECTION_CACHE_MAX_SIZE)
+def compile_projection(attribute_paths: Tuple[str, ...]) -> ProjectionTree:
+    """Function to compile dotted attribute paths across nested custom class instances into a projection tree.
+
+    Args:
+        attribute_paths (tuple[str, ...]): Dotted attribute paths (e.g. "attribute" or "attribute.nested_attribute").
+            A path that is a prefix of another path covers the entire attribute value of the longer path.
+
+    Returns:
+        ProjectionTree: Hashable projection tree.
+
+    """
+    projection: Dict[str, Any] = {}
+    for attribute_path in attribute_paths:
+        *parent_atts, leaf_att = attribute_path.split(".")
+        nested = projection
+        for att in parent_atts:
+            if att in nested and nested[att] is None:
+                # an entire attribute value is already covered by a shorter path
+                break
+            nested = nested.setdefault(att, {})
+        else:
+            nested[leaf_att] = None
+    return _freeze_projection(projection)
+
+
+def compile_projection_paths(attribute_paths: Optional[Iterable[str]]) -> Optional[ProjectionTree]:
+    """Function to compile optional dotted attribute paths into a projection tree.
+
+    Args:
+        attribute_paths (Optional[Iterable[str]]): Dotted attribute paths, or None for no projection.
+
+    Returns:
+        Optional[ProjectionTree]: Hashable projection tree, or None if no attribute paths were provided.
+
+    """
+    return compile_projection(tuple(attribute_paths)) if attribute_paths is not None else None
+
+
+@lru_cache(maxsize=PROJECTION_CACHE_MAX_SIZE)
+def project_attributes(
+    custom_class: Type,
+    serializable_atts: Tuple[str, ...],
+    only: Optional[ProjectionTree],
+    exclude: Optional[ProjectionTree],
+) -> Tuple[Tuple[str, ...], Dict[str, Tuple[Optional[ProjectionTree], Optional[ProjectionTree]]]]:
+    """Function to select the serializable attributes of a custom class in a projection and the projections of their
+    nested custom class instances.
+
+    Args:
+        custom_class (Type): Custom class of the projected instances.
+        serializable_atts (tuple[str, ...]): Names of the attributes of the instances that are not excluded from
+            serialization.
+        only (Optional[ProjectionTree]): Projection tree of the attributes to select, or None to select all attributes.
+        exclude (Optional[ProjectionTree]): Projection tree of the attributes to exclude, or None to exclude no
+            attributes.
+
+    Returns:
+        tuple[tuple[str, ...], dict[str, tuple[Optional[ProjectionTree], Optional[ProjectionTree]]]]: The names of the
+            selected attributes, and a dictionary with the selected attribute names as keys and the only and exclude
+            projection trees to apply to their nested custom class instances as values.
+
+    """
+    only_projection = dict(only) if only is not None else None
+    exclude_projection = dict(exclude) if exclude is not None else {}
+
+    projected_atts = []
+    nested_projections = {}
+    for att in serializable_atts:
+        if only_projection is not None and att not in only_projection:
+            continue
+        if att in exclude_projection and exclude_projection[att] is None:
+            continue
+        projected_atts.append(att)
+        nested_projections[att] = (
+            only_projection.get(att) if only_projection is not None else None,
+            exclude_projection.get(att),
+        )
+
+    logger.debug(f'Compiled projection of custom class "{custom_class.__name__}": {projected_atts}')
+    return tuple(projected_atts), nested_projections
@@ -0,0 +1,109 @@
+"""Python Object JSON Tool pyobjson.schema module.
+
+Attributes:
+    __author__ (str): Python package template author.
+    __email__ (str): Python package template author email.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import sys
+import types
+from collections.abc import Callable as AbcCallable
+from datetime import datetime
+from functools import lru_cache
+from logging import getLogger
+from typing import Any, Dict, Optional, Tuple, Type, Union, get_args, get_origin, get_type_hints
+
+logger = getLogger(__name__)
+
+# value type categories and value types (as used in pyobjson formatted keys) by annotated type
+_SCHEMA_TYPES_BY_ANNOTATION: Dict[Any, Tuple[Optional[str], Optional[str]]] = {
+    dict: ("collection", "dict"),
+    list: ("collection", "list"),
+    set: ("collection", "set"),
+    tuple: ("collection", "tuple"),
+    bytes: ("collection", "bytes"),
+    bytearray: ("collection", "bytearray"),
+    memoryview: ("buffer", "memoryview"),
+    datetime: (None, "datetime"),
+    AbcCallable: ("callable", "function"),
+    str: (None, None),
+    int: (None, None),
+    float: (None, None),
+    bool: (None, None),
+}
+
+# Optional[X] and X | None annotations (types.UnionType is only available in Python 3.10+)
+_UNION_TYPES = {Union, getattr(types, "UnionType", Union)}
+
+
+def derive_schema_type(annotation: Any) -> Optional[Tuple[Optional[str], Optional[str]]]:
+    """Function to derive the pyobjson value type category and value type of an annotated attribute.
+
+    Args:
+        annotation (Any): The type annotation of the attribute.
+
+    Returns:
+        Optional[tuple[Optional[str], Optional[str]]]: The value type category and value type (as used in pyobjson
+            formatted keys, or None for both if the value does not require type formatting), or None if the
+            annotation does not identify a single supported type.
+
+    """
+    origin = get_origin(annotation) or annotation
+
+    if origin in _UNION_TYPES:
+        # Optional[X] uses the schema type of X because None values never require type formatting
+        non_none_args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return derive_schema_type(non_none_args[0]) if len(non_none_args) == 1 else None
+
+    if (schema_type := _SCHEMA_TYPES_BY_ANNOTATION.get(origin)) is not None:
+        return schema_type
+
+    if not isinstance(origin, type):
+        return None
+
+    # pathlib, array, and numpy are only checked if they were already imported to resolve the annotations
+    if (pathlib := sys.modules.get("pathlib")) is not None and issubclass(origin, pathlib.Path):
+        return None, "path"
+    if (array_module := sys.modules.get("array")) is not None and origin is array_module.array:
+        return "buffer", "array"
+    if (numpy := sys.modules.get("numpy")) is not None and origin is numpy.ndarray:
+        return "buffer", "ndarray"
+
+    # imported lazily to avoid a circular import
+    from pyobjson.base import PythonObjectJson
+
+    if issubclass(origin, PythonObjectJson):
+        # custom class instances do not require type formatting
+        return None, None
+    return None
+
+
+@lru_cache(maxsize=None)
+def compile_class_schema(custom_class: Type) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+    """Function to compile the schema of a custom class from the type annotations of its __init__ arguments, which are
+    expected to be assigned to instance attributes with the same names.
+
+    Args:
+        custom_class (Type): Custom class for which to compile the schema.
+
+    Returns:
+        dict[str, tuple[Optional[str], Optional[str]]]: Dictionary with attribute names as keys and the value type
+            category and value type of each attribute as values. Attributes without annotations or with annotations
+            that do not identify a single supported type are not included.
+
+    """
+    try:
+        annotations = get_type_hints(custom_class.__init__)
+    except (NameError, TypeError) as e:
+        logger.debug(f'Unable to resolve the __init__ type annotations of custom class "{custom_class.__name__}": {e}')
+        return {}
+
+    class_schema = {}
+    for att, annotation in annotations.items():
+        if att != "return" and (schema_type := derive_schema_type(annotation)) is not None:
+            class_schema[att] = schema_type
+    return class_schema
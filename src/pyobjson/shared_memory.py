@@ -0,0 +1,227 @@
+"""Python Object JSON Tool pyobjson.shared_memory module.
+
+Attributes:
+    __author__ (str): Python package template author.
+    __email__ (str): Python package template author email.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import ctypes
+import json
+import os
+import struct
+import sys
+import weakref
+from logging import getLogger
+from multiprocessing import shared_memory
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from pyobjson.constants import SHARED_MEMORY_FORMAT_VERSION
+from pyobjson.data import BUFFER_SEGMENT_ALIGNMENT
+
+logger = getLogger(__name__)
+
+# header of each segment with the format version, the size of the compact JSON following the header, and the offset of
+# the out-of-band buffer segments (aligned so memory-mapped arrays can be created directly from them)
+_HEADER = struct.Struct("<QQQ")
+
+# segments created by this process on Windows (where segments only exist while a process keeps them open) by segment
+# name
+_open_segments: Dict[str, shared_memory.SharedMemory] = {}
+_open_segments_lock = Lock()
+
+
+def _derive_tracked_name(segment: shared_memory.SharedMemory) -> str:
+    """Function to derive the name under which the resource tracker of the current process tracks a POSIX shared memory
+    segment, which is the segment name prefixed with a slash (as passed to shm_open).
+
+    Args:
+        segment (shared_memory.SharedMemory): Shared memory segment.
+
+    Returns:
+        str: The name of the segment in the resource tracker.
+
+    """
+    return f"/{segment.name}"
+
+
+def _open_segment(name: Optional[str] = None, size: int = 0) -> shared_memory.SharedMemory:
+    """Function to create or attach to a shared memory segment whose lifetime is managed by pyobjson instead of by the
+    resource tracker of the current process (which would otherwise unlink it when the process exits).
+
+    Args:
+        name (Optional[str], optional): Name of the segment to which to attach, or None to create a new segment.
+            Defaults to None.
+        size (int, optional): Size in bytes of the segment to create. Defaults to 0.
+
+    Returns:
+        shared_memory.SharedMemory: The created or attached shared memory segment.
+
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, create=name is None, size=size, track=False)
+
+    segment = shared_memory.SharedMemory(name=name, create=name is None, size=size)
+    if os.name == "posix":
+        from multiprocessing import resource_tracker
+
+        # segments are registered with the resource tracker when created or attached before Python 3.13
+        resource_tracker.unregister(_derive_tracked_name(segment), "shared_memory")
+    return segment
+
+
+def _unlink_segment(segment: shared_memory.SharedMemory) -> None:
+    """Function to remove the name of an untracked shared memory segment, so its memory is freed once it is closed by
+    all processes.
+
+    Args:
+        segment (shared_memory.SharedMemory): Shared memory segment opened with _open_segment.
+
+    Returns:
+        None
+
+    """
+    if sys.version_info < (3, 13) and os.name == "posix":
+        from multiprocessing import resource_tracker
+
+        # SharedMemory.unlink also unregisters the segment from the resource tracker before Python 3.13
+        resource_tracker.register(_derive_tracked_name(segment), "shared_memory")
+    segment.unlink()
+
+
+def write_shared_memory(serializable_data: Any, buffer_segments: List[Tuple[int, memoryview]]) -> Tuple[str, int]:
+    """Function to write serialized data as compact JSON followed by its out-of-band buffer segments into a new shared
+    memory segment.
+
+    Args:
+        serializable_data (Any): Serializable data (as returned by PythonObjectJson.serialize).
+        buffer_segments (list[tuple[int, memoryview]]): Aligned offsets and raw bytes of the out-of-band buffer segments
+            of the serialized data.
+
+    Returns:
+        tuple[str, int]: The name and the size in bytes of the shared memory segment.
+
+    """
+    json_bytes = json.dumps(serializable_data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    buffers_offset = -(-(_HEADER.size + len(json_bytes)) // BUFFER_SEGMENT_ALIGNMENT) * BUFFER_SEGMENT_ALIGNMENT
+    buffers_size = buffer_segments[-1][0] + buffer_segments[-1][1].nbytes if buffer_segments else 0
+
+    segment = _open_segment(size=buffers_offset + buffers_size)
+    segment_size = segment.size
+    try:
+        _HEADER.pack_into(segment.buf, 0, SHARED_MEMORY_FORMAT_VERSION, len(json_bytes), buffers_offset)
+        segment.buf[_HEADER.size : _HEADER.size + len(json_bytes)] = json_bytes
+        for offset, buffer_segment in buffer_segments:
+            # copy the raw bytes of each buffer segment directly from its memory into the shared memory
+            segment.buf[buffers_offset + offset : buffers_offset + offset + buffer_segment.nbytes] = buffer_segment
+    except BaseException:
+        _unlink_segment(segment)
+        segment.close()
+        raise
+
+    if os.name == "nt":
+        # Windows frees a segment as soon as no process has it open, so keep it open until it is released
+        with _open_segments_lock:
+            _open_segments[segment.name] = segment
+    else:
+        segment.close()
+
+    logger.debug(f'Wrote {segment_size} bytes to shared memory segment "{segment.name}".')
+    return segment.name, segment_size
+
+
+def read_shared_memory(name: str, unlink: bool = True) -> Tuple[Any, Optional[memoryview], int]:
+    """Function to attach to a shared memory segment written by write_shared_memory and read its serialized data.
+
+    The out-of-band buffer segments are returned as a view of the shared memory, so buffer-protocol values can be
+    deserialized without copying them. The memory stays mapped only as long as that view (or any memoryview or NumPy
+    array derived from it) is alive, and is unmapped as soon as the last of them is released or garbage collected. The
+    segment is closed immediately if it has no out-of-band buffer segments.
+
+    Args:
+        name (str): Name of the shared memory segment.
+        unlink (bool, optional): Whether to remove the name of the segment once it is attached, so its memory is freed
+            as soon as it is unmapped (and no other process can attach to it). Defaults to True.
+
+    Returns:
+        tuple[Any, Optional[memoryview], int]: The serialized data, the memory containing the out-of-band buffer
+            segments (or None if there are none), and the size in bytes of the shared memory segment.
+
+    """
+    segment = _open_segment(name=name)
+    segment_size = segment.size
+    out_of_band_buffer = None
+    try:
+        if unlink:
+            _unlink_segment(segment)
+
+        format_version, json_size, buffers_offset = _HEADER.unpack_from(segment.buf, 0)
+        if format_version != SHARED_MEMORY_FORMAT_VERSION:
+            raise ValueError(f"Shared memory format version ({format_version}) is not compatible with pyobjson.")
+
+        # decode the JSON directly from the shared memory without copying it into an intermediate bytes object
+        with segment.buf[_HEADER.size : _HEADER.size + json_size] as json_buffer:
+            serializable_data = json.loads(str(json_buffer, "utf-8"))
+
+        if segment_size > buffers_offset:
+            # expose the out-of-band buffer segments through an array that refers to the mapped memory by address
+            # (without holding a buffer export that would keep the segment from being closed) and keeps the segment
+            # open, so the segment is closed and unmapped only once no views derived from the array are alive
+            with segment.buf[buffers_offset:] as buffers_view:
+                buffers_address = ctypes.addressof(ctypes.c_char.from_buffer(buffers_view))
+            buffers_array = (ctypes.c_char * (segment_size - buffers_offset)).from_address(buffers_address)
+            buffers_array.segment = segment
+            out_of_band_buffer = memoryview(buffers_array).cast("B")
+            weakref.finalize(buffers_array, logger.debug, f'Unmapped shared memory segment "{name}".')
+    finally:
+        if out_of_band_buffer is None:
+            segment.close()
+
+    logger.debug(f'Read {segment_size} bytes from shared memory segment "{name}".')
+    return serializable_data, out_of_band_buffer, segment_size
+
+
+def release_shared_memory(name: str) -> bool:
+    """Function to close a shared memory segment created by this process on Windows, where a segment only exists until
+    it is closed by all processes that have it open. Loaded segments do not need to be released, since their memory is
+    unmapped as soon as no loaded buffer-protocol values reference it anymore.
+
+    Args:
+        name (str): Name of the shared memory segment.
+
+    Returns:
+        bool: Whether the segment was open in this process and was closed.
+
+    """
+    with _open_segments_lock:
+        segment = _open_segments.pop(name, None)
+    if segment is None:
+        return False
+    segment.close()
+    return True
+
+
+def discard_shared_memory(name: str) -> None:
+    """Function to free a shared memory segment written by write_shared_memory that will never be loaded.
+
+    Args:
+        name (str): Name of the shared memory segment.
+
+    Returns:
+        None
+
+    """
+    with _open_segments_lock:
+        segment = _open_segments.pop(name, None)
+    if segment is None:
+        try:
+            segment = _open_segment(name=name)
+        except FileNotFoundError:
+            # the segment was already loaded with unlink or discarded
+            return
+    _unlink_segment(segment)
+    segment.close()
@@ -0,0 +1,407 @@
+"""Python Object JSON Tool pyobjson.snapshot module.
+
+Attributes:
+    __author__ (str): Python package template author.
+    __email__ (str): Python package template author email.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from hashlib import sha256
+from logging import getLogger
+from pathlib import Path
+from tempfile import mkstemp
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from pyobjson.constants import (
+    SNAPSHOT_FORMAT_VERSION,
+    SNAPSHOT_MANIFEST_FILE_NAME,
+    SNAPSHOT_SHARDS_DIRECTORY_NAME,
+)
+
+logger = getLogger(__name__)
+
+# keys of the marker dictionaries of split lists and dictionaries, where dictionaries of serializable data with one of
+# them as their only key are written as {"$escape": <dictionary>} so they are never joined as split values
+_MARKER_KEYS = frozenset(("$shards", "$escape"))
+
+# rope of a list or dictionary being encoded: nested lists of JSON fragments that are only joined into a string once,
+# when the shard (or root) containing it is written, so each value is encoded and copied exactly once
+Rope = Union[str, List[Any]]
+
+
+def _encode(value: Any) -> str:
+    """Function to encode a value as compact JSON.
+
+    Args:
+        value (Any): JSON serializable value.
+
+    Returns:
+        str: Compact JSON string.
+
+    """
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _encode_key(key: Any) -> str:
+    """Function to encode a dictionary key as a compact JSON object key (matching the key conversion of json.dumps).
+
+    Args:
+        key (Any): Dictionary key.
+
+    Returns:
+        str: Compact JSON string of the object key followed by a colon.
+
+    """
+    return f"{_encode(key if type(key) is str else _encode(key))}:"
+
+
+def _join_rope(rope: Rope) -> str:
+    """Function to join the JSON fragments of a rope into a string.
+
+    Args:
+        rope (Rope): JSON string or nested lists of JSON fragments.
+
+    Returns:
+        str: Joined JSON string.
+
+    """
+    fragments = []
+    stack = [rope]
+    while stack:
+        fragment = stack.pop()
+        if type(fragment) is str:
+            fragments.append(fragment)
+        else:
+            stack.extend(reversed(fragment))
+    return "".join(fragments)
+
+
+def _join_items(brackets: str, encoded_items: List[Rope]) -> List[Rope]:
+    """Function to build the rope of a list or dictionary from the ropes of its encoded items.
+
+    Args:
+        brackets (str): Opening and closing brackets ("[]" or "{}").
+        encoded_items (list[Rope]): Ropes of the encoded items (including the encoded keys of dictionary values).
+
+    Returns:
+        list[Rope]: Rope of the list or dictionary.
+
+    """
+    rope: List[Rope] = [brackets[0]]
+    for i, encoded_item in enumerate(encoded_items):
+        if i:
+            rope.append(",")
+        rope.append(encoded_item)
+    rope.append(brackets[1])
+    return rope
+
+
+def split_into_shards(serializable_data: Any, shard_size: int) -> List[Tuple[str, bool]]:
+    """Function to split serializable data into shards of compact JSON that each fit into a size budget (unless a
+    single list item or dictionary value is larger than the budget). Lists and dictionaries that are larger than the
+    budget (after their own large items are split) are replaced with {"$shards": [<shard indices>]}, and their items
+    are split into consecutive shards in their original order. Dictionaries whose only key is "$shards" or "$escape"
+    are written as {"$escape": <dictionary>} and never replaced, so they are not mistaken for split values. Every value
+    is encoded exactly once, bottom-up, and the sizes of lists and dictionaries are derived from the sizes of their
+    encoded items. The serializable data is not modified.
+
+    Args:
+        serializable_data (Any): Serializable data (e.g. as returned by PythonObjectJson.serialize) to split.
+        shard_size (int): Size budget in characters of the JSON of each shard.
+
+    Returns:
+        list[tuple[str, bool]]: List of the JSON of each shard and whether that shard contains any "$shards" or
+            "$escape" values, where the first shard contains the root of the serializable data.
+
+    """
+    if type(serializable_data) not in (dict, list) or not serializable_data:
+        return [(_encode(serializable_data), False)]
+
+    shards: List[Tuple[str, bool]] = [("", False)]
+
+    def new_frame(value: Any, key_prefix: str) -> List[Any]:
+        # value items, brackets, key prefix of the value in its parent, the ropes, sizes, and "$shards" flags of the
+        # encoded items, and whether the value is a dictionary shaped like a marker that must be escaped
+        items = iter(value.items()) if type(value) is dict else enumerate(value)
+        escaped = type(value) is dict and len(value) == 1 and not _MARKER_KEYS.isdisjoint(value)
+        return [items, "{}" if type(value) is dict else "[]", key_prefix, [], [], [], escaped]
+
+    # use an explicit stack of lists and dictionaries being encoded instead of recursion to split arbitrarily deep
+    # serializable data, where each list or dictionary is finished only after all of its items are encoded
+    stack = [new_frame(serializable_data, "")]
+    root: Tuple[Rope, bool] = ("", False)
+    while stack:
+        items, brackets, key_prefix, encoded_items, item_sizes, item_flags, escaped = stack[-1]
+        for item_key, item in items:
+            item_prefix = _encode_key(item_key) if brackets == "{}" else ""
+            if type(item) in (dict, list) and item:
+                # encode the items of nested lists and dictionaries before returning to this one
+                stack.append(new_frame(item, item_prefix))
+                break
+            encoded_item = f"{item_prefix}{_encode(item)}"
+            encoded_items.append(encoded_item)
+            item_sizes.append(len(encoded_item))
+            item_flags.append(False)
+        else:
+            stack.pop()
+            value_size = sum(item_sizes) + len(item_sizes) + 1
+            if escaped:
+                # keep escaped dictionaries inline (their own large values are still split) and flag them for joining
+                encoded_value: Rope = ['{"$escape":', _join_items(brackets, encoded_items), "}"]
+                value_size += len('{"$escape":}')
+                value_has_shards = True
+            elif value_size <= shard_size:
+                # keep lists and dictionaries that fit into the budget (after splitting their large items) inline
+                encoded_value = _join_items(brackets, encoded_items)
+                value_has_shards = any(item_flags)
+            else:
+                shard_indices = []
+                chunk_start = 0
+                chunk_size = 2
+                for i, item_size in enumerate(item_sizes + [None]):
+                    if i == len(item_sizes) or (i > chunk_start and chunk_size + item_size + 1 > shard_size):
+                        shard_indices.append(len(shards))
+                        shards.append(
+                            (
+                                _join_rope(_join_items(brackets, encoded_items[chunk_start:i])),
+                                any(item_flags[chunk_start:i]),
+                            )
+                        )
+                        chunk_start, chunk_size = i, 2
+                    if item_size is not None:
+                        chunk_size += item_size + 1
+                encoded_value = _encode({"$shards": shard_indices})
+                value_size = len(encoded_value)
+                value_has_shards = True
+
+            if stack:
+                parent_frame = stack[-1]
+                parent_frame[3].append([key_prefix, encoded_value] if key_prefix else encoded_value)
+                parent_frame[4].append(len(key_prefix) + value_size)
+                parent_frame[5].append(value_has_shards)
+            else:
+                root = (encoded_value, value_has_shards)
+
+    shards[0] = (_join_rope(root[0]), root[1])
+    return shards
+
+
+def join_shards(shard_values: List[Any], shards_with_shards: List[bool]) -> Any:
+    """Function to join deserialized shards (as split by split_into_shards) back into the original serializable data.
+
+    Args:
+        shard_values (list[Any]): List of the deserialized JSON of each shard, where the first shard contains the root
+            of the serializable data.
+        shards_with_shards (list[bool]): List of whether each shard contains any "$shards" or "$escape" values.
+
+    Returns:
+        Any: Serializable data with all "$shards" values replaced by their joined shards in their original order and
+            all "$escape" values replaced by the dictionaries they escape.
+
+    """
+    root = [shard_values[0]]
+    # every shard except the root is joined exactly once, so shard indices that repeat (including cycles) are invalid
+    joined_shard_indices = {0}
+    # only search the shards that contain "$shards" or "$escape" values
+    stack: List[Tuple[Any, Any]] = [(root, 0)] if shards_with_shards[0] else []
+    while stack:
+        container, key = stack.pop()
+        value = container[key]
+        if type(value) is dict and len(value) == 1 and type(escaped_value := value.get("$escape")) is dict:
+            # restore escaped dictionaries of the serializable data without interpreting their own keys as markers
+            container[key] = value = escaped_value
+        elif type(value) is dict and len(value) == 1 and type(shard_indices := value.get("$shards")) is list:
+            for shard_index in shard_indices:
+                if (
+                    type(shard_index) is not int
+                    or not 0 <= shard_index < len(shard_values)
+                    or shard_index in joined_shard_indices
+                ):
+                    raise ValueError(f"Snapshot shard index {shard_index!r} is invalid or already joined.")
+                joined_shard_indices.add(shard_index)
+            if not shard_indices:
+                raise ValueError("Snapshot split value does not reference any shards.")
+
+            # join the shards of split lists and dictionaries in their original order
+            if type(shard_values[shard_indices[0]]) is dict:
+                value = {}
+                for shard_index in shard_indices:
+                    value.update(shard_values[shard_index])
+            else:
+                value = [item for shard_index in shard_indices for item in shard_values[shard_index]]
+            container[key] = value
+            if not any(shards_with_shards[shard_index] for shard_index in shard_indices):
+                continue
+
+        if type(value) is dict:
+            stack.extend((value, k) for k, v in value.items() if type(v) in (dict, list))
+        elif type(value) is list:
+            stack.extend((value, i) for i, v in enumerate(value) if type(v) in (dict, list))
+    return root[0]
+
+
+def _write_shard(shards_directory: Path, shard: Tuple[str, bool]) -> Dict[str, Any]:
+    """Function to write a shard to a file named after the SHA-256 checksum of its contents using a temporary file and
+    a rename, unless that file already exists.
+
+    Args:
+        shards_directory (Path): Directory in which to write the shard file.
+        shard (tuple[str, bool]): JSON of the shard and whether the shard contains any "$shards" or "$escape" values.
+
+    Returns:
+        dict[str, Any]: Manifest record with file, sha256, size, and shards values for the shard.
+
+    """
+    shard_json, shard_has_shards = shard
+    shard_bytes = shard_json.encode("utf-8")
+    shard_checksum = sha256(shard_bytes).hexdigest()
+    shard_file_path = shards_directory / f"{shard_checksum}.json"
+
+    if not shard_file_path.exists():
+        temp_file_descriptor, temp_file_path = mkstemp(dir=shards_directory, suffix=".tmp")
+        try:
+            with os.fdopen(temp_file_descriptor, "wb") as temp_file_out:
+                temp_file_out.write(shard_bytes)
+            os.replace(temp_file_path, shard_file_path)
+        except BaseException:
+            Path(temp_file_path).unlink(missing_ok=True)
+            raise
+
+    return {
+        "file": shard_file_path.name,
+        "sha256": shard_checksum,
+        "size": len(shard_bytes),
+        "shards": shard_has_shards,
+    }
+
+
+def save_snapshot(
+    snapshot_directory: Path, serializable_data: Any, shard_size: int, max_workers: Optional[int] = None
+) -> int:
+    """Function to save serializable data to a sharded snapshot directory. The data is split and encoded into shards
+    in the calling thread, and shard files are named after the checksums of their contents and written in parallel
+    before the manifest is atomically replaced, so a failed save leaves any previously saved snapshot intact. Shard
+    files listed in neither the new manifest nor the manifest it replaces are removed afterward, so loads that already
+    read the previous manifest can still read all of its shard files.
+
+    Args:
+        snapshot_directory (Path): Target directory of the sharded snapshot.
+        serializable_data (Any): Serializable data (e.g. as returned by PythonObjectJson.serialize) to save.
+        shard_size (int): Size budget in characters of the JSON of each shard.
+        max_workers (Optional[int], optional): Maximum number of threads used to write shard files. Defaults to None,
+            which uses the ThreadPoolExecutor default.
+
+    Returns:
+        int: Total number of bytes written to the manifest file and shard files.
+
+    """
+    shards_directory = snapshot_directory / SNAPSHOT_SHARDS_DIRECTORY_NAME
+    shards_directory.mkdir(parents=True, exist_ok=True)
+
+    shards = split_into_shards(serializable_data, shard_size)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        shard_records = list(executor.map(partial(_write_shard, shards_directory), shards))
+
+    # keep the shard files of the replaced manifest for concurrent loads that already read it
+    manifest_file_path = snapshot_directory / SNAPSHOT_MANIFEST_FILE_NAME
+    shard_file_names = {shard_record["file"] for shard_record in shard_records}
+    try:
+        with open(manifest_file_path, "rb") as manifest_file_in:
+            shard_file_names.update(shard_record["file"] for shard_record in json.load(manifest_file_in)["shards"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    manifest_bytes = json.dumps(
+        {"format_version": SNAPSHOT_FORMAT_VERSION, "shards": shard_records}, ensure_ascii=False, indent=2
+    ).encode("utf-8")
+    temp_file_descriptor, temp_file_path = mkstemp(dir=snapshot_directory, suffix=".tmp")
+    try:
+        with os.fdopen(temp_file_descriptor, "wb") as temp_file_out:
+            temp_file_out.write(manifest_bytes)
+        os.replace(temp_file_path, manifest_file_path)
+    except BaseException:
+        Path(temp_file_path).unlink(missing_ok=True)
+        raise
+
+    # remove the stale shard files of older saves only once the new manifest is in place
+    for shard_file_path in shards_directory.glob("*.json"):
+        if shard_file_path.name not in shard_file_names:
+            shard_file_path.unlink(missing_ok=True)
+
+    return len(manifest_bytes) + sum(shard_record["size"] for shard_record in shard_records)
+
+
+def _read_shard(shards_directory: Path, shard_record: Dict[str, Any]) -> Any:
+    """Function to read a shard file and verify its size and checksum against its manifest record.
+
+    Args:
+        shards_directory (Path): Directory containing the shard file.
+        shard_record (dict[str, Any]): Manifest record with file, sha256, size, and shards values for the shard.
+
+    Returns:
+        Any: Deserialized JSON of the shard.
+
+    """
+    with open(shards_directory / shard_record["file"], "rb") as shard_file_in:
+        shard_bytes = shard_file_in.read()
+
+    if len(shard_bytes) != shard_record["size"] or sha256(shard_bytes).hexdigest() != shard_record["sha256"]:
+        raise ValueError(f'Snapshot shard file "{shard_record["file"]}" does not match its checksum in the manifest.')
+    return json.loads(shard_bytes)
+
+
+def load_snapshot(
+    snapshot_directory: Path, max_workers: Optional[int] = None, use_processes: bool = False
+) -> Tuple[Any, int]:
+    """Function to load serializable data from a sharded snapshot directory, reading, verifying, and decoding shard
+    files in parallel. Threads only overlap reading and verifying shard files, since decoding JSON holds the GIL, so
+    snapshots with many large shards decode faster in multiple processes (at the cost of sending the decoded shards
+    back to the calling process).
+
+    Args:
+        snapshot_directory (Path): Directory of the sharded snapshot.
+        max_workers (Optional[int], optional): Maximum number of threads (or processes) used to read shard files.
+            Defaults to None, which uses the ThreadPoolExecutor (or ProcessPoolExecutor) default.
+        use_processes (bool, optional): Whether to read and decode shard files in multiple processes instead of
+            threads. Defaults to False.
+
+    Returns:
+        tuple[Any, int]: The serializable data joined from all shards and the total number of bytes read from the
+            manifest file and shard files.
+
+    """
+    manifest_file_path = snapshot_directory / SNAPSHOT_MANIFEST_FILE_NAME
+    if not manifest_file_path.exists():
+        raise FileNotFoundError(f"Snapshot manifest {manifest_file_path} does not exist. Unable to load saved data.")
+
+    shards_directory = snapshot_directory / SNAPSHOT_SHARDS_DIRECTORY_NAME
+    previous_manifest_bytes = None
+    while True:
+        with open(manifest_file_path, "rb") as manifest_file_in:
+            manifest_bytes = manifest_file_in.read()
+        manifest = json.loads(manifest_bytes)
+        if manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(
+                f"Snapshot manifest format version ({manifest.get('format_version')}) is not compatible with pyobjson."
+            )
+
+        shard_records = manifest["shards"]
+        try:
+            with (ProcessPoolExecutor if use_processes else ThreadPoolExecutor)(max_workers=max_workers) as executor:
+                shard_values = list(executor.map(partial(_read_shard, shards_directory), shard_records))
+            break
+        except FileNotFoundError:
+            # retry with the replacing manifest when concurrent saves removed shard files of the manifest read here
+            if manifest_bytes == previous_manifest_bytes:
+                raise
+            previous_manifest_bytes = manifest_bytes
+
+    serializable_data = join_shards(shard_values, [shard_record["shards"] for shard_record in shard_records])
+    return serializable_data, len(manifest_bytes) + sum(shard_record["size"] for shard_record in shard_records)
@@ -9,12 +9,34 @@ Attributes:
 __author__ = "Wren J. Rudolph for Wrencode, LLC"
 __email__ = "dev@wrencode.com"
 
-from inspect import getfullargspec
-from re import compile, error
-from typing import Callable, List, Type, Union
+import sys
+from functools import lru_cache
+from logging import WARNING, Formatter, Logger, StreamHandler, getLogger
+from re import Pattern, compile, error
+from types import FunctionType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
 
+from pyobjson.constants import CALLABLE_CACHE_MAX_SIZE
 from pyobjson.constants import DELIMITER as DLIM
 
+# modules (including their submodules) from which function-typed attributes may be imported during deserialization, or
+# None to allow all modules
+_allowed_callable_modules: Optional[Tuple[str, ...]] = None
+
+
+@lru_cache(maxsize=None)
+def compile_regex(regex: str) -> Pattern:
+    """Utility function to compile a regular expression, cached by regular expression string.
+
+    Args:
+        regex (str): Regular expression string to compile.
+
+    Returns:
+        Pattern: Compiled regular expression.
+
+    """
+    return compile(regex)
+
 
 def validate_regex(regex: Union[str, List[str]]) -> None:
     """Utility function to check if a regular expression is valid.
@@ -32,7 +54,7 @@ def validate_regex(regex: Union[str, List[str]]) -> None:
     invalid_regex = []
     for expr in regex:
         try:
-            compile(expr)
+            compile_regex(expr)
         except error:
             invalid_regex.append(expr)
 
@@ -65,8 +87,8 @@ def derive_custom_object_key(custom_object: Union[Type, Callable], as_lower: boo
         return custom_object.__qualname__.lower() if as_lower else custom_object.__qualname__
 
 
-def derive_custom_callable_value(custom_callable: Callable) -> str:
-    """Utility function to derive a string value from a custom callable object.
+def _derive_uncached_custom_callable_value(custom_callable: Callable) -> str:
+    """Utility function to derive a string value from a custom callable object without using the callable cache.
 
     Args:
         custom_callable (Callable): Custom callable object for which to derive a string representation value.
@@ -75,6 +97,8 @@ def derive_custom_callable_value(custom_callable: Callable) -> str:
         str: A string representing the custom callable object that can be used to import and call that object.
 
     """
+    from inspect import getfullargspec
+
     arg_spec_str = ",".join(
         [
             f"{k}:{v.__name__ if hasattr(v, '__name__') else v.__class__.__name__}"
@@ -84,6 +108,173 @@ def derive_custom_callable_value(custom_callable: Callable) -> str:
     return f"{derive_custom_object_key(custom_callable)}{DLIM}{arg_spec_str}"
 
 
+# functions are cached by identity, so functions redefined by a module reload are new cache entries
+_derive_cached_function_value = lru_cache(maxsize=CALLABLE_CACHE_MAX_SIZE)(_derive_uncached_custom_callable_value)
+
+
+def derive_custom_callable_value(custom_callable: Callable) -> str:
+    """Utility function to derive a string value from a custom callable object.
+
+    Args:
+        custom_callable (Callable): Custom callable object for which to derive a string representation value.
+
+    Returns:
+        str: A string representing the custom callable object that can be used to import and call that object.
+
+    """
+    if isinstance(custom_callable, FunctionType):
+        return _derive_cached_function_value(custom_callable)
+    # bound methods and other callables are created per instance and are not cached
+    return _derive_uncached_custom_callable_value(custom_callable)
+
+
+@lru_cache(maxsize=CALLABLE_CACHE_MAX_SIZE)
+def _import_custom_callable(callable_path: str) -> Callable:
+    """Utility function to import a custom callable object from its fully qualified name.
+
+    Args:
+        callable_path (str): The fully qualified name of the callable object (e.g. module.submodule.function).
+
+    Returns:
+        Callable: The imported callable object.
+
+    """
+    from importlib import import_module
+
+    module_name, callable_name = callable_path.rsplit(".", 1)
+    return getattr(import_module(module_name), callable_name)
+
+
+def resolve_custom_callable(callable_path: str) -> Callable:
+    """Utility function to resolve a custom callable object from its fully qualified name using the callable cache.
+
+    Args:
+        callable_path (str): The fully qualified name of the callable object (e.g. module.submodule.function).
+
+    Returns:
+        Callable: The callable object.
+
+    """
+    module_name, callable_name = callable_path.rsplit(".", 1)
+    if _allowed_callable_modules is not None and not any(
+        module_name == allowed_module or module_name.startswith(f"{allowed_module}.")
+        for allowed_module in _allowed_callable_modules
+    ):
+        raise ValueError(f'Callable "{callable_path}" is not in a module allowed by pyobjson.')
+
+    custom_callable = _import_custom_callable(callable_path)
+    # invalidate the cache if the module was reloaded (or removed) since the callable was cached
+    if getattr(sys.modules.get(module_name), callable_name, None) is not custom_callable:
+        _import_custom_callable.cache_clear()
+        custom_callable = _import_custom_callable(callable_path)
+    return custom_callable
+
+
+def set_allowed_callable_modules(modules: Optional[Iterable[str]]) -> None:
+    """Utility function to restrict the modules from which function-typed attributes may be imported when deserializing.
+
+    Args:
+        modules (Optional[Iterable[str]]): Names of the modules (including their submodules) from which callables may
+            be imported, or None to allow callables from all modules.
+
+    Returns:
+        None
+
+    """
+    global _allowed_callable_modules
+    _allowed_callable_modules = tuple(modules) if modules is not None else None
+
+
+def clear_callable_caches() -> None:
+    """Utility function to clear the caches used to resolve and encode function-typed attributes.
+
+    Returns:
+        None
+
+    """
+    _import_custom_callable.cache_clear()
+    _derive_cached_function_value.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def get_slot_names(custom_class: Type) -> Tuple[str, ...]:
+    """Utility function to retrieve the names of all __slots__ attributes declared by a class and its base classes.
+
+    Args:
+        custom_class (Type): Custom class for which to retrieve the __slots__ attribute names.
+
+    Returns:
+        tuple[str, ...]: The __slots__ attribute names ordered from the base-most class to the class itself, excluding
+            __dict__ and __weakref__.
+
+    """
+    slot_names = []
+    for cls in reversed(custom_class.__mro__):
+        slots = cls.__dict__.get("__slots__", ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            if slot in ("__dict__", "__weakref__"):
+                continue
+            if slot.startswith("__") and not slot.endswith("__"):
+                # apply Python private name mangling to private slots
+                slot = f"_{cls.__name__.lstrip('_')}{slot}"
+            if slot not in slot_names:
+                slot_names.append(slot)
+    return tuple(slot_names)
+
+
+def get_instance_attributes(custom_class_instance: Any) -> Dict[str, Any]:
+    """Utility function to retrieve the attributes of a custom class instance from its __slots__ and its __dict__.
+
+    Args:
+        custom_class_instance (Any): Custom class instance from which to retrieve the attributes.
+
+    Returns:
+        dict[str, Any]: Dictionary with the names of all set __slots__ attributes (ordered from the base-most class)
+            followed by all __dict__ attributes as keys and attribute values as values.
+
+    """
+    slot_names = get_slot_names(type(custom_class_instance))
+    if not slot_names:
+        return dict(vars(custom_class_instance))
+
+    attributes = {}
+    for slot_name in slot_names:
+        try:
+            attributes[slot_name] = getattr(custom_class_instance, slot_name)
+        except AttributeError:
+            # skip unset slots
+            pass
+    if instance_dict := getattr(custom_class_instance, "__dict__", None):
+        attributes.update(instance_dict)
+    return attributes
+
+
+def set_instance_attributes(custom_class_instance: Any, attributes: Dict[str, Any]) -> None:
+    """Utility function to assign attributes to a custom class instance using its __slots__ and its __dict__.
+
+    Args:
+        custom_class_instance (Any): Custom class instance to which to assign the attributes.
+        attributes (dict[str, Any]): Dictionary with attribute names as keys and attribute values as values.
+
+    Returns:
+        None
+
+    """
+    slot_names = get_slot_names(type(custom_class_instance))
+    instance_dict = getattr(custom_class_instance, "__dict__", None)
+    if not slot_names:
+        instance_dict.update(attributes)
+        return
+
+    for att, val in attributes.items():
+        if instance_dict is not None and att not in slot_names:
+            instance_dict[att] = val
+        else:
+            # assign slots (or raise an AttributeError for attributes that are neither slots nor assignable to a
+            # __dict__) without calling any custom __setattr__ to match direct __dict__ assignment
+            object.__setattr__(custom_class_instance, att, val)
+
+
 def get_nested_subclasses(custom_class: Type) -> List[Type]:
     """Recursive utility function to retrieve all nested subclasses of a custom class.
 
@@ -98,3 +289,35 @@ def get_nested_subclasses(custom_class: Type) -> List[Type]:
     for custom_subclass in custom_subclasses:
         custom_subclasses.extend(get_nested_subclasses(custom_subclass))
     return list(set(custom_subclasses))
+
+
+def get_logger(name: str, level: int = WARNING) -> Logger:
+    """Get customized Logger.
+
+    Args:
+        name (str): The module name for the logger.
+        level (int): The log level for the logger. Default level set to WARNING.
+
+    Returns:
+        Logger: A Python Logger object with custom configuration and formatting.
+
+    """
+    logger = getLogger(name)
+    if len(logger.handlers) > 0:
+        logger.handlers = []
+    if level:
+        logger.setLevel(level)
+
+    sh = StreamHandler()
+    if level:
+        sh.setLevel(level)
+
+    formatter = Formatter(
+        fmt="%(asctime)s.%(msecs)03d - %(levelname)s - %(filename)s - %(name)s:%(lineno)d - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    sh.setFormatter(formatter)
+
+    logger.addHandler(sh)
+
+    return logger
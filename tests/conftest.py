@@ -63,6 +63,47 @@ class FirstClass(PythonObjectJson):
         self.first_class_datetime: datetime = first_class_datetime
 
 
+class CyclicClass(PythonObjectJson):
+    """CyclicClass for testing."""
+
+    def __init__(self, cyclic_class_param: str, cyclic_class_parent: Optional["CyclicClass"] = None):
+        super().__init__()
+        self.cyclic_class_param: str = cyclic_class_param
+        self.cyclic_class_parent: Optional[CyclicClass] = cyclic_class_parent
+        self.cyclic_class_children: List[CyclicClass] = []
+        if cyclic_class_parent:
+            cyclic_class_parent.cyclic_class_children.append(self)
+
+
+class ChainClass(PythonObjectJson):
+    """ChainClass for testing."""
+
+    def __init__(self, chain_class_param: int, chain_class_next: Optional["ChainClass"] = None):
+        super().__init__()
+        self.chain_class_param: int = chain_class_param
+        self.chain_class_next: Optional[ChainClass] = chain_class_next
+
+
+class SlottedClass(PythonObjectJson):
+    """SlottedClass for testing."""
+
+    __slots__ = ("slotted_class_param", "slotted_class_children")
+
+    def __init__(self, slotted_class_param: str, slotted_class_children: Optional[List["SlottedClass"]] = None):
+        super().__init__()
+        self.slotted_class_param: str = slotted_class_param
+        self.slotted_class_children: List[SlottedClass] = slotted_class_children or []
+
+
+class UnslottedClass(PythonObjectJson):
+    """UnslottedClass for testing."""
+
+    def __init__(self, slotted_class_param: str, slotted_class_children: Optional[List["UnslottedClass"]] = None):
+        super().__init__()
+        self.slotted_class_param: str = slotted_class_param
+        self.slotted_class_children: List[UnslottedClass] = slotted_class_children or []
+
+
 @fixture(scope="module")
 def external_function() -> Callable:
     """External function for testing."""
@@ -0,0 +1,90 @@
+"""Pytest test for Python Object JSON Tool code.
+
+Note:
+    Tests buffer-protocol value support of pyobjson.data and pyobjson.base modules.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+from array import array
+from typing import Any
+
+from pytest import importorskip
+
+from pyobjson.base import PythonObjectJson
+from pyobjson.constants import BUFFER_SEGMENTS_FILE_SUFFIX
+
+
+class BufferClass(PythonObjectJson):
+    """BufferClass for testing."""
+
+    def __init__(self, buffer_class_array: Any, buffer_class_view: Any = None, buffer_class_ndarray: Any = None):
+        super().__init__()
+        self.buffer_class_array: Any = buffer_class_array
+        self.buffer_class_view: Any = buffer_class_view
+        self.buffer_class_ndarray: Any = buffer_class_ndarray
+
+
+class TestBuffers:
+    """Pytest class for buffer-protocol value functionality."""
+
+    def test_in_band_buffers(self):
+        buffer_class = BufferClass(array("d", [0.5, 1.5, 2.5]), memoryview(bytes(range(12))).cast("i", [3]))
+        buffer_class_json_str = buffer_class.to_json_str()
+        assert "buffer::::array::::buffer_class_array" in buffer_class_json_str
+        assert "buffer::::memoryview::::buffer_class_view" in buffer_class_json_str
+
+        buffer_class_instance = BufferClass(None)
+        buffer_class_instance.from_json_str(buffer_class_json_str)
+        assert buffer_class_instance.buffer_class_array == buffer_class.buffer_class_array
+        assert buffer_class_instance.buffer_class_view.format == "i"
+        assert buffer_class_instance.buffer_class_view.tolist() == buffer_class.buffer_class_view.tolist()
+
+    def test_out_of_band_buffers(self, tmp_path):
+        buffer_class = BufferClass(array("q", range(1000)), memoryview(bytearray(range(100))))
+        json_file_path = tmp_path / "buffer_class.json"
+        buffer_class.save_to_json_file(json_file_path, out_of_band_buffers=True)
+
+        # confirm the raw buffer bytes are written to the side file and not encoded in the JSON file
+        buffer_segments_file_path = tmp_path / f"buffer_class.json{BUFFER_SEGMENTS_FILE_SUFFIX}"
+        assert buffer_segments_file_path.stat().st_size >= 8000 + 100
+        assert json_file_path.stat().st_size < 2000
+
+        buffer_class_instance = BufferClass(None)
+        buffer_class_instance.load_from_json_file(json_file_path)
+        assert buffer_class_instance.buffer_class_array == buffer_class.buffer_class_array
+        assert buffer_class_instance.buffer_class_view.readonly
+        assert buffer_class_instance.buffer_class_view.tobytes() == bytes(range(100))
+
+        # confirm saving a smaller instance replaces the side file without changing the memory-mapped views of the
+        # loaded instance, and leaves no temporary files behind
+        BufferClass(array("q", [7]), memoryview(bytearray(b"x"))).save_to_json_file(
+            json_file_path, out_of_band_buffers=True
+        )
+        assert buffer_class_instance.buffer_class_array == buffer_class.buffer_class_array
+        assert buffer_class_instance.buffer_class_view.tobytes() == bytes(range(100))
+        smaller_buffer_class_instance = BufferClass(None)
+        smaller_buffer_class_instance.load_from_json_file(json_file_path)
+        assert smaller_buffer_class_instance.buffer_class_array == array("q", [7])
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "buffer_class.json",
+            f"buffer_class.json{BUFFER_SEGMENTS_FILE_SUFFIX}",
+        ]
+
+        # confirm saving with in-band buffers removes the stale side file
+        buffer_class.save_to_json_file(json_file_path)
+        assert not buffer_segments_file_path.exists()
+
+    def test_ndarray_buffers(self, tmp_path):
+        numpy = importorskip("numpy")
+
+        buffer_class = BufferClass(None, buffer_class_ndarray=numpy.arange(24, dtype=">i4").reshape(2, 3, 4)[:, ::2])
+        json_file_path = tmp_path / "buffer_class.json"
+        buffer_class.save_to_json_file(json_file_path, out_of_band_buffers=True)
+
+        buffer_class_instance = BufferClass(None)
+        buffer_class_instance.load_from_json_file(json_file_path)
+        assert buffer_class_instance.buffer_class_ndarray.dtype == numpy.dtype(">i4")
+        assert (buffer_class_instance.buffer_class_ndarray == buffer_class.buffer_class_ndarray).all()
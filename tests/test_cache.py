@@ -0,0 +1,75 @@
+"""Pytest test for Python Object JSON Tool code.
+
+Note:
+    Tests pyobjson.cache module.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import os
+import time
+
+from conftest import UnslottedClass
+
+from pyobjson.cache import ReadThroughCache
+
+
+class TestCache:
+    """Pytest class for read-through cache functionality."""
+
+    def test_json_file_read_through_cache(self, tmp_path):
+        json_file_path = tmp_path / "unslotted.json"
+        UnslottedClass("root", [UnslottedClass("child")]).save_to_json_file(json_file_path)
+
+        cache = ReadThroughCache()
+        first_instance = UnslottedClass("")
+        first_instance.load_from_json_file(json_file_path, cache=cache)
+        assert cache.stats()["misses"] == 1 and len(cache) == 1
+
+        # confirm a hit loads a clone of the cached instance without reading the JSON file
+        second_instance = UnslottedClass("")
+        second_instance.load_from_json_file(json_file_path, cache=cache)
+        assert cache.stats()["hits"] == 1
+        assert second_instance == first_instance
+        assert second_instance.slotted_class_children[0] is not first_instance.slotted_class_children[0]
+        second_instance.slotted_class_children.append(UnslottedClass("extra"))
+        third_instance = UnslottedClass("")
+        third_instance.load_from_json_file(json_file_path, cache=cache)
+        assert len(third_instance.slotted_class_children) == 1
+
+        # confirm a changed file (by modification time and size) invalidates the cached instance
+        UnslottedClass("changed").save_to_json_file(json_file_path)
+        os.utime(json_file_path, ns=(time.time_ns(), time.time_ns() + 1_000_000_000))
+        third_instance.load_from_json_file(json_file_path, cache=cache)
+        assert third_instance.slotted_class_param == "changed"
+        assert cache.stats()["misses"] == 2
+
+        # confirm read-only caches share the cached attribute values
+        read_only_cache = ReadThroughCache(read_only=True)
+        UnslottedClass("").load_from_json_file(json_file_path, cache=read_only_cache)
+        view_instances = [UnslottedClass(""), UnslottedClass("")]
+        for view_instance in view_instances:
+            view_instance.load_from_json_file(json_file_path, cache=read_only_cache)
+        assert view_instances[0].slotted_class_children is view_instances[1].slotted_class_children
+
+    def test_cache_eviction(self):
+        # confirm least recently used instances are evicted beyond the entry and memory bounds
+        cache = ReadThroughCache(max_entries=2, max_bytes=100)
+        cache.put("a", 1, UnslottedClass("a"), 40)
+        cache.put("b", 1, UnslottedClass("b"), 40)
+        assert cache.get("a", 1) is not None
+        cache.put("c", 1, UnslottedClass("c"), 40)
+        assert cache.get("b", 1) is None and cache.get("a", 1) is not None
+        cache.put("d", 1, UnslottedClass("d"), 90)
+        assert len(cache) == 1 and cache.stats()["bytes"] == 90
+        cache.put("e", 1, UnslottedClass("e"), 101)
+        assert cache.get("e", 1) is None
+
+        # confirm stale validators and expired instances are misses
+        assert cache.get("d", 2) is None and len(cache) == 0
+        expiring_cache = ReadThroughCache(ttl=0.01)
+        expiring_cache.put("a", 1, UnslottedClass("a"), 1)
+        time.sleep(0.02)
+        assert expiring_cache.get("a", 1) is None
@@ -0,0 +1,70 @@
+"""Pytest test for Python Object JSON Tool code.
+
+Note:
+    Tests pyobjson.cli module.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import gzip
+import io
+import json
+
+from conftest import UnslottedClass
+
+from pyobjson.cli import main, measure_class_sizes, stats, stream_json_values
+
+
+class TestCli:
+    """Pytest class for command-line functionality."""
+
+    def test_stream_json_values(self):
+        # confirm values split across chunks are decoded from top-level arrays and JSON Lines
+        is_array, values = stream_json_values(io.StringIO('[{"a": [1, 2]}, 12345, "b\\"c", null]'), chunk_size=3)
+        assert is_array and list(values) == [{"a": [1, 2]}, 12345, 'b"c', None]
+
+        is_array, values = stream_json_values(io.StringIO('1\n22\n{"a": {"b": 2}}\n'), chunk_size=2)
+        assert not is_array and list(values) == [1, 22, {"a": {"b": 2}}]
+
+    def test_convert_and_stats(self, tmp_path, capsys):
+        serializable_dicts = [
+            UnslottedClass(f"root{i}", [UnslottedClass("first"), UnslottedClass("second")]).serialize()
+            for i in range(20)
+        ]
+        input_path = tmp_path / "input.jsonl"
+        input_path.write_text("".join(f"{json.dumps(serializable_dict)}\n" for serializable_dict in serializable_dicts))
+
+        # confirm JSON Lines are converted to a compressed and indented JSON array and back
+        assert main(["convert", str(input_path), str(tmp_path / "output.json.gz"), "--indent", "2"]) == 0
+        with gzip.open(tmp_path / "output.json.gz", "rt") as json_file_in:
+            assert json.load(json_file_in) == serializable_dicts
+
+        assert main(["convert", str(tmp_path / "output.json.gz"), str(tmp_path / "serial.jsonl")]) == 0
+        assert main(["convert", str(input_path), str(tmp_path / "parallel.jsonl"), "--processes", "2"]) == 0
+        assert (tmp_path / "serial.jsonl").read_bytes() == (tmp_path / "parallel.jsonl").read_bytes()
+
+        # confirm instances and compact JSON bytes are counted per class, with or without multiple processes
+        data_stats = stats(input_path, processes=1)
+        assert data_stats == stats(input_path, processes=2)
+        assert data_stats["values"] == 20
+        assert data_stats["bytes"] == (tmp_path / "serial.jsonl").stat().st_size - 20
+        assert data_stats["classes"]["conftest.unslottedclass"]["objects"] == 60
+
+        # confirm dictionaries of user data shaped like attribute columns are not counted as custom class instances
+        class_stats = {}
+        serializable_dict = UnslottedClass({"$columns": "x", "$length": 1, "$data": {}}).serialize()
+        assert measure_class_sizes(serializable_dict, class_stats) == len(
+            json.dumps(serializable_dict, separators=(",", ":"))
+        )
+        assert list(class_stats) == ["conftest.unslottedclass"]
+
+        assert main(["stats", str(input_path), "--json"]) == 0
+        assert json.loads(capsys.readouterr().out) == data_stats
+
+        # confirm the benchmark covers deserialization and serialization of the imported custom classes
+        assert main(["bench", str(input_path), "--import", "conftest", "--repeat", "1", "--json"]) == 0
+        assert list(json.loads(capsys.readouterr().out)) == ["parse", "encode", "deserialize", "serialize"]
+
+        assert main(["stats", str(tmp_path / "missing.json")]) == 1
@@ -0,0 +1,100 @@
+"""Pytest test for Python Object JSON Tool code.
+
+Note:
+    Tests pyobjson.dao.fs.base module.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import json
+from pathlib import Path
+
+from pytest import raises
+
+from pyobjson.dao.fs import base as fs_base
+from pyobjson.dao.fs.base import FS_STORE_INDEX_FILE_NAME, PythonObjectJsonToFileStore
+
+
+class CustomClassToFileStore(PythonObjectJsonToFileStore):
+    """CustomClassToFileStore for testing."""
+
+    def __init__(self, message: str, fs_store_directory: Path, fs_store_fsync: bool = True):
+        super().__init__(fs_store_directory, fs_store_fsync)
+        self.message = message
+
+
+class TestPythonObjectJsonToFileStore:
+    """Pytest class for PythonObjectJsonToFileStore functionality."""
+
+    def test_save_and_load(self, tmp_path):
+        custom_class = CustomClassToFileStore("Hello, World!", tmp_path)
+        fs_key = custom_class.save_to_fs_store()
+
+        # confirm the object file is sharded into hashed subdirectories and recorded in the index
+        fs_store_entry = custom_class.get_fs_store_entry(fs_key)
+        assert len(Path(fs_store_entry["path"]).parts) == 4
+        assert (tmp_path / fs_store_entry["path"]).stat().st_size == fs_store_entry["size"]
+
+        loaded_custom_class = CustomClassToFileStore("", tmp_path)
+        loaded_custom_class.load_from_fs_store(fs_key)
+        assert loaded_custom_class == custom_class
+
+        with raises(KeyError):
+            loaded_custom_class.load_from_fs_store("missing")
+
+    def test_fsync_and_load_without_index_entry(self, tmp_path, monkeypatch):
+        fsync_descriptors = []
+        fsync = fs_base.os.fsync
+        monkeypatch.setattr(fs_base.os, "fsync", lambda fd: fsync_descriptors.append(fd) or fsync(fd))
+
+        # confirm the object file, its new directories, and the new index file are all synced to disk
+        custom_class = CustomClassToFileStore("Hello, World!", tmp_path)
+        custom_class.save_to_fs_store("first")
+        assert len(fsync_descriptors) == 1 + 4 + 1 + 1
+        custom_class.save_to_fs_store("first")
+        assert len(fsync_descriptors) == 7 + 1 + 1 + 1
+
+        CustomClassToFileStore("", tmp_path, fs_store_fsync=False).save_to_fs_store("second")
+        assert len(fsync_descriptors) == 10
+
+        # confirm object files are still found when their index records were lost
+        (tmp_path / FS_STORE_INDEX_FILE_NAME).write_bytes(b"")
+        fs_base._fs_store_indexes.clear()
+        loaded_custom_class = CustomClassToFileStore("", tmp_path)
+        loaded_custom_class.load_from_fs_store("first")
+        assert loaded_custom_class == custom_class
+
+    def test_save_many_load_many_and_reload_index(self, tmp_path):
+        custom_class = CustomClassToFileStore("", tmp_path, fs_store_fsync=False)
+        custom_classes = {f"key_{i}": CustomClassToFileStore(f"message_{i}", tmp_path, False) for i in range(200)}
+        custom_class.save_many_to_fs_store(custom_classes)
+        custom_class.save_to_fs_store("key_0")
+
+        # confirm overwritten keys are appended to the index and the latest index record wins
+        with open(tmp_path / FS_STORE_INDEX_FILE_NAME) as index_file_in:
+            assert len([json.loads(line) for line in index_file_in]) == 201
+        assert custom_class.load_many_from_fs_store(["key_0", "key_199"]) == {
+            "key_0": custom_class,
+            "key_199": custom_classes["key_199"],
+        }
+
+        # confirm the index is reloaded from disk without crawling the object directories after a restart
+        fs_base._fs_store_indexes.clear()
+        assert custom_class.list_fs_store_keys() == list(custom_classes.keys())
+        assert dict(custom_class.iter_from_fs_store())["key_10"] == custom_classes["key_10"]
+
+    def test_append_after_partial_index_record(self, tmp_path):
+        custom_class = CustomClassToFileStore("", tmp_path, fs_store_fsync=False)
+        custom_class.save_to_fs_store("first")
+
+        # confirm appends own records without reparsing them and start after a partially written trailing record
+        fs_store_index = fs_base._fs_store_indexes[str(tmp_path.resolve())]
+        assert fs_store_index.offset == (tmp_path / FS_STORE_INDEX_FILE_NAME).stat().st_size
+        with open(tmp_path / FS_STORE_INDEX_FILE_NAME, "ab") as index_file_out:
+            index_file_out.write(b'{"key": "interrupted", "pa')
+        custom_class.save_to_fs_store("second")
+
+        fs_base._fs_store_indexes.clear()
+        assert custom_class.list_fs_store_keys() == ["first", "second"]
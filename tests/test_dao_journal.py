@@ -0,0 +1,87 @@
+"""Pytest test for Python Object JSON Tool code.
+
+Note:
+    Tests pyobjson.dao.journal.base module.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import json
+from pathlib import Path
+from typing import List, Optional
+
+from conftest import UnslottedClass
+from pytest import raises
+
+from pyobjson.dao.journal import base as journal_base
+from pyobjson.dao.journal.base import JOURNAL_LOG_FILE_NAME, JOURNAL_SNAPSHOT_FILE_NAME, PythonObjectJsonToJournal
+
+
+class CustomClassToJournal(PythonObjectJsonToJournal):
+    """CustomClassToJournal for testing."""
+
+    def __init__(self, message: str, journal_directory: Path, records: Optional[List[UnslottedClass]] = None):
+        super().__init__(journal_directory, journal_compaction_size=None)
+        self.message = message
+        self.records = records or []
+
+
+class TestPythonObjectJsonToJournal:
+    """Pytest class for PythonObjectJsonToJournal functionality."""
+
+    def test_save_and_load(self, tmp_path):
+        custom_class = CustomClassToJournal("", tmp_path, [UnslottedClass(f"record_{i}") for i in range(100)])
+        first_record_size = custom_class.save_to_journal()
+        assert custom_class.save_to_journal() == 0
+
+        # confirm each save only appends the changed attribute values and list items
+        custom_class.message = "Hello, World!"
+        custom_class.records[50].slotted_class_param = "changed"
+        custom_class.records.append(UnslottedClass("appended"))
+        assert 0 < custom_class.save_to_journal() < first_record_size / 10
+
+        log_lines = (tmp_path / JOURNAL_LOG_FILE_NAME).read_bytes().splitlines()
+        assert [json.loads(line)["sequence"] for line in log_lines] == [1, 2]
+
+        loaded_custom_class = CustomClassToJournal("", tmp_path)
+        loaded_custom_class.load_from_journal()
+        assert loaded_custom_class == custom_class
+
+        with raises(FileNotFoundError):
+            CustomClassToJournal("", tmp_path / "missing").load_from_journal()
+
+    def test_compaction_and_recovery(self, tmp_path):
+        custom_class = CustomClassToJournal("", tmp_path, [UnslottedClass(f"record_{i}") for i in range(10)])
+        for i in range(5):
+            custom_class.message = f"save_{i}"
+            custom_class.save_to_journal()
+
+        # confirm compaction folds the change log into a snapshot
+        custom_class.compact_journal()
+        assert json.loads((tmp_path / JOURNAL_SNAPSHOT_FILE_NAME).read_bytes())["sequence"] == 5
+        assert (tmp_path / JOURNAL_LOG_FILE_NAME).read_bytes() == b""
+
+        custom_class.records.pop()
+        custom_class.save_to_journal()
+
+        # confirm a new process replays the snapshot and the change log and discards a partially written record
+        with open(tmp_path / JOURNAL_LOG_FILE_NAME, "ab") as log_file_out:
+            log_file_out.write(b'{"sequence":7,"chan')
+        journal_base._journals.clear()
+        loaded_custom_class = CustomClassToJournal("", tmp_path)
+        loaded_custom_class.load_from_journal()
+        assert loaded_custom_class == custom_class
+        assert len(loaded_custom_class.records) == 9
+        assert (tmp_path / JOURNAL_LOG_FILE_NAME).read_bytes().endswith(b"\n")
+
+        # confirm records appended after a compaction are kept by the next compaction and background compaction
+        loaded_custom_class.journal_compaction_size = 0
+        loaded_custom_class.message = "compacted"
+        loaded_custom_class.save_to_journal()
+        loaded_custom_class.compact_journal()
+        journal_base._journals.clear()
+        reloaded_custom_class = CustomClassToJournal("", tmp_path)
+        reloaded_custom_class.load_from_journal()
+        assert reloaded_custom_class.message == "compacted"
@@ -0,0 +1,135 @@
+"""Pytest test for Python Object JSON Tool code.
+
+Note:
+    Tests pyobjson.dao.mongo.asynchronous module.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import asyncio
+import copy
+from typing import Any, Dict, List, Optional
+
+import pytest
+from bson.objectid import ObjectId
+
+from pyobjson.dao.mongo import asynchronous
+from pyobjson.dao.mongo.asynchronous import AsyncPythonObjectJsonToMongo, close_async_mongo_clients
+
+
+class InProcessMongoCollection:
+    """In-process stand-in for the pymongo AsyncCollection methods used by AsyncPythonObjectJsonToMongo."""
+
+    def __init__(self):
+        self.documents: Dict[ObjectId, Dict[str, Any]] = {}
+        self.writes = 0
+
+    def _matches(self, document: Dict[str, Any], mongo_filter: Dict[str, Any]) -> bool:
+        document_id_filter = mongo_filter.get("_id")
+        if isinstance(document_id_filter, dict):
+            return document["_id"] in document_id_filter["$in"]
+        return document_id_filter is None or document["_id"] == document_id_filter
+
+    @staticmethod
+    def _project(document: Dict[str, Any], projection: Optional[Dict[str, bool]]) -> Dict[str, Any]:
+        if not projection:
+            return copy.deepcopy(document)
+        return {key: copy.deepcopy(value) for key, value in document.items() if key == "_id" or projection.get(key)}
+
+    def _update(self, mongo_filter: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
+        self.writes += 1
+        document = self.documents.setdefault(mongo_filter["_id"], {"_id": mongo_filter["_id"]})
+        document.update(copy.deepcopy(update.get("$set", {})))
+        for field, increment in update.get("$inc", {}).items():
+            document[field] = document.get(field, 0) + increment
+        return document
+
+    async def find_one(self, mongo_filter: Dict[str, Any], projection: Optional[Dict[str, bool]] = None):
+        document = self.documents.get(mongo_filter["_id"])
+        return self._project(document, projection) if document else None
+
+    async def find_one_and_update(self, mongo_filter, update, projection=None, upsert=False, return_document=None):
+        return self._project(self._update(mongo_filter, update), projection)
+
+    async def bulk_write(self, operations: List[Any], ordered: bool = True) -> None:
+        for operation in operations:
+            self._update(operation._filter, operation._doc)
+
+    async def find(self, mongo_filter, projection=None, sort=None, batch_size=0):
+        for document_id in sorted(self.documents):
+            if self._matches(self.documents[document_id], mongo_filter):
+                yield self._project(self.documents[document_id], projection)
+
+
+class InProcessMongoClient:
+    """In-process stand-in for pymongo AsyncMongoClient."""
+
+    instances: List["InProcessMongoClient"] = []
+
+    def __init__(self, mongo_uri: str, **kwargs):
+        self.mongo_uri = mongo_uri
+        self.collections: Dict[str, InProcessMongoCollection] = {}
+        self.closed = False
+        self.instances.append(self)
+
+    def __getitem__(self, mongo_database: str) -> "InProcessMongoClient":
+        return self
+
+    def get_collection(self, mongo_collection: str) -> InProcessMongoCollection:
+        return self.collections.setdefault(mongo_collection, InProcessMongoCollection())
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class AsyncMongoClass(AsyncPythonObjectJsonToMongo):
+    """AsyncMongoClass for testing."""
+
+    def __init__(self, async_mongo_class_param: str, mongo_version_field: Optional[str] = None):
+        super().__init__("localhost", 27017, "pyobjson", "user", "password", mongo_version_field)
+        self.async_mongo_class_param: str = async_mongo_class_param
+
+
+class TestAsyncMongo:
+    """Pytest class for asynchronous MongoDB data access object functionality."""
+
+    def test_async_mongo(self, monkeypatch):
+        monkeypatch.setattr(asynchronous, "AsyncMongoClient", InProcessMongoClient)
+        InProcessMongoClient.instances.clear()
+
+        async def run() -> None:
+            # confirm saved objects are loaded and unchanged saves are skipped
+            document_id = await AsyncMongoClass("first", mongo_version_field="version").save_to_mongo("objects")
+            collection = InProcessMongoClient.instances[0].get_collection("objects")
+            assert collection.documents[document_id]["version"] == 1
+            assert await AsyncMongoClass("first", "version").save_to_mongo("objects", document_id) == document_id
+            assert collection.writes == 1
+
+            loaded_object = AsyncMongoClass("", "version")
+            await loaded_object.load_from_mongo("objects", str(document_id))
+            assert loaded_object.async_mongo_class_param == "first"
+
+            # confirm bulk saves, bulk loads, and cursor iteration share one pooled client
+            document_ids = await loaded_object.save_many_to_mongo(
+                "objects", {str(ObjectId()): AsyncMongoClass(f"bulk_{i}") for i in range(3)}
+            )
+            loaded_objects = await loaded_object.load_many_from_mongo("objects", [document_ids[2], ObjectId()])
+            assert [obj.async_mongo_class_param for obj in loaded_objects.values()] == ["bulk_2"]
+            assert [
+                (document_id, obj.async_mongo_class_param)
+                async for document_id, obj in loaded_object.iter_from_mongo("objects")
+            ][1:] == [(document_ids[i], f"bulk_{i}") for i in range(3)]
+            assert len(InProcessMongoClient.instances) == 1
+
+            # confirm errors raise exceptions instead of exiting the process
+            with pytest.raises(ValueError):
+                await loaded_object.load_from_mongo("objects", "invalid")
+            with pytest.raises(KeyError):
+                await loaded_object.load_from_mongo("objects", ObjectId())
+
+            await close_async_mongo_clients()
+            assert InProcessMongoClient.instances[0].closed
+
+        asyncio.run(run())
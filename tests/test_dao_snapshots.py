@@ -0,0 +1,103 @@
+"""Pytest test for Python Object JSON Tool code.
+
+Note:
+    Tests pyobjson.dao.snapshots.base module.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+from pathlib import Path
+from typing import List, Optional
+
+from conftest import UnslottedClass
+from pytest import raises
+
+from pyobjson.dao.snapshots import base as snapshots_base
+from pyobjson.dao.snapshots.base import SNAPSHOT_STORE_BLOBS_DIRECTORY_NAME, PythonObjectJsonToSnapshotStore
+
+
+class CustomClassToSnapshotStore(PythonObjectJsonToSnapshotStore):
+    """CustomClassToSnapshotStore for testing."""
+
+    def __init__(self, message: str, snapshot_store_directory: Path, records: Optional[List[UnslottedClass]] = None):
+        super().__init__(snapshot_store_directory)
+        self.message = message
+        self.records = records or []
+
+
+class TestPythonObjectJsonToSnapshotStore:
+    """Pytest class for PythonObjectJsonToSnapshotStore functionality."""
+
+    def test_save_and_load(self, tmp_path):
+        custom_class = CustomClassToSnapshotStore(
+            "Hello, World!", tmp_path, [UnslottedClass(f"record_{i}", [UnslottedClass("nested")]) for i in range(100)]
+        )
+        snapshot_name = custom_class.save_to_snapshot_store()
+
+        # confirm identical nested custom class instances are saved as a single blob
+        blob_file_paths = list((tmp_path / SNAPSHOT_STORE_BLOBS_DIRECTORY_NAME).glob("*/*.json"))
+        assert len(blob_file_paths) == 100 + 1 + 1
+
+        loaded_custom_class = CustomClassToSnapshotStore("", tmp_path)
+        loaded_custom_class.load_from_snapshot_store(snapshot_name)
+        assert loaded_custom_class == custom_class
+        assert custom_class.list_snapshot_store_snapshots() == [snapshot_name]
+
+        with raises(KeyError):
+            loaded_custom_class.load_from_snapshot_store("missing")
+
+    def test_save_and_load_marker_shaped_dictionaries(self, tmp_path):
+        # confirm dictionaries of user data shaped like blob references are restored unchanged
+        custom_class = CustomClassToSnapshotStore(
+            "", tmp_path, [UnslottedClass({"$blob": "missing"}), UnslottedClass({"$escape": {"$blob": "missing"}})]
+        )
+        snapshot_name = custom_class.save_to_snapshot_store()
+
+        loaded_custom_class = CustomClassToSnapshotStore("", tmp_path)
+        loaded_custom_class.load_from_snapshot_store(snapshot_name)
+        assert loaded_custom_class == custom_class
+
+    def test_incremental_save_and_cached_load(self, tmp_path, monkeypatch):
+        custom_class = CustomClassToSnapshotStore("", tmp_path, [UnslottedClass(f"record_{i}") for i in range(100)])
+        first_snapshot_name = custom_class.save_to_snapshot_store("first")
+        first_blob_count = len(list((tmp_path / SNAPSHOT_STORE_BLOBS_DIRECTORY_NAME).glob("*/*.json")))
+
+        # confirm only the blobs of the changed custom class instance and its parents are written
+        custom_class.records[50].slotted_class_param = "changed"
+        second_snapshot_name = custom_class.save_to_snapshot_store("second")
+        assert len(list((tmp_path / SNAPSHOT_STORE_BLOBS_DIRECTORY_NAME).glob("*/*.json"))) == first_blob_count + 2
+
+        loaded_custom_class = CustomClassToSnapshotStore("", tmp_path)
+        loaded_custom_class.load_from_snapshot_store(first_snapshot_name)
+
+        # confirm only the uncached blobs are read when loading a snapshot that shares blobs with a loaded snapshot
+        read_blob_checksums = []
+        read_blob = PythonObjectJsonToSnapshotStore._read_blob
+
+        def count_read_blob(self, blob_checksum):
+            read_blob_checksums.append(blob_checksum)
+            return read_blob(self, blob_checksum)
+
+        monkeypatch.setattr(PythonObjectJsonToSnapshotStore, "_read_blob", count_read_blob)
+        loaded_custom_class.load_from_snapshot_store(second_snapshot_name)
+        assert len(read_blob_checksums) == 2
+        assert loaded_custom_class == custom_class
+
+    def test_bounded_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(snapshots_base, "SNAPSHOT_STORE_CACHE_MAX_SIZE", 10)
+        custom_class = CustomClassToSnapshotStore("", tmp_path, [UnslottedClass(f"record_{i}") for i in range(100)])
+        snapshot_name = custom_class.save_to_snapshot_store()
+
+        # confirm the checksums of known blobs and the reassembled blobs are both bounded by the cache size
+        loaded_custom_class = CustomClassToSnapshotStore("", tmp_path)
+        loaded_custom_class.load_from_snapshot_store(snapshot_name)
+        assert loaded_custom_class == custom_class
+        snapshot_store_cache = custom_class._get_snapshot_store_cache()
+        assert len(snapshot_store_cache.known_blobs) == len(snapshot_store_cache.reassembled_blobs) == 10
+
+        # confirm blobs evicted from the cache are found on disk instead of being written again
+        blob_count = len(list((tmp_path / SNAPSHOT_STORE_BLOBS_DIRECTORY_NAME).glob("*/*.json")))
+        custom_class.save_to_snapshot_store()
+        assert len(list((tmp_path / SNAPSHOT_STORE_BLOBS_DIRECTORY_NAME).glob("*/*.json"))) == blob_count
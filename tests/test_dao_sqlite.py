@@ -0,0 +1,68 @@
+"""Pytest test for Python Object JSON Tool code.
+
+Note:
+    Tests pyobjson.dao.sqlite.base module.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+from pathlib import Path
+
+from pytest import fixture, raises
+
+from pyobjson.dao.sqlite.base import PythonObjectJsonToSqlite
+
+
+class CustomClassToSqlite(PythonObjectJsonToSqlite):
+    """CustomClassToSqlite for testing."""
+
+    def __init__(self, message: str, sqlite_database_path: Path, sqlite_payload_format: str = "json"):
+        super().__init__(sqlite_database_path, sqlite_payload_format)
+        self.message = message
+
+
+@fixture
+def sqlite_database_path(tmp_path) -> Path:
+    """Temporary SQLite database path for testing."""
+    return tmp_path / "pyobjson.db"
+
+
+class TestPythonObjectJsonToSqlite:
+    """Pytest class for PythonObjectJsonToSqlite functionality."""
+
+    def test_save_and_load(self, sqlite_database_path):
+        for payload_format in ("json", "binary", "zlib"):
+            custom_class = CustomClassToSqlite("Hello, World!", sqlite_database_path, payload_format)
+            sqlite_key = custom_class.save_to_sqlite("custom_classes")
+
+            loaded_custom_class = CustomClassToSqlite("", sqlite_database_path, payload_format)
+            loaded_custom_class.load_from_sqlite("custom_classes", sqlite_key)
+
+            assert loaded_custom_class == custom_class
+
+    def test_save_many_load_many_and_iterate(self, sqlite_database_path):
+        custom_class = CustomClassToSqlite("", sqlite_database_path, "zlib")
+        custom_classes = {
+            f"key_{i}": CustomClassToSqlite(f"message_{i}", sqlite_database_path, "zlib") for i in range(1000)
+        }
+        assert custom_class.save_many_to_sqlite("custom_classes", custom_classes) == list(custom_classes.keys())
+
+        assert custom_class.load_many_from_sqlite("custom_classes", ["key_999", "key_0", "missing"]) == {
+            "key_999": custom_classes["key_999"],
+            "key_0": custom_classes["key_0"],
+        }
+        assert dict(custom_class.iter_from_sqlite("custom_classes")) == custom_classes
+
+        # confirm saving an existing key updates its row in place and keeps its position in the iteration order
+        custom_classes["key_0"] = CustomClassToSqlite("updated", sqlite_database_path, "zlib")
+        custom_class.save_many_to_sqlite("custom_classes", {"key_0": custom_classes["key_0"]})
+        assert list(custom_class.iter_from_sqlite("custom_classes"))[0] == ("key_0", custom_classes["key_0"])
+
+    def test_invalid_table_and_missing_key(self, sqlite_database_path):
+        custom_class = CustomClassToSqlite("", sqlite_database_path)
+        with raises(ValueError):
+            custom_class.save_to_sqlite("custom_classes; DROP TABLE custom_classes")
+        with raises(KeyError):
+            custom_class.load_from_sqlite("custom_classes", "missing")
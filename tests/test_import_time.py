@@ -0,0 +1,59 @@
+"""Pytest test for Python Object JSON Tool code.
+
+Note:
+    Tests pyobjson package import time.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import subprocess  # nosec B404
+import sys
+from typing import Dict
+
+# cumulative import time budget in microseconds for "import pyobjson" (as reported by python -X importtime)
+IMPORT_TIME_BUDGET_US = 15000
+
+# modules that must only be imported on the code paths that need them
+DEFERRED_MODULES = ("base64", "bson", "importlib", "inspect", "json", "pathlib", "pymongo")
+
+
+def import_times(code: str) -> Dict[str, int]:
+    """Run Python code in a fresh interpreter with -X importtime and collect the cumulative import time of each module.
+
+    Args:
+        code (str): Python code to run.
+
+    Returns:
+        dict[str, int]: Dictionary with imported module names as keys and cumulative import times in microseconds as
+            values.
+
+    """
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, module = line.split("|")
+            if cumulative.strip().isdigit():
+                times[module.strip()] = int(cumulative)
+    return times
+
+
+class TestImportTime:
+    """Pytest class for pyobjson import time."""
+
+    def test_package_import_time(self):
+        times = import_times("import pyobjson")
+
+        assert times["pyobjson"] < IMPORT_TIME_BUDGET_US
+        # no pyobjson submodules are imported until a public name is accessed
+        assert not [module for module in times if module.startswith("pyobjson.")]
+
+    def test_base_import_defers_heavy_modules(self):
+        times = import_times("import pyobjson; pyobjson.PythonObjectJson")
+
+        assert "pyobjson.base" in times
+        assert not [module for module in DEFERRED_MODULES if module in times]
@@ -0,0 +1,99 @@
+"""Pytest test for Python Object JSON Tool code.
+
+Note:
+    Tests pyobjson.instrumentation module.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import logging
+from types import ModuleType
+
+from conftest import ChainClass
+
+import pyobjson
+from pyobjson import instrumentation
+from pyobjson.utils import derive_custom_object_key
+
+
+class TestInstrumentation:
+    """Pytest class for pyobjson instrumentation functionality."""
+
+    def test_public_names(self):
+        # confirm the instrumented context manager does not shadow the pyobjson.instrumentation submodule
+        assert isinstance(pyobjson.instrumentation, ModuleType)
+        assert pyobjson.instrumentation is instrumentation
+        assert pyobjson.instrumented is instrumentation.instrumented
+
+    def test_overlapping_instrumented_blocks(self):
+        # confirm instrumented blocks exiting out of order (as in concurrent threads) keep instrumentation enabled
+        # until the last of them exits
+        first_block = pyobjson.instrumented()
+        second_block = pyobjson.instrumented()
+        first_block.__enter__()
+        second_block.__enter__()
+        first_block.__exit__(None, None, None)
+        assert instrumentation.is_instrumentation_enabled()
+        second_block.__exit__(None, None, None)
+        assert not instrumentation.is_instrumentation_enabled()
+
+    def test_disabled_by_default(self):
+        pyobjson.reset_stats()
+        ChainClass(1, ChainClass(2)).to_json_str()
+
+        assert pyobjson.stats() == {"classes": {}, "phases": {}}
+
+    def test_class_counters_and_phases(self, tmp_path):
+        chain_class = ChainClass(1, ChainClass(2, ChainClass(3)))
+        chain_class_key = derive_custom_object_key(ChainClass)
+        json_file_path = tmp_path / "chain_class.json"
+
+        with pyobjson.instrumented(reset=True):
+            chain_class.save_to_json_file(json_file_path)
+            ChainClass(0).load_from_json_file(json_file_path)
+
+        snapshot = pyobjson.stats()
+        counters = snapshot["classes"][chain_class_key]
+        assert counters["serialized_objects"] == 3
+        assert counters["serialized_attributes"] == 6
+        assert counters["deserialized_objects"] == 3
+        assert counters["bytes_written"] == json_file_path.stat().st_size
+        assert counters["bytes_read"] == json_file_path.stat().st_size
+        assert counters["serialize_seconds"] > 0
+        assert counters["deserialize_seconds"] > 0
+        for phase_name in ("serialize", "deserialize", "save_to_json_file", "load_from_json_file"):
+            assert snapshot["phases"][phase_name]["calls"] == 1
+            assert snapshot["phases"][phase_name]["errors"] == 0
+
+    def test_phase_hooks(self):
+        events = []
+
+        def hook(event, phase_name, details):
+            events.append((event, phase_name, details.get("class_key")))
+
+        pyobjson.add_phase_hook(hook)
+        try:
+            with pyobjson.instrumented(reset=True):
+                ChainClass(1).to_json_str()
+        finally:
+            pyobjson.remove_phase_hook(hook)
+
+        chain_class_key = derive_custom_object_key(ChainClass)
+        assert events == [
+            ("start", "to_json_str", chain_class_key),
+            ("start", "serialize", chain_class_key),
+            ("end", "serialize", chain_class_key),
+            ("end", "to_json_str", chain_class_key),
+        ]
+
+    def test_log_stats(self, caplog):
+        with pyobjson.instrumented(reset=True):
+            ChainClass(1).to_json_str()
+
+        with caplog.at_level(logging.INFO, logger="pyobjson.instrumentation"):
+            pyobjson.log_stats()
+
+        assert 'pyobjson phase "to_json_str": 1 calls, 0 errors' in caplog.text
+        assert f'pyobjson class "{derive_custom_object_key(ChainClass)}": serialized_objects=1' in caplog.text
@@ -0,0 +1,96 @@
+"""Pytest test for Python Object JSON Tool code.
+
+Note:
+    Tests pyobjson.offsets module.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import mmap
+from array import array
+
+from conftest import FirstClass, UnslottedClass
+from pytest import raises
+
+from pyobjson.constants import OFFSET_INDEX_FILE_SUFFIX
+
+
+class TestOffsets:
+    """Pytest class for offset index functionality."""
+
+    def test_load_list_items(self, tmp_path):
+        records = UnslottedClass("records", [UnslottedClass(f"record_{i}", [UnslottedClass("ü")]) for i in range(100)])
+
+        json_file_path = tmp_path / "records.json"
+        records.save_to_json_file(json_file_path)
+        json_file_bytes = json_file_path.read_bytes()
+
+        # confirm the JSON file saved with an offset index is identical to the JSON file saved without one
+        records.save_to_json_file(json_file_path, offset_index=True)
+        assert json_file_path.read_bytes() == json_file_bytes
+
+        unslotted_class = UnslottedClass(None)
+        assert (
+            unslotted_class.load_item(json_file_path, "slotted_class_children", 42)
+            == records.slotted_class_children[42]
+        )
+        assert unslotted_class.load_item(json_file_path, "slotted_class_param") == "records"
+
+        with raises(KeyError):
+            unslotted_class.load_item(json_file_path, "missing")
+
+        # confirm saving without an offset index removes the stale offset index file
+        records.save_to_json_file(json_file_path)
+        assert not json_file_path.with_name(json_file_path.name + OFFSET_INDEX_FILE_SUFFIX).exists()
+        with raises(FileNotFoundError):
+            unslotted_class.load_item(json_file_path, "slotted_class_children", 42)
+
+    def test_load_dictionary_items_and_typed_values(self, tmp_path, first_class_with_nested_child_classes):
+        json_file_path = tmp_path / "first_class.json"
+        first_class_with_nested_child_classes.save_to_json_file(json_file_path, offset_index=True)
+
+        first_class = FirstClass({}, [], None, None, None, None, None, None, None)
+        assert (
+            first_class.load_item(json_file_path, "second_class_dict", "second_class_1")
+            == first_class_with_nested_child_classes.second_class_dict["second_class_1"]
+        )
+        assert (
+            first_class.load_item(json_file_path, "first_class_set")
+            == first_class_with_nested_child_classes.first_class_set
+        )
+        assert (
+            first_class.load_item(json_file_path, "first_class_file")
+            == first_class_with_nested_child_classes.first_class_file
+        )
+
+        with raises(ValueError):
+            first_class_with_nested_child_classes.save_to_json_file(json_file_path, offset_index=True, schema=True)
+
+    def test_load_items_with_out_of_band_buffers(self, tmp_path, monkeypatch):
+        records = UnslottedClass(memoryview(array("d", [0.5, 1.5])), [UnslottedClass(f"record_{i}") for i in range(10)])
+        json_file_path = tmp_path / "records.json"
+        records.save_to_json_file(json_file_path, out_of_band_buffers=True, offset_index=True)
+
+        memory_maps = []
+        mmap_type = mmap.mmap
+
+        def track_mmap(*args, **kwargs):
+            memory_maps.append(mmap_type(*args, **kwargs))
+            return memory_maps[-1]
+
+        # confirm no memory maps stay open after loading items without out-of-band buffer segments
+        monkeypatch.setattr(mmap, "mmap", track_mmap)
+        unslotted_class = UnslottedClass(None)
+        assert (
+            unslotted_class.load_item(json_file_path, "slotted_class_children", 3) == records.slotted_class_children[3]
+        )
+        assert all(memory_map.closed for memory_map in memory_maps)
+
+        # confirm only the memory map of the buffer segments side file stays open while the loaded view references it
+        memory_maps.clear()
+        loaded_view = unslotted_class.load_item(json_file_path, "slotted_class_param")
+        assert loaded_view.tolist() == [0.5, 1.5]
+        assert [memory_map.size() for memory_map in memory_maps if not memory_map.closed] == [loaded_view.nbytes]
+        loaded_view.release()
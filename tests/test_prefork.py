@@ -0,0 +1,50 @@
+"""Pytest test for Python Object JSON Tool code.
+
+Note:
+    Tests pyobjson.prefork module.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import gc
+
+from conftest import FirstClass, SecondClass, SlottedClass
+
+import pyobjson
+from pyobjson.base import PythonObjectJson, get_base_subclasses
+from pyobjson.data import derive_required_class_args
+from pyobjson.utils import compile_regex
+
+
+class TestPrefork:
+    """Pytest class for pre-fork warmup functionality."""
+
+    def test_warmup(self):
+        derive_required_class_args.cache_clear()
+        compile_regex.cache_clear()
+
+        try:
+            warmed_classes = pyobjson.warmup(classes=[FirstClass, SecondClass, SlottedClass], attribute_patterns=["^a"])
+            # confirm the per-class caches were built and all tracked objects were frozen
+            assert warmed_classes == [FirstClass, SecondClass, SlottedClass]
+            assert derive_required_class_args.cache_info().currsize == 3
+            assert compile_regex.cache_info().currsize == 5
+            assert gc.get_freeze_count() > 0
+        finally:
+            gc.unfreeze()
+
+        # confirm the cached subclass dictionary includes subclasses defined after it was built
+        assert "conftest.firstclass" in get_base_subclasses(PythonObjectJson)
+
+        class WarmupClass(PythonObjectJson):
+            pass
+
+        assert (
+            get_base_subclasses(PythonObjectJson)["test_prefork.testprefork.test_warmup.<locals>.warmupclass"]
+            is WarmupClass
+        )
+
+        # confirm warming up without freezing covers all subclasses of PythonObjectJson
+        assert WarmupClass in pyobjson.warmup(freeze=False)
@@ -8,13 +8,32 @@ Note:
 __author__ = "Wren J. Rudolph for Wrencode, LLC"
 __email__ = "dev@wrencode.com"
 
+import json
 from pathlib import Path
+from typing import Any, Dict, Optional
 
+from conftest import ChainClass, CyclicClass, FirstClass, SlottedClass, UnslottedClass
 from dotenv import load_dotenv
 
+import pyobjson
+
+from pyobjson import base as pyobjson_base
+from pyobjson.base import PythonObjectJson
+from pyobjson.constants import CLONE_CACHE_MAX_SIZE
+from pyobjson.data import _derive_clone_attributes
+
 load_dotenv(Path(__file__).parent.parent / ".env")
 
 
+class CachedClass(PythonObjectJson):
+    """CachedClass for testing."""
+
+    def __init__(self, cached_class_param: str, cached_class_cache: Optional[Dict[str, Any]] = None):
+        super().__init__(extra_attributes=["cached_class_cache"])
+        self.cached_class_param: str = cached_class_param
+        self.cached_class_cache: Optional[Dict[str, Any]] = cached_class_cache
+
+
 class TestPythonObjectJson:
     """Pytest class for PythonObjectJson functionality."""
 
@@ -36,3 +55,269 @@ class TestPythonObjectJson:
 
         # confirm newly created FirstClass instance loaded from JSON is equivalent to conftest.FirstClass instance
         assert first_class_instance == first_class_with_nested_child_classes
+
+    def test_shared_reference_serialization(self, first_class_with_nested_child_classes, first_class_json_str):
+        # confirm the shared conftest.SecondClass third class list is serialized once and referenced by ID afterward
+        first_class_json_str_with_references = first_class_with_nested_child_classes.to_json_str(track_references=True)
+        assert len(first_class_json_str_with_references) < len(first_class_json_str)
+        assert '"$ref": 1' in first_class_json_str_with_references
+
+        # confirm the shared reference is restored as the same list object during deserialization
+        first_class_instance = FirstClass({}, [], None, None, None, None, None, None, None)
+        first_class_instance.from_json_str(first_class_json_str_with_references)
+        assert first_class_instance == first_class_with_nested_child_classes
+        second_class = first_class_instance.second_class_list[0]
+        assert second_class.third_class_list is second_class.third_class_list_dict["third_class_list_1"]
+
+        # confirm user dictionaries shaped like reference markers are escaped and restored unchanged in every mode
+        marker_dicts = [{"$ref": 1}, {"$id": 5, "$list": [1]}, {"$id": 5, "$dict": {"a": 1}}, {"$escape": {"$ref": 2}}]
+        for track_references in (False, True):
+            marker_class = UnslottedClass(
+                marker_dicts[0], [UnslottedClass(marker_dict) for marker_dict in marker_dicts]
+            )
+            marker_class_instance = UnslottedClass(None)
+            marker_class_instance.from_json_str(marker_class.to_json_str(track_references=track_references))
+            assert marker_class_instance.slotted_class_param == {"$ref": 1}
+            assert [child.slotted_class_param for child in marker_class_instance.slotted_class_children] == marker_dicts
+
+    def test_columnar_serialization(self):
+        # confirm homogeneous lists of custom class instances are serialized once per class as attribute columns
+        records = UnslottedClass("records", [UnslottedClass(f"record_{i}") for i in range(100)])
+        records_json_str = records.to_json_str(columnar=True)
+        assert '"$columns": "conftest.unslottedclass"' in records_json_str
+        assert len(records_json_str) < len(records.to_json_str()) / 2
+
+        records_instance = UnslottedClass("")
+        records_instance.from_json_str(records_json_str)
+        assert records_instance == records
+
+        # confirm numeric columns are packed and restored with their original values and types
+        records = UnslottedClass("records", [ChainClass(i * 2**40) for i in range(-50, 50)])
+        records_json_str = records.to_json_str(columnar=True, pack_numeric_columns=True)
+        assert "packed::::q::::chain_class_param" in records_json_str
+        assert len(records_json_str) < len(records.to_json_str(columnar=True)) < len(records.to_json_str())
+
+        records_instance = UnslottedClass("")
+        records_instance.from_json_str(records_json_str)
+        assert records_instance == records
+
+        # confirm dictionaries shaped like attribute columns are restored unchanged, with or without columnar
+        columns_dict = {"$columns": "x", "$length": 1, "$data": {}}
+        records = UnslottedClass(columns_dict, [UnslottedClass(dict(columns_dict)) for _ in range(3)])
+        for columnar in (False, True):
+            records_instance = UnslottedClass("")
+            records_instance.from_json_str(records.to_json_str(columnar=columnar))
+            assert records_instance == records
+
+    def test_schema_serialization(self, first_class_with_nested_child_classes, first_class_json_str, external_function):
+        # confirm attributes matching the __init__ type annotations of their classes are serialized with plain names
+        first_class_json_str_with_schema = first_class_with_nested_child_classes.to_json_str(schema=True)
+        assert '"$schema": 1' in first_class_json_str_with_schema
+        assert '"first_class_set"' in first_class_json_str_with_schema
+        assert "collection::::set::::first_class_set" not in first_class_json_str_with_schema
+        assert len(first_class_json_str_with_schema) < len(first_class_json_str)
+
+        first_class_instance = FirstClass({}, [], None, None, None, None, None, None, None)
+        first_class_instance.from_json_str(first_class_json_str_with_schema)
+        assert first_class_instance == first_class_with_nested_child_classes
+
+        # confirm attribute values that do not match their annotations are still restored with their own types
+        first_class_mismatched = FirstClass({}, [], "attribute", external_function, ["set"], None, None, "conftest")
+        first_class_json_str_with_schema = first_class_mismatched.to_json_str(schema=True)
+        assert "collection::::list::::first_class_set" in first_class_json_str_with_schema
+        assert "value::::first_class_file" in first_class_json_str_with_schema
+
+        first_class_instance.from_json_str(first_class_json_str_with_schema)
+        assert first_class_instance == first_class_mismatched
+
+    def test_concurrent_deserialization(self, first_class_with_nested_child_classes, first_class_json_str):
+        # confirm a single parsed payload can be shared by multiple threads and is never modified
+        serializable_dict = json.loads(first_class_json_str)
+        first_class_instances = FirstClass({}, [], None, None, None, None, None, None, None).deserialize_many(
+            [serializable_dict] * 32, max_workers=8
+        )
+        assert serializable_dict == json.loads(first_class_json_str)
+        assert all(instance == first_class_with_nested_child_classes for instance in first_class_instances)
+        assert len({id(instance) for instance in first_class_instances}) == 32
+
+        # confirm excluded and extra attributes do not share state with each other or with the provided arguments
+        excluded_attributes = ["first_class_file"]
+        pyobjson_instance = PythonObjectJson(excluded_attributes=excluded_attributes)
+        pyobjson_instance.extra_attributes.append("first_class_set")
+        assert "first_class_set" not in pyobjson_instance.excluded_attributes
+        assert excluded_attributes == ["first_class_file"]
+
+        # confirm extra attributes are excluded from serialization and re-applied from the target instance
+        cached_class = CachedClass("serialized", {"cached": True})
+        assert "cached_class_cache" not in cached_class.to_json_str()
+        cached_class_instance = CachedClass("", {"target": True})
+        cached_class_instance.from_json_str(cached_class.to_json_str())
+        assert cached_class_instance.cached_class_param == "serialized"
+        assert cached_class_instance.cached_class_cache == {"target": True}
+
+    def test_clone(self, first_class_with_nested_child_classes):
+        first_class_clone = first_class_with_nested_child_classes.clone()
+        assert first_class_clone == first_class_with_nested_child_classes
+        # confirm the cloned attribute names are cached per class and set of attributes within a bound
+        assert 0 < _derive_clone_attributes.cache_info().currsize <= CLONE_CACHE_MAX_SIZE
+        assert _derive_clone_attributes.cache_info().maxsize == CLONE_CACHE_MAX_SIZE
+
+        # confirm mutable values are copied while immutable values are shared
+        assert first_class_clone.second_class_list is not first_class_with_nested_child_classes.second_class_list
+        assert first_class_clone.second_class_list[0] is not first_class_with_nested_child_classes.second_class_list[0]
+        assert first_class_clone.first_class_set is not first_class_with_nested_child_classes.first_class_set
+        assert first_class_clone.first_class_tuple is first_class_with_nested_child_classes.first_class_tuple
+        assert first_class_clone.excluded_attributes is not first_class_with_nested_child_classes.excluded_attributes
+
+        # confirm shared references and cycles stay shared within the clone
+        second_class_clone = first_class_clone.second_class_list[0]
+        assert second_class_clone.third_class_list is second_class_clone.third_class_list_dict["third_class_list_1"]
+        cyclic_class_root = CyclicClass("root")
+        CyclicClass("child", cyclic_class_root)
+        cyclic_class_clone = cyclic_class_root.clone()
+        assert cyclic_class_clone.cyclic_class_children[0].cyclic_class_parent is cyclic_class_clone
+
+        # confirm excluded attributes are shared instead of copied
+        slotted_class = SlottedClass("parent", [SlottedClass("child")])
+        slotted_class.excluded_attributes.append("slotted_class_children")
+        slotted_class_clone = slotted_class.clone()
+        assert slotted_class_clone == slotted_class
+        assert slotted_class_clone.slotted_class_children is slotted_class.slotted_class_children
+
+    def test_fingerprint(self, tmp_path, monkeypatch):
+        # confirm equal data has the same fingerprint regardless of set iteration order
+        first_unslotted_class = UnslottedClass("parent", [UnslottedClass("child")])
+        first_unslotted_class.unslotted_class_set = {f"item_{i}" for i in range(20)}
+        second_unslotted_class = UnslottedClass("parent", [UnslottedClass("child")])
+        second_unslotted_class.unslotted_class_set = set(
+            sorted(first_unslotted_class.unslotted_class_set, reverse=True)
+        )
+        assert first_unslotted_class.fingerprint() == second_unslotted_class.fingerprint()
+        second_unslotted_class.slotted_class_children[0].slotted_class_param = "changed"
+        assert first_unslotted_class.fingerprint() != second_unslotted_class.fingerprint()
+
+        # confirm saving unchanged data to the same JSON file is skipped unless the data or the file changed
+        json_file_path = tmp_path / "unslotted_class.json"
+        assert first_unslotted_class.save_to_json_file(json_file_path)
+        assert not first_unslotted_class.save_to_json_file(json_file_path)
+        assert first_unslotted_class.save_to_json_file(json_file_path, offset_index=True)
+        assert not first_unslotted_class.save_to_json_file(json_file_path, offset_index=True)
+        assert first_unslotted_class.save_to_json_file(json_file_path, skip_unchanged=False)
+        json_file_path.write_text("{}")
+        assert first_unslotted_class.save_to_json_file(json_file_path)
+        assert second_unslotted_class.save_to_json_file(json_file_path)
+
+        loaded_unslotted_class = UnslottedClass("")
+        loaded_unslotted_class.load_from_json_file(json_file_path)
+        assert loaded_unslotted_class == second_unslotted_class
+
+        # confirm the fingerprints of saved JSON files are bounded, evicting the least recently saved files first
+        monkeypatch.setattr(pyobjson_base, "SAVED_FINGERPRINTS_MAX_SIZE", 3)
+        for i in range(5):
+            assert second_unslotted_class.save_to_json_file(tmp_path / f"unslotted_class_{i}.json")
+        assert len(pyobjson_base._saved_json_files.entries) == 3
+        assert second_unslotted_class.save_to_json_file(tmp_path / "unslotted_class_0.json")
+        assert not second_unslotted_class.save_to_json_file(tmp_path / "unslotted_class_4.json")
+
+        # confirm dictionaries with non-string (and mixed) keys are fingerprinted by their JSON object keys
+        int_keyed_unslotted_class = UnslottedClass("int_keyed")
+        int_keyed_unslotted_class.unslotted_class_dict = {1: (1, 2), "k": 5, 10: {2: "a"}}
+        reordered_unslotted_class = UnslottedClass("int_keyed")
+        reordered_unslotted_class.unslotted_class_dict = {10: {2: "a"}, "k": 5, 1: (1, 2)}
+        assert int_keyed_unslotted_class.fingerprint() == reordered_unslotted_class.fingerprint()
+        reordered_unslotted_class.unslotted_class_dict[10][2] = "b"
+        assert int_keyed_unslotted_class.fingerprint() != reordered_unslotted_class.fingerprint()
+
+        int_keyed_json_file_path = tmp_path / "int_keyed_unslotted_class.json"
+        assert int_keyed_unslotted_class.save_to_json_file(int_keyed_json_file_path)
+        assert not int_keyed_unslotted_class.save_to_json_file(int_keyed_json_file_path)
+        assert reordered_unslotted_class.save_to_json_file(int_keyed_json_file_path)
+
+    def test_projected_serialization(self):
+        unslotted_class = UnslottedClass(
+            "root", [UnslottedClass("child_1", [UnslottedClass("grandchild")]), UnslottedClass("child_2")]
+        )
+        unslotted_class_key = "conftest.unslottedclass"
+        children_key = "collection::::list::::slotted_class_children"
+
+        # confirm only the selected attributes are serialized and unselected nested instances are never visited
+        with pyobjson.instrumented(reset=True):
+            assert unslotted_class.serialize(only=["slotted_class_param"]) == {
+                unslotted_class_key: {"slotted_class_param": "root"}
+            }
+        assert pyobjson.stats()["classes"][unslotted_class_key]["serialized_objects"] == 1
+
+        # confirm dotted attribute paths select attributes of nested instances through lists
+        assert unslotted_class.serialize(only=["slotted_class_children.slotted_class_param"]) == {
+            unslotted_class_key: {
+                children_key: [
+                    {unslotted_class_key: {"slotted_class_param": "child_1"}},
+                    {unslotted_class_key: {"slotted_class_param": "child_2"}},
+                ]
+            }
+        }
+
+        # confirm dotted attribute paths exclude attributes of nested instances
+        projected = unslotted_class.serialize(exclude=["slotted_class_children.slotted_class_children"])
+        assert projected[unslotted_class_key][children_key][0] == {
+            unslotted_class_key: {"slotted_class_param": "child_1"}
+        }
+
+        # confirm custom class instances nested deeper than the maximum depth are serialized as None
+        chain_class_json = json.loads(ChainClass(1, ChainClass(2, ChainClass(3))).to_json_str(max_depth=1))
+        assert chain_class_json["conftest.chainclass"]["chain_class_next"]["conftest.chainclass"] == {
+            "chain_class_param": 2,
+            "chain_class_next": None,
+        }
+
+    def test_cyclic_reference_serialization(self):
+        cyclic_class_root = CyclicClass("root")
+        CyclicClass("child_1", cyclic_class_root)
+        CyclicClass("child_2", cyclic_class_root)
+
+        # confirm cyclic parent/child references round-trip through JSON with the same object structure
+        cyclic_class_instance = CyclicClass("")
+        cyclic_class_instance.from_json_str(json.dumps(cyclic_class_root.serialize(track_references=True)))
+        assert [child.cyclic_class_param for child in cyclic_class_instance.cyclic_class_children] == [
+            "child_1",
+            "child_2",
+        ]
+        for cyclic_class_child in cyclic_class_instance.cyclic_class_children:
+            assert cyclic_class_child.cyclic_class_parent is cyclic_class_instance
+
+    def test_slotted_class_serialization(self):
+        slotted_class = SlottedClass("parent", [SlottedClass("child_1"), SlottedClass("child_2")])
+        unslotted_class = UnslottedClass("parent", [UnslottedClass("child_1"), UnslottedClass("child_2")])
+        assert not hasattr(slotted_class, "__dict__")
+
+        # confirm slotted classes serialize to the same JSON as equivalent classes with a __dict__
+        assert slotted_class.to_json_str() == unslotted_class.to_json_str().replace("unslottedclass", "slottedclass")
+
+        slotted_class_instance = SlottedClass("")
+        slotted_class_instance.from_json_str(slotted_class.to_json_str())
+        assert slotted_class_instance == slotted_class
+        assert [child.slotted_class_param for child in slotted_class_instance.slotted_class_children] == [
+            "child_1",
+            "child_2",
+        ]
+        assert slotted_class_instance.slotted_class_children[0].excluded_attributes == slotted_class.excluded_attributes
+
+    def test_deep_chain_serialization(self):
+        # create a chain of custom class instances nested far deeper than the Python recursion limit
+        chain_class_head = None
+        for i in range(100_000):
+            chain_class_head = ChainClass(i, chain_class_head)
+
+        chain_class_instance = ChainClass(-1)
+        chain_class_instance.deserialize(chain_class_head.serialize())
+
+        # confirm the deserialized chain matches the original chain without recursively comparing instances
+        chain_class_node, loaded_chain_class_node = chain_class_head, chain_class_instance
+        while chain_class_node:
+            assert type(loaded_chain_class_node) is ChainClass
+            assert loaded_chain_class_node.chain_class_param == chain_class_node.chain_class_param
+            chain_class_node, loaded_chain_class_node = (
+                chain_class_node.chain_class_next,
+                loaded_chain_class_node.chain_class_next,
+            )
+        assert loaded_chain_class_node is None
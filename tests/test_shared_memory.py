@@ -0,0 +1,79 @@
+"""Pytest test for Python Object JSON Tool code.
+
+Note:
+    Tests pyobjson.shared_memory module.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import gc
+import weakref
+from array import array
+from multiprocessing import get_context
+from typing import Any
+
+from conftest import UnslottedClass
+from pytest import raises
+
+import pyobjson
+from pyobjson.base import PythonObjectJson
+
+
+class SharedMemoryClass(PythonObjectJson):
+    """SharedMemoryClass for testing."""
+
+    def __init__(self, shared_memory_class_param: str, shared_memory_class_view: Any = None):
+        super().__init__()
+        self.shared_memory_class_param: str = shared_memory_class_param
+        self.shared_memory_class_view: Any = shared_memory_class_view
+
+
+def load_in_process(segment_name: str) -> str:
+    """Function loading a shared memory segment in another process for testing."""
+    unslotted_class = UnslottedClass("")
+    unslotted_class.load_from_shared_memory(segment_name)
+    return unslotted_class.to_json_str()
+
+
+class TestSharedMemory:
+    """Pytest class for shared memory transfer functionality."""
+
+    def test_transfer_between_processes(self):
+        unslotted_class = UnslottedClass("parent", [UnslottedClass("child_1"), UnslottedClass("child_2")])
+        segment_name = unslotted_class.to_shared_memory()
+
+        # confirm the segment is loaded in another process from its name alone
+        with get_context("spawn").Pool(1) as pool:
+            assert pool.apply(load_in_process, (segment_name,)) == unslotted_class.to_json_str()
+
+        # confirm the segment was freed after it was loaded
+        with raises(FileNotFoundError):
+            UnslottedClass("").load_from_shared_memory(segment_name)
+
+    def test_buffer_views_and_release(self):
+        shared_memory_class = SharedMemoryClass("buffers", memoryview(array("d", [0.5, 1.5, 2.5])))
+        segment_name = shared_memory_class.to_shared_memory(track_references=True)
+
+        # confirm buffer-protocol values are loaded as views of the shared memory that keep it mapped without
+        # registering the segment, and that the memory is unmapped once the loaded views are garbage collected
+        shared_memory_class_instance = SharedMemoryClass("")
+        shared_memory_class_instance.load_from_shared_memory(segment_name)
+        gc.collect()
+        assert shared_memory_class_instance.shared_memory_class_view.tolist() == [0.5, 1.5, 2.5]
+        assert shared_memory_class_instance.shared_memory_class_view.readonly
+        assert not pyobjson.release_shared_memory(segment_name)
+
+        buffers_array = weakref.ref(shared_memory_class_instance.shared_memory_class_view.obj)
+        segment = weakref.ref(buffers_array().segment)
+        del shared_memory_class_instance
+        gc.collect()
+        assert buffers_array() is None
+        assert segment() is None
+
+        # confirm segments that are never loaded can be discarded
+        segment_name = SharedMemoryClass("discarded").to_shared_memory()
+        pyobjson.discard_shared_memory(segment_name)
+        with raises(FileNotFoundError):
+            SharedMemoryClass("").load_from_shared_memory(segment_name)
@@ -0,0 +1,111 @@
+"""Pytest test for Python Object JSON Tool code.
+
+Note:
+    Tests pyobjson.snapshot module.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import json
+
+from conftest import UnslottedClass
+from pytest import raises
+
+from pyobjson.constants import SNAPSHOT_MANIFEST_FILE_NAME, SNAPSHOT_SHARDS_DIRECTORY_NAME
+from pyobjson.snapshot import join_shards, split_into_shards
+
+
+class TestSnapshot:
+    """Pytest class for sharded snapshot functionality."""
+
+    def test_split_and_join_shards(self):
+        serializable_data = {"records": [{"id": i, "values": list(range(i % 7))} for i in range(200)], "name": "data"}
+        serializable_data_json_str = json.dumps(serializable_data)
+
+        # confirm deeply nested data and dictionaries with non-string keys are split
+        nested_data = {1: {"leaf": "x" * 100}}
+        for _ in range(200):
+            nested_data = {1: nested_data, "pad": "y" * 10}
+        shards = split_into_shards(nested_data, 500)
+        shard_values = [json.loads(shard_json) for shard_json, _ in shards]
+        assert join_shards(shard_values, [flag for _, flag in shards]) == json.loads(json.dumps(nested_data))
+
+        shards = split_into_shards(serializable_data, 500)
+        assert len(shards) > 10
+        assert all(len(shard_json) <= 500 for shard_json, _ in shards)
+        # confirm the serializable data is not modified
+        assert json.dumps(serializable_data) == serializable_data_json_str
+
+        shard_values = [json.loads(shard_json) for shard_json, _ in shards]
+        assert join_shards(shard_values, [shard_has_shards for _, shard_has_shards in shards]) == serializable_data
+
+    def test_split_and_join_marker_shaped_dictionaries(self, tmp_path):
+        # confirm dictionaries of user data shaped like split values are restored unchanged
+        serializable_data = {
+            "split": {"$shards": [0]},
+            "escaped": {"$escape": {"$shards": [1]}},
+            "nested": {"$shards": [{"value": "x" * 100} for _ in range(20)]},
+            "records": [{"id": i} for i in range(100)],
+        }
+        shards = split_into_shards(serializable_data, 512)
+        assert len(shards) > 2
+        shard_values = [json.loads(shard_json) for shard_json, _ in shards]
+        assert join_shards(shard_values, [flag for _, flag in shards]) == serializable_data
+
+        records = UnslottedClass({"$shards": [0]}, [UnslottedClass(f"record_{i}") for i in range(100)])
+        records.save_to_snapshot(tmp_path / "snapshot", shard_size=512)
+        records_instance = UnslottedClass(None)
+        records_instance.load_from_snapshot(tmp_path / "snapshot")
+        assert records_instance == records
+
+        # confirm shard indices that loop back to shards already being joined are rejected
+        with raises(ValueError):
+            join_shards([{"split": {"$shards": [1]}}, {"loop": {"$shards": [1]}}], [True, True])
+        with raises(ValueError):
+            join_shards([{"split": {"$shards": [0]}}], [True])
+        with raises(ValueError):
+            join_shards([{"split": {"$shards": [2]}}, [1]], [True, False])
+
+    def test_save_and_load_snapshot(self, tmp_path):
+        records = UnslottedClass("records", [UnslottedClass(f"record_{i}") for i in range(1000)])
+        snapshot_directory = tmp_path / "snapshot"
+        records.save_to_snapshot(snapshot_directory, shard_size=4096, max_workers=4)
+
+        shard_file_paths = list((snapshot_directory / SNAPSHOT_SHARDS_DIRECTORY_NAME).glob("*.json"))
+        manifest = json.loads((snapshot_directory / SNAPSHOT_MANIFEST_FILE_NAME).read_text())
+        assert len(shard_file_paths) == len(manifest["shards"]) > 10
+
+        records_instance = UnslottedClass(None)
+        records_instance.load_from_snapshot(snapshot_directory, max_workers=4)
+        assert records_instance == records
+
+        # confirm shard files can be decoded in multiple processes
+        records_instance = UnslottedClass(None)
+        records_instance.load_from_snapshot(snapshot_directory, max_workers=2, use_processes=True)
+        assert records_instance == records
+
+        # confirm saving again keeps the shard files of the replaced manifest for concurrent loads, and only removes
+        # them once they are stale for two saves
+        records.slotted_class_children = records.slotted_class_children[:10]
+        records.save_to_snapshot(snapshot_directory, shard_size=4096)
+        shards_directory = snapshot_directory / SNAPSHOT_SHARDS_DIRECTORY_NAME
+        assert set(shards_directory.glob("*.json")) >= set(shard_file_paths)
+        records.save_to_snapshot(snapshot_directory, shard_size=4096)
+        assert len(list(shards_directory.glob("*.json"))) == 1
+
+        records_instance = UnslottedClass(None)
+        records_instance.load_from_snapshot(snapshot_directory)
+        assert records_instance == records
+
+    def test_load_corrupted_snapshot(self, tmp_path):
+        records = UnslottedClass("records", [UnslottedClass(f"record_{i}") for i in range(100)])
+        snapshot_directory = tmp_path / "snapshot"
+        records.save_to_snapshot(snapshot_directory, shard_size=1024)
+
+        shard_file_path = next((snapshot_directory / SNAPSHOT_SHARDS_DIRECTORY_NAME).glob("*.json"))
+        shard_file_path.write_bytes(shard_file_path.read_bytes() + b" ")
+
+        with raises(ValueError):
+            UnslottedClass(None).load_from_snapshot(snapshot_directory)
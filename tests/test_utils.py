@@ -0,0 +1,65 @@
+"""Pytest test for Python Object JSON Tool code.
+
+Note:
+    Tests pyobjson.utils module.
+
+"""
+
+__author__ = "Wren J. Rudolph for Wrencode, LLC"
+__email__ = "dev@wrencode.com"
+
+import importlib
+import sys
+
+from conftest import ext_func
+from pytest import raises
+
+from pyobjson.constants import DELIMITER as DLIM
+from pyobjson.utils import (
+    clear_callable_caches,
+    derive_custom_callable_value,
+    resolve_custom_callable,
+    set_allowed_callable_modules,
+)
+
+
+class TestCallableCache:
+    """Pytest class for the function-typed attribute resolution and encoding caches."""
+
+    def test_encode_and_resolve(self):
+        clear_callable_caches()
+
+        assert derive_custom_callable_value(ext_func) == f"conftest.ext_func{DLIM}param_1:str,param_2:str"
+        assert derive_custom_callable_value(ext_func) == f"conftest.ext_func{DLIM}param_1:str,param_2:str"
+        assert resolve_custom_callable("conftest.ext_func") is ext_func
+        assert resolve_custom_callable("conftest.ext_func") is ext_func
+
+    def test_resolve_after_module_reload(self, tmp_path, monkeypatch):
+        module_path = tmp_path / "callable_cache_module.py"
+        module_path.write_text("def callback():\n    return 1\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        try:
+            first_callback = resolve_custom_callable("callable_cache_module.callback")
+            assert first_callback() == 1
+
+            module_path.write_text("def callback():\n    return 2  # reloaded\n")
+            importlib.invalidate_caches()
+            importlib.reload(sys.modules["callable_cache_module"])
+
+            reloaded_callback = resolve_custom_callable("callable_cache_module.callback")
+            assert reloaded_callback is not first_callback
+            assert reloaded_callback() == 2
+        finally:
+            sys.modules.pop("callable_cache_module", None)
+
+    def test_allowed_callable_modules(self):
+        set_allowed_callable_modules(["json"])
+        try:
+            assert resolve_custom_callable("json.decoder.scanstring")
+            with raises(ValueError):
+                resolve_custom_callable("conftest.ext_func")
+        finally:
+            set_allowed_callable_modules(None)
+
+        assert resolve_custom_callable("conftest.ext_func") is ext_func